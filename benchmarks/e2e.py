@@ -0,0 +1,505 @@
+"""End-to-end load test: every backend as a subprocess against local upstream stand-ins.
+
+Boots Users (SQLite unless --database-url), Weather, Dress Advice and the gateway,
+with Open-Meteo and OpenAI replaced by `benchmarks.upstreams` stubs and Redis by an
+in-process fakeredis TCP server (or --redis-url). Registers users with cities, then
+drives a weighted mix of REST v2 and gateway gRPC calls for --duration seconds and
+reports RPS, p50/p95/p99 per scenario and upstream calls per 1000 requests.
+
+Run from project root:
+    python -m benchmarks.e2e --duration 30 --concurrency 64
+    python -m benchmarks.e2e --save-baseline        # .benchmarks/e2e-baseline.json
+    python -m benchmarks.e2e --compare              # exit 1 on a regression
+    python -m benchmarks.e2e --env DRESS_ADVICE_ADVICE_PROVIDER=openai --openai-latency 0.8
+"""
+
+import argparse
+import asyncio
+import contextlib
+import json
+import os
+import random
+import shutil
+import socket
+import sys
+import tempfile
+import threading
+import time
+from collections import defaultdict
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+if str(ROOT / "proto_gen") not in sys.path:
+    sys.path.insert(0, str(ROOT / "proto_gen"))
+
+import gateway_pb2
+import gateway_pb2_grpc
+import httpx
+from grpc import aio
+
+from benchmarks.upstreams import Latency, open_meteo_app, openai_app, serve
+
+# Single source of request randomness; seeded from --seed so a traffic mix is repeatable
+_rng = random.Random()  # nosec B311 - load shape, not security
+_JWT_SECRET = "bench-secret-at-least-32-bytes-long-for-hmac"  # nosec B105 - benchmark only
+_PASSWORD = "bench-password"  # nosec B105 - benchmark only
+DEFAULT_BASELINE = ROOT / ".benchmarks" / "e2e-baseline.json"
+DEFAULT_MIX = (
+    "rest_forecast=40,rest_dress_advice=25,grpc_forecast=15,"
+    "grpc_dress_advice=10,grpc_stream_advice=5,rest_cities=5"
+)
+CITIES = [
+    ("Moscow", 55.75, 37.62),
+    ("London", 51.51, -0.13),
+    ("Paris", 48.86, 2.35),
+    ("Berlin", 52.52, 13.40),
+    ("Madrid", 40.42, -3.70),
+    ("Rome", 41.90, 12.50),
+    ("Oslo", 59.91, 10.75),
+    ("Cairo", 30.04, 31.24),
+    ("Tokyo", 35.68, 139.69),
+    ("Sydney", -33.87, 151.21),
+    ("Toronto", 43.65, -79.38),
+    ("Lima", -12.05, -77.04),
+    ("Nairobi", -1.29, 36.82),
+    ("Delhi", 28.61, 77.21),
+    ("Reykjavik", 64.15, -21.94),
+    ("Anchorage", 61.22, -149.90),
+]
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def _percentile(samples: list[float], q: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))] if ordered else 0.0
+
+
+@dataclass
+class User:
+    user_id: int
+    token: str
+    cities: list[str]
+
+
+@dataclass
+class Stack:
+    """Ports and processes of one booted environment."""
+
+    workdir: Path
+    gateway_http: str = ""
+    gateway_grpc: str = ""
+    open_meteo: str = ""
+    openai: str = ""
+    processes: dict[str, asyncio.subprocess.Process] = field(default_factory=dict)
+
+
+class Services:
+    """Async context manager: upstream stubs, Redis and the four services; torn down on exit."""
+
+    def __init__(self, args: argparse.Namespace):
+        self._args = args
+        self.stack = Stack(Path(tempfile.mkdtemp(prefix="dresscast-e2e-")))
+        self._stubs = []
+        self._redis = None
+
+    async def __aenter__(self) -> Stack:
+        try:
+            await self._start()
+        except BaseException:
+            await self.__aexit__(None, None, None)
+            raise
+        return self.stack
+
+    async def _start(self) -> None:
+        args, stack = self._args, self.stack
+        meteo_port, openai_port = _free_port(), _free_port()
+        self._stubs = [
+            await serve(open_meteo_app(Latency(args.open_meteo_latency, args.jitter)), meteo_port),
+            await serve(openai_app(Latency(args.openai_latency, args.jitter)), openai_port),
+        ]
+        stack.open_meteo = f"http://127.0.0.1:{meteo_port}"
+        stack.openai = f"http://127.0.0.1:{openai_port}"
+        redis_url = args.redis_url or self._start_fake_redis()
+        database_url = args.database_url or f"sqlite+aiosqlite:///{stack.workdir / 'users.db'}"
+
+        ports = {name: _free_port() for name in ("users", "weather", "dress", "http", "grpc")}
+        users_addr = f"127.0.0.1:{ports['users']}"
+        weather_addr = f"127.0.0.1:{ports['weather']}"
+        dress_addr = f"127.0.0.1:{ports['dress']}"
+        env = {
+            "LOG_FORMAT": "text",
+            "USERS_DATABASE_URL": database_url,
+            "USERS_GRPC_HOST": "127.0.0.1",
+            "USERS_GRPC_PORT": str(ports["users"]),
+            "BCRYPT_ROUNDS": "4",
+            "USERS_LOG_LEVEL": args.log_level,
+            "WEATHER_REDIS_URL": redis_url,
+            "WEATHER_GRPC_HOST": "127.0.0.1",
+            "WEATHER_GRPC_PORT": str(ports["weather"]),
+            "WEATHER_OPEN_METEO_URL": f"{stack.open_meteo}/v1/forecast",
+            "WEATHER_LOG_LEVEL": args.log_level,
+            "DRESS_ADVICE_REDIS_URL": redis_url,
+            "DRESS_ADVICE_GRPC_HOST": "127.0.0.1",
+            "DRESS_ADVICE_GRPC_PORT": str(ports["dress"]),
+            "DRESS_ADVICE_LOG_LEVEL": args.log_level,
+            "OPENAI_API_KEY": "bench",
+            "OPENAI_BASE_URL": f"{stack.openai}/v1",
+            "GATEWAY_USERS_GRPC_ADDR": users_addr,
+            "GATEWAY_WEATHER_GRPC_ADDR": weather_addr,
+            "GATEWAY_DRESS_ADVICE_GRPC_ADDR": dress_addr,
+            "GATEWAY_HTTP_HOST": "127.0.0.1",
+            "GATEWAY_HTTP_PORT": str(ports["http"]),
+            "GATEWAY_GRPC_HOST": "127.0.0.1",
+            "GATEWAY_GRPC_PORT": str(ports["grpc"]),
+            "GATEWAY_JWT_SECRET": _JWT_SECRET,
+            "GATEWAY_LOG_LEVEL": args.log_level,
+        }
+        env.update(kv.split("=", 1) for kv in args.env)
+
+        await self._spawn("users", "users.main", env)
+        await self._spawn("weather", "weather.main", env)
+        await self._spawn("dress_advice", "dress_advice.main", env)
+        for name, addr in (("users", users_addr), ("weather", weather_addr), ("dress", dress_addr)):
+            await self._wait_grpc(name, addr)
+        await self._spawn("gateway", "gateway.main", env)
+        stack.gateway_http = f"http://127.0.0.1:{ports['http']}"
+        stack.gateway_grpc = f"127.0.0.1:{ports['grpc']}"
+        await self._wait_http("gateway", f"{stack.gateway_http}/health")
+
+    def _start_fake_redis(self) -> str:
+        from fakeredis import TcpFakeServer
+
+        port = _free_port()
+        self._redis = TcpFakeServer(("127.0.0.1", port), server_type="redis")
+        threading.Thread(target=self._redis.serve_forever, daemon=True).start()
+        return f"redis://127.0.0.1:{port}/0"
+
+    async def _spawn(self, name: str, module: str, env: dict[str, str]) -> None:
+        log = open(self.stack.workdir / f"{name}.log", "wb")  # noqa: SIM115 - lives with the process
+        self.stack.processes[name] = await asyncio.create_subprocess_exec(
+            sys.executable,
+            "-m",
+            module,
+            cwd=ROOT,
+            env={**os.environ, **env},
+            stdout=log,
+            stderr=asyncio.subprocess.STDOUT,
+        )
+
+    def _check_alive(self, name: str) -> None:
+        proc = self.stack.processes.get(name)
+        if proc is not None and proc.returncode is not None:
+            tail = (self.stack.workdir / f"{name}.log").read_text(errors="replace")[-2000:]
+            raise RuntimeError(f"{name} exited with {proc.returncode}:\n{tail}")
+
+    async def _wait_grpc(self, name: str, addr: str) -> None:
+        deadline = time.monotonic() + self._args.startup_timeout
+        async with aio.insecure_channel(addr) as channel:
+            while True:
+                self._check_alive("dress_advice" if name == "dress" else name)
+                with contextlib.suppress(asyncio.TimeoutError):
+                    await asyncio.wait_for(channel.channel_ready(), 0.5)
+                    return
+                if time.monotonic() > deadline:
+                    raise TimeoutError(f"{name} not ready on {addr}")
+
+    async def _wait_http(self, name: str, url: str) -> None:
+        deadline = time.monotonic() + self._args.startup_timeout
+        async with httpx.AsyncClient() as client:
+            while True:
+                self._check_alive(name)
+                with contextlib.suppress(httpx.TransportError):
+                    if (await client.get(url)).status_code == 200:
+                        return
+                if time.monotonic() > deadline:
+                    raise TimeoutError(f"{name} not ready on {url}")
+                await asyncio.sleep(0.2)
+
+    async def upstream_calls(self) -> dict[str, int]:
+        calls: dict[str, int] = {}
+        for prefix, stub in (("open_meteo", self._stubs[0]), ("openai", self._stubs[1])):
+            for kind, count in stub.config.app.state.calls.items():
+                calls[f"{prefix}.{kind}"] = count
+        return calls
+
+    async def __aexit__(self, *exc) -> None:
+        for proc in self.stack.processes.values():
+            if proc.returncode is None:
+                proc.terminate()
+        for proc in self.stack.processes.values():
+            try:
+                await asyncio.wait_for(proc.wait(), 10)
+            except asyncio.TimeoutError:
+                proc.kill()
+                await proc.wait()
+        for stub in self._stubs:
+            stub.should_exit = True
+            await stub.config.app.state.serving
+        if self._redis is not None:
+            self._redis.shutdown()
+            self._redis.server_close()
+        if self._args.keep_logs:
+            print(f"service logs kept in {self.stack.workdir}")
+        else:
+            shutil.rmtree(self.stack.workdir, ignore_errors=True)
+
+
+async def _create_users(http: httpx.AsyncClient, count: int, cities_per_user: int) -> list[User]:
+    users = []
+    run_id = time.time_ns()  # unique across runs against a persistent --database-url
+    for i in range(count):
+        r = await http.post(
+            "/api/v1/auth/register",
+            json={"username": f"bench{run_id}_{i}", "password": _PASSWORD},
+        )
+        r.raise_for_status()
+        body = r.json()
+        user = User(body["user_id"], body["access_token"], [])
+        headers = {"Authorization": f"Bearer {user.token}"}
+        for name, lat, lon in _rng.sample(CITIES, min(cities_per_user, len(CITIES))):
+            r = await http.post(
+                "/api/v2/cities", json={"name": name, "lat": lat, "lon": lon}, headers=headers
+            )
+            r.raise_for_status()
+            user.cities.append(name)
+        users.append(user)
+    return users
+
+
+Scenario = Callable[[User], Awaitable[None]]
+
+
+def _scenarios(http: httpx.AsyncClient, gateway: gateway_pb2_grpc.GatewayServiceStub):
+    def auth(user: User) -> dict[str, str]:
+        return {"Authorization": f"Bearer {user.token}"}
+
+    def day() -> str:
+        return (date.today() + timedelta(days=_rng.randint(0, 2))).isoformat()
+
+    async def rest_forecast(user: User) -> None:
+        params = {"city_name": _rng.choice(user.cities), "date": day(), "time": "12:00"}
+        (await http.get("/api/v2/forecast", params=params, headers=auth(user))).raise_for_status()
+
+    async def rest_dress_advice(user: User) -> None:
+        params = {"city_name": _rng.choice(user.cities), "locale": _rng.choice(["en", "ru"])}
+        r = await http.get("/api/v2/dress-advice", params=params, headers=auth(user))
+        r.raise_for_status()
+
+    async def rest_cities(user: User) -> None:
+        (await http.get("/api/v2/cities", headers=auth(user))).raise_for_status()
+
+    async def grpc_forecast(user: User) -> None:
+        await gateway.GetForecast(
+            gateway_pb2.GatewayForecastRequest(
+                user_id=user.user_id,
+                city_name=_rng.choice(user.cities),
+                date=day(),
+            )
+        )
+
+    async def grpc_dress_advice(user: User) -> None:
+        await gateway.GetDressAdvice(
+            gateway_pb2.GetDressAdviceRequest(
+                user_id=user.user_id,
+                city_name=_rng.choice(user.cities),
+                locale="en",
+            )
+        )
+
+    async def grpc_stream_advice(user: User) -> None:
+        request = gateway_pb2.GetDressAdviceRequest(
+            user_id=user.user_id,
+            city_name=_rng.choice(user.cities),
+            locale="en",
+        )
+        async for _ in gateway.StreamDressAdvice(request):
+            pass
+
+    return {
+        "rest_forecast": rest_forecast,
+        "rest_dress_advice": rest_dress_advice,
+        "rest_cities": rest_cities,
+        "grpc_forecast": grpc_forecast,
+        "grpc_dress_advice": grpc_dress_advice,
+        "grpc_stream_advice": grpc_stream_advice,
+    }
+
+
+def _parse_mix(mix: str, known: dict[str, Scenario]) -> dict[str, float]:
+    weights = {}
+    for item in mix.split(","):
+        name, _, weight = item.partition("=")
+        if name.strip() not in known:
+            raise SystemExit(f"unknown scenario {name!r}; choose from {', '.join(known)}")
+        weights[name.strip()] = float(weight or 1)
+    return weights
+
+
+async def _drive(
+    scenarios: dict[str, Scenario],
+    weights: dict[str, float],
+    users: list[User],
+    duration: float,
+    concurrency: int,
+) -> tuple[dict[str, list[float]], dict[str, int], float]:
+    """Closed loop: `concurrency` workers issue back-to-back requests until `duration` ends."""
+    latencies: dict[str, list[float]] = defaultdict(list)
+    errors: dict[str, int] = defaultdict(int)
+    names, shares = list(weights), list(weights.values())
+    started = time.perf_counter()
+    deadline = started + duration
+
+    async def worker() -> None:
+        while time.perf_counter() < deadline:
+            name = _rng.choices(names, shares)[0]
+            user = _rng.choice(users)
+            t0 = time.perf_counter()
+            try:
+                await scenarios[name](user)
+            except Exception:
+                errors[name] += 1
+            else:
+                latencies[name].append(time.perf_counter() - t0)
+
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return latencies, errors, time.perf_counter() - started
+
+
+def _summarize(
+    latencies: dict[str, list[float]], errors: dict[str, int], elapsed: float
+) -> dict[str, dict[str, float]]:
+    def row(samples: list[float], failed: int) -> dict[str, float]:
+        return {
+            "requests": len(samples),
+            "errors": failed,
+            "rps": round(len(samples) / elapsed, 1),
+            "p50_ms": round(_percentile(samples, 0.50) * 1000, 2),
+            "p95_ms": round(_percentile(samples, 0.95) * 1000, 2),
+            "p99_ms": round(_percentile(samples, 0.99) * 1000, 2),
+        }
+
+    summary = {name: row(latencies[name], errors[name]) for name in sorted(latencies | errors)}
+    summary["total"] = row([x for xs in latencies.values() for x in xs], sum(errors.values()))
+    return summary
+
+
+def _print_report(report: dict) -> None:
+    print(
+        f"\n{'scenario':<20} {'req':>8} {'err':>6} {'rps':>9} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}"
+    )
+    for name, r in report["scenarios"].items():
+        print(
+            f"{name:<20} {r['requests']:>8} {r['errors']:>6} {r['rps']:>9.1f} "
+            f"{r['p50_ms']:>9.2f} {r['p95_ms']:>9.2f} {r['p99_ms']:>9.2f}"
+        )
+    total = report["scenarios"]["total"]["requests"] or 1
+    print("\nupstream calls (per 1000 requests):")
+    for name, count in sorted(report["upstream_calls"].items()):
+        print(f"  {name:<24} {count:>8} ({count * 1000 / total:.1f})")
+
+
+def compare(baseline: dict, report: dict, tolerance: float) -> list[str]:
+    """Regressions of `report` against `baseline`: RPS drops or p95 rises beyond `tolerance`."""
+    problems = []
+    for name, base in baseline["scenarios"].items():
+        current = report["scenarios"].get(name)
+        if current is None or not base["requests"]:
+            continue
+        if current["rps"] < base["rps"] * (1 - tolerance):
+            problems.append(f"{name}: rps {current['rps']} < baseline {base['rps']}")
+        if current["p95_ms"] > base["p95_ms"] * (1 + tolerance):
+            problems.append(f"{name}: p95 {current['p95_ms']} ms > baseline {base['p95_ms']} ms")
+        if current["errors"] > base["errors"]:
+            problems.append(f"{name}: errors {current['errors']} > baseline {base['errors']}")
+    return problems
+
+
+async def run(args: argparse.Namespace) -> dict:
+    services = Services(args)
+    async with services as stack:
+        limits = httpx.Limits(max_connections=args.concurrency)
+        async with (
+            httpx.AsyncClient(base_url=stack.gateway_http, limits=limits, timeout=30) as http,
+            aio.insecure_channel(stack.gateway_grpc) as channel,
+        ):
+            scenarios = _scenarios(http, gateway_pb2_grpc.GatewayServiceStub(channel))
+            weights = _parse_mix(args.mix, scenarios)
+            users = await _create_users(http, args.users, args.cities_per_user)
+            if args.warmup:
+                await _drive(scenarios, weights, users, args.warmup, args.concurrency)
+            before = await services.upstream_calls()
+            latencies, errors, elapsed = await _drive(
+                scenarios, weights, users, args.duration, args.concurrency
+            )
+            after = await services.upstream_calls()
+    return {
+        "config": {
+            "duration": args.duration,
+            "concurrency": args.concurrency,
+            "users": args.users,
+            "cities_per_user": args.cities_per_user,
+            "mix": args.mix,
+            "open_meteo_latency": args.open_meteo_latency,
+            "openai_latency": args.openai_latency,
+            "env": args.env,
+            "seed": args.seed,
+        },
+        "scenarios": _summarize(latencies, errors, elapsed),
+        "upstream_calls": {k: after[k] - before.get(k, 0) for k in after},
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--duration", type=float, default=20, help="Measured seconds")
+    parser.add_argument("--warmup", type=float, default=3, help="Unmeasured seconds first")
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--users", type=int, default=20)
+    parser.add_argument("--cities-per-user", type=int, default=3)
+    parser.add_argument("--mix", default=DEFAULT_MIX, help="scenario=weight,...")
+    parser.add_argument("--open-meteo-latency", type=float, default=0.05, help="Seconds")
+    parser.add_argument("--openai-latency", type=float, default=0.4, help="Seconds")
+    parser.add_argument("--jitter", type=float, default=0.02, help="Extra random seconds")
+    parser.add_argument("--redis-url", default="", help="Default: in-process fakeredis")
+    parser.add_argument("--database-url", default="", help="Default: SQLite in a temp dir")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed for the traffic mix")
+    parser.add_argument("--env", action="append", default=[], help="KEY=VALUE for services")
+    parser.add_argument("--log-level", default="WARNING", help="Service log level")
+    parser.add_argument("--startup-timeout", type=float, default=30)
+    parser.add_argument("--keep-logs", action="store_true")
+    parser.add_argument("--output", type=Path, help="Write the JSON report here")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--compare", action="store_true", help="Exit 1 on regression")
+    parser.add_argument("--tolerance", type=float, default=0.15, help="Allowed relative drift")
+    args = parser.parse_args()
+    _rng.seed(args.seed)
+
+    report = asyncio.run(run(args))
+    _print_report(report)
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2))
+    if args.save_baseline:
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        args.baseline.write_text(json.dumps(report, indent=2))
+        print(f"\nbaseline saved to {args.baseline}")
+    if args.compare:
+        problems = compare(json.loads(args.baseline.read_text()), report, args.tolerance)
+        if problems:
+            print("\nregressions vs baseline:\n  " + "\n  ".join(problems))
+            sys.exit(1)
+        print(f"\nno regressions vs {args.baseline} (tolerance {args.tolerance:.0%})")
+
+
+if __name__ == "__main__":
+    main()
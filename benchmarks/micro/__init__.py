@@ -0,0 +1 @@
+# Microbenchmarks (pytest-benchmark); run with `pytest benchmarks/micro`
@@ -0,0 +1,47 @@
+"""Microbenchmark fixtures. Run from project root (outside the default test paths):
+
+pytest benchmarks/micro --benchmark-autosave          # JSON in .benchmarks/
+pytest benchmarks/micro --benchmark-compare           # against the latest saved run
+pytest benchmarks/micro --benchmark-compare=0001 --benchmark-compare-fail=mean:10%
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+ROOT = Path(__file__).resolve().parent.parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+if str(ROOT / "proto_gen") not in sys.path:
+    sys.path.insert(0, str(ROOT / "proto_gen"))
+
+from users.infrastructure.db.models import Base
+
+
+@pytest.fixture
+def run():
+    """Run a coroutine to completion on a private event loop (benchmark callables are sync)."""
+    loop = asyncio.new_event_loop()
+    try:
+        yield loop.run_until_complete
+    finally:
+        loop.close()
+
+
+@pytest.fixture
+def session_factory(run, tmp_path):
+    """Session factory over a fresh file-backed SQLite DB with the schema created."""
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'users.db'}")
+
+    async def create_schema() -> None:
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+
+    run(create_schema())
+    try:
+        yield async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    finally:
+        run(engine.dispose())
@@ -0,0 +1,15 @@
+"""AuthService.decode_token: verified-token cache hit vs full JWT verification."""
+
+import pytest
+
+from gateway.api.v1.auth_service import AuthService
+from gateway.config.settings import Settings
+
+_SECRET = "bench-secret-at-least-32-bytes-long-for-hmac"  # nosec B105 - benchmark only
+
+
+@pytest.mark.parametrize("cache_size", [10_000, 0], ids=["cached", "uncached"])
+def test_decode_token(benchmark, cache_size):
+    auth = AuthService(Settings(jwt_secret=_SECRET, jwt_cache_size=cache_size))
+    token = auth.create_token(42, "bench", False)
+    assert benchmark(auth.decode_token, token).user_id == 42
@@ -0,0 +1,24 @@
+"""Cache key construction on the GetAdvice / GetForecast hot paths."""
+
+import pytest
+
+from dress_advice.application.advice_keys import BandedKeyPolicy
+from dress_advice.application.use_cases.get_advice import ExactKeyPolicy, WeatherData
+from weather.application.use_cases.get_forecast import current_key, forecast_key
+
+READING = WeatherData(
+    temperature=12.34, humidity=61.0, wind_speed=4.2, precipitation=0.3, time="2026-01-01T12:00"
+)
+
+
+@pytest.mark.parametrize("policy", [ExactKeyPolicy(), BandedKeyPolicy()], ids=["exact", "banded"])
+def test_advice_key(benchmark, policy):
+    assert benchmark(policy.key, READING, "en").startswith("advice:")
+
+
+def test_forecast_key(benchmark):
+    assert benchmark(forecast_key, 55.7558, 37.6173, "2026-01-01", "12:00").startswith("forecast:")
+
+
+def test_current_key(benchmark):
+    assert benchmark(current_key, 55.7558, 37.6173).startswith("current:")
@@ -0,0 +1,68 @@
+"""CityRepositoryImpl queries on SQLite, one session per call as in the servicer."""
+
+import pytest
+
+from users.application.use_cases.create_user import CreateUserUseCase
+from users.domain.entities import CityImportRow
+from users.infrastructure.db.repositories.city_repository import CityRepositoryImpl
+from users.infrastructure.db.repositories.user_repository import UserRepositoryImpl
+from users.infrastructure.db.session import SessionRouter, get_session
+
+USERS = 50
+CITIES_PER_USER = 20
+
+
+@pytest.fixture
+def city_repo(run, session_factory):
+    """Repository over USERS users with CITIES_PER_USER cities each; returns (repo, user_id)."""
+    create_user = CreateUserUseCase(
+        UserRepositoryImpl(session_factory), SessionRouter(session_factory)
+    )
+    repo = CityRepositoryImpl(session_factory)
+
+    async def seed() -> int:
+        rows = []
+        for u in range(USERS):
+            user = await create_user.run(
+                username=f"bench{u}",
+                password_hash="",  # nosec B106 - benchmark fixture
+            )
+            rows += [
+                CityImportRow(user.id, f"City {i}", 40 + i / 10, 20 + i / 10)
+                for i in range(CITIES_PER_USER)
+            ]
+        async with get_session(session_factory) as session:
+            await repo.add_many(session, rows)
+        return user.id
+
+    return repo, run(seed())
+
+
+def test_list_by_user_id(benchmark, run, session_factory, city_repo):
+    repo, user_id = city_repo
+
+    async def call():
+        async with session_factory() as session:
+            return await repo.list_by_user_id(session, user_id)
+
+    assert len(benchmark(lambda: run(call()))) == CITIES_PER_USER
+
+
+def test_get_by_user_and_name(benchmark, run, session_factory, city_repo):
+    repo, user_id = city_repo
+
+    async def call():
+        async with session_factory() as session:
+            return await repo.get_by_user_and_name(session, user_id, "City 7")
+
+    assert benchmark(lambda: run(call())).name == "City 7"
+
+
+def test_list_coordinates_after(benchmark, run, session_factory, city_repo):
+    repo, _ = city_repo
+
+    async def call():
+        async with session_factory() as session:
+            return await repo.list_coordinates_after(session, 0, 500)
+
+    assert len(benchmark(lambda: run(call()))) == 500
@@ -0,0 +1,20 @@
+"""telegram_bot.i18n.t lookups (loaded dictionaries; first load happens outside timing)."""
+
+import pytest
+
+from telegram_bot.i18n import t
+
+
+@pytest.mark.parametrize(
+    ("key", "locale"),
+    [
+        ("commands.cities.list", "en"),
+        ("commands.cities.list", "ru"),
+        ("commands.cities.no_such_key", "en"),
+        ("commands.cities.list", "xx"),
+    ],
+    ids=["en", "ru", "missing-key", "unknown-locale"],
+)
+def test_t(benchmark, key, locale):
+    t(key, locale)
+    assert benchmark(t, key, locale)
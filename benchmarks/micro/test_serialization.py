@@ -0,0 +1,25 @@
+"""Weather payload encode/decode: Redis JSON and the gRPC WeatherData message."""
+
+from weather.api.servicer import _weather_data_to_proto
+from weather.application.use_cases.get_forecast import WeatherData
+from weather.infrastructure.cache.redis_cache import _decode, _encode
+
+DATA = WeatherData(
+    temperature=12.3, humidity=61.0, wind_speed=4.2, precipitation=0.3, time="2026-01-01T12:00"
+)
+
+
+def test_redis_encode(benchmark):
+    assert benchmark(_encode, DATA).startswith("{")
+
+
+def test_redis_decode(benchmark):
+    assert benchmark(_decode, _encode(DATA)) == DATA
+
+
+def test_weather_data_to_proto(benchmark):
+    assert benchmark(_weather_data_to_proto, DATA).temperature == DATA.temperature
+
+
+def test_weather_data_to_proto_bytes(benchmark):
+    assert benchmark(lambda: _weather_data_to_proto(DATA).SerializeToString())
@@ -0,0 +1,255 @@
+"""Throughput of Weather / Dress Advice vs pre-fork worker count (WEATHER_WORKERS, ...).
+
+For each --workers value the service is started alone with that many workers and
+hammered over gRPC by --clients load-generator processes, each spreading calls over
+--channels connections (SO_REUSEPORT balances connections, not calls). Requests are
+cache hits: Weather GetForecast for a fixed set of coordinates, Dress Advice GetAdvice
+with the local provider, so the measured work is Redis I/O, JSON, protobuf and logging.
+
+Run from project root on a multi-core host (speedup is bounded by free cores):
+    python -m benchmarks.scaling --service weather --workers 1,2,4 --redis-url redis://localhost:6379/1
+    python -m benchmarks.scaling --service dress_advice --workers 1,2,4 --output scaling.json
+
+Without --redis-url a fakeredis server runs in its own process; being single-threaded
+it can become the ceiling before the service does.
+"""
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import signal
+import subprocess  # nosec B404 - starts the services under test
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+if str(ROOT / "proto_gen") not in sys.path:
+    sys.path.insert(0, str(ROOT / "proto_gen"))
+
+import common_pb2
+import dress_advice_pb2
+import dress_advice_pb2_grpc
+import weather_pb2
+import weather_pb2_grpc
+from grpc import aio
+
+from benchmarks.e2e import CITIES, _free_port, _percentile
+
+_ENV_PREFIX = {"weather": "WEATHER_", "dress_advice": "DRESS_ADVICE_"}
+
+
+def _fake_redis(port: int) -> None:
+    from fakeredis import TcpFakeServer
+
+    TcpFakeServer(("127.0.0.1", port), server_type="redis").serve_forever()
+
+
+def _call_factory(service: str, channel: aio.Channel):
+    if service == "weather":
+        stub = weather_pb2_grpc.WeatherServiceStub(channel)
+        requests = [weather_pb2.GetForecastRequest(lat=lat, lon=lon) for _, lat, lon in CITIES]
+        return lambda i: stub.GetForecast(requests[i % len(requests)])
+    stub = dress_advice_pb2_grpc.DressAdviceServiceStub(channel)
+    requests = [
+        dress_advice_pb2.GetAdviceRequest(
+            weather_data=common_pb2.WeatherData(
+                temperature=t, humidity=60, wind_speed=3, precipitation=0
+            ),
+            locale=locale,
+        )
+        for t in range(-20, 35, 3)
+        for locale in ("en", "ru")
+    ]
+    return lambda i: stub.GetAdvice(requests[i % len(requests)])
+
+
+async def _client_loop(args: dict, start_at: float) -> tuple[list[float], int]:
+    channels = [
+        aio.insecure_channel(args["addr"], options=[("grpc.use_local_subchannel_pool", 1)])
+        for _ in range(args["channels"])
+    ]
+    calls = [_call_factory(args["service"], ch) for ch in channels]
+    latencies: list[float] = []
+    errors = 0
+    measure_from = start_at + args["warmup"]
+    deadline = measure_from + args["duration"]
+
+    async def worker(n: int) -> None:
+        nonlocal errors
+        call, i = calls[n % len(calls)], n
+        while (now := time.time()) < deadline:
+            try:
+                await call(i)
+            except Exception:
+                if now >= measure_from:
+                    errors += 1
+            else:
+                if now >= measure_from:
+                    latencies.append(time.time() - now)
+            i += 1
+
+    await asyncio.sleep(max(0.0, start_at - time.time()))
+    await asyncio.gather(*(worker(n) for n in range(args["concurrency"])))
+    for ch in channels:
+        await ch.close()
+    return latencies, errors
+
+
+def _client(args: dict, start_at: float, results) -> None:
+    results.put(asyncio.run(_client_loop(args, start_at)))
+
+
+def _wait_ready(addr: str, proc: subprocess.Popen, timeout: float) -> None:
+    async def probe() -> None:
+        async with aio.insecure_channel(addr) as channel:
+            await asyncio.wait_for(channel.channel_ready(), timeout)
+
+    try:
+        asyncio.run(probe())
+    except asyncio.TimeoutError:
+        raise TimeoutError(f"service not ready on {addr} (exit code {proc.poll()})") from None
+
+
+def _measure(args: argparse.Namespace, workers: int, base_env: dict[str, str]) -> dict:
+    prefix = _ENV_PREFIX[args.service]
+    port = _free_port()
+    env = {
+        **os.environ,
+        **base_env,
+        f"{prefix}WORKERS": str(workers),
+        f"{prefix}GRPC_HOST": "127.0.0.1",
+        f"{prefix}GRPC_PORT": str(port),
+    }
+    service = subprocess.Popen(  # nosec B603 - fixed argv, our own module
+        [sys.executable, "-m", f"{args.service}.main"], cwd=ROOT, env=env
+    )
+    try:
+        addr = f"127.0.0.1:{port}"
+        _wait_ready(addr, service, args.startup_timeout)
+        time.sleep(args.settle)  # let every worker bind before connections are spread
+        ctx = multiprocessing.get_context("spawn")
+        results = ctx.Queue()
+        client_args = {
+            "service": args.service,
+            "addr": addr,
+            "channels": args.channels,
+            "concurrency": args.concurrency,
+            "warmup": args.warmup,
+            "duration": args.duration,
+        }
+        start_at = time.time() + 2  # clients start together once spawned
+        clients = [
+            ctx.Process(target=_client, args=(client_args, start_at, results))
+            for _ in range(args.clients)
+        ]
+        for c in clients:
+            c.start()
+        latencies: list[float] = []
+        errors = 0
+        for _ in clients:
+            lat, err = results.get()
+            latencies += lat
+            errors += err
+        for c in clients:
+            c.join()
+    finally:
+        service.send_signal(signal.SIGTERM)
+        try:
+            service.wait(30)
+        except subprocess.TimeoutExpired:
+            service.kill()
+            service.wait()
+    return {
+        "workers": workers,
+        "requests": len(latencies),
+        "errors": errors,
+        "rps": round(len(latencies) / args.duration, 1),
+        "p50_ms": round(_percentile(latencies, 0.50) * 1000, 2),
+        "p99_ms": round(_percentile(latencies, 0.99) * 1000, 2),
+        "service_exit_code": service.returncode,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--service", choices=sorted(_ENV_PREFIX), default="weather")
+    parser.add_argument("--workers", default="1,2,4", help="Comma-separated worker counts")
+    parser.add_argument("--duration", type=float, default=10, help="Measured seconds per run")
+    parser.add_argument("--warmup", type=float, default=2)
+    parser.add_argument("--clients", type=int, default=max(1, (os.cpu_count() or 2) // 2))
+    parser.add_argument("--channels", type=int, default=4, help="Connections per client")
+    parser.add_argument("--concurrency", type=int, default=32, help="In-flight calls per client")
+    parser.add_argument("--redis-url", default="", help="Default: fakeredis in its own process")
+    parser.add_argument("--open-meteo-latency", type=float, default=0.0)
+    parser.add_argument("--log-level", default="WARNING", help="Service log level")
+    parser.add_argument("--startup-timeout", type=float, default=30)
+    parser.add_argument("--settle", type=float, default=2, help="Seconds after first bind")
+    parser.add_argument("--output", type=Path, help="Write the JSON report here")
+    args = parser.parse_args()
+
+    helpers: list[subprocess.Popen | multiprocessing.Process] = []
+    redis_url = args.redis_url
+    if not redis_url:
+        redis_port = _free_port()
+        fake = multiprocessing.get_context("spawn").Process(
+            target=_fake_redis, args=(redis_port,), daemon=True
+        )
+        fake.start()
+        helpers.append(fake)
+        redis_url = f"redis://127.0.0.1:{redis_port}/0"
+    meteo_port = _free_port()
+    helpers.append(
+        subprocess.Popen(  # nosec B603 - fixed argv, our own module
+            [sys.executable, "-m", "benchmarks.upstreams", "open_meteo", "--port", str(meteo_port)]
+            + ["--latency", str(args.open_meteo_latency)],
+            cwd=ROOT,
+        )
+    )
+    prefix = _ENV_PREFIX[args.service]
+    base_env = {
+        "LOG_FORMAT": "text",
+        f"{prefix}LOG_LEVEL": args.log_level,
+        f"{prefix}REDIS_URL": redis_url,
+        "WEATHER_OPEN_METEO_URL": f"http://127.0.0.1:{meteo_port}/v1/forecast",
+        "DRESS_ADVICE_ADVICE_PROVIDER": "local",
+    }
+
+    runs = []
+    try:
+        for workers in (int(w) for w in args.workers.split(",")):
+            run = _measure(args, workers, base_env)
+            runs.append(run)
+            print(
+                f"workers={run['workers']:<3} rps={run['rps']:>9.1f} "
+                f"p50={run['p50_ms']:>7.2f} ms p99={run['p99_ms']:>7.2f} ms "
+                f"errors={run['errors']} exit={run['service_exit_code']}",
+                flush=True,
+            )
+    finally:
+        for helper in helpers:
+            helper.terminate()
+
+    base = (runs[0]["rps"] or 1) if runs else 1
+    print(f"\n{'workers':>7} {'rps':>9} {'speedup':>8}")
+    for run in runs:
+        print(f"{run['workers']:>7} {run['rps']:>9.1f} {run['rps'] / base:>7.2f}x")
+    if args.output:
+        report = {
+            "service": args.service,
+            "cpu_count": os.cpu_count(),
+            "clients": args.clients,
+            "channels": args.channels,
+            "concurrency": args.concurrency,
+            "redis": "external" if args.redis_url else "fakeredis",
+            "runs": runs,
+        }
+        args.output.write_text(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,156 @@
+"""Local stand-ins for Open-Meteo and OpenAI with configurable latency and call counters.
+
+Both are plain FastAPI apps; `serve(app, port)` runs one inside the current event loop.
+`GET /_stats` on either returns the number of calls it has answered, by kind.
+
+Standalone (own process, e.g. for benchmarks/scaling.py):
+    python -m benchmarks.upstreams open_meteo --port 8081 --latency 0.05
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import re
+import time
+from collections import Counter
+from dataclasses import dataclass
+
+import uvicorn
+from fastapi import FastAPI, Request
+from fastapi.responses import StreamingResponse
+
+_BATCH_SIZE = re.compile(r"exactly (\d+) strings")
+
+
+@dataclass(frozen=True)
+class Latency:
+    """Fixed `seconds` plus uniform jitter of up to `jitter` seconds."""
+
+    seconds: float = 0.0
+    jitter: float = 0.0
+
+    async def wait(self) -> None:
+        delay = self.seconds + (random.uniform(0, self.jitter) if self.jitter else 0.0)  # nosec B311
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+def _stats_route(app: FastAPI, calls: Counter) -> None:
+    @app.get("/_stats")
+    async def stats() -> dict:
+        return dict(calls)
+
+
+def open_meteo_app(latency: Latency) -> FastAPI:
+    """`GET /v1/forecast` with a `current` block derived from the coordinates."""
+    app = FastAPI()
+    calls: Counter = Counter()
+    app.state.calls = calls
+    _stats_route(app, calls)
+
+    @app.get("/v1/forecast")
+    async def forecast(latitude: float, longitude: float) -> dict:
+        calls["forecast"] += 1
+        await latency.wait()
+        seed = int(abs(latitude * 1000 + longitude * 10))
+        return {
+            "latitude": latitude,
+            "longitude": longitude,
+            "current": {
+                "time": time.strftime("%Y-%m-%dT%H:00", time.gmtime()),
+                "temperature_2m": round(-10 + seed % 350 / 10, 1),
+                "relative_humidity_2m": 30 + seed % 60,
+                "wind_speed_10m": round(seed % 150 / 10, 1),
+                "precipitation": round(seed % 7 / 2, 1),
+            },
+        }
+
+    return app
+
+
+def _completion(content: str) -> dict:
+    return {
+        "id": "chatcmpl-bench",
+        "object": "chat.completion",
+        "created": int(time.time()),
+        "model": "bench",
+        "choices": [
+            {
+                "index": 0,
+                "message": {"role": "assistant", "content": content},
+                "finish_reason": "stop",
+            }
+        ],
+    }
+
+
+def openai_app(latency: Latency, stream_chunks: int = 5) -> FastAPI:
+    """`POST /v1/chat/completions`: plain, streamed (SSE) and JSON-mode batch completions."""
+    app = FastAPI()
+    calls: Counter = Counter()
+    app.state.calls = calls
+    _stats_route(app, calls)
+    advice = "Light jacket and sneakers 🧥👟"
+
+    @app.post("/v1/chat/completions")
+    async def chat_completions(request: Request):
+        body = await request.json()
+        if body.get("stream"):
+            calls["stream"] += 1
+            return StreamingResponse(_stream(advice), media_type="text/event-stream")
+        await latency.wait()
+        if body.get("response_format", {}).get("type") == "json_object":
+            calls["batch"] += 1
+            match = _BATCH_SIZE.search(body["messages"][-1]["content"])
+            size = int(match.group(1)) if match else 1
+            return _completion(json.dumps({"advice": [advice] * size}))
+        calls["completion"] += 1
+        return _completion(advice)
+
+    async def _stream(text: str):
+        await latency.wait()
+        words = text.split(" ")
+        step = max(1, len(words) // stream_chunks)
+        for i in range(0, len(words), step):
+            delta = " ".join(words[i : i + step]) + " "
+            event = {
+                "id": "chatcmpl-bench",
+                "object": "chat.completion.chunk",
+                "created": int(time.time()),
+                "model": "bench",
+                "choices": [{"index": 0, "delta": {"content": delta}, "finish_reason": None}],
+            }
+            yield f"data: {json.dumps(event)}\n\n"
+        yield "data: [DONE]\n\n"
+
+    return app
+
+
+async def serve(app: FastAPI, port: int, host: str = "127.0.0.1") -> uvicorn.Server:
+    """Start `app` on host:port in this event loop; stop it with `server.should_exit = True`."""
+    server = uvicorn.Server(
+        uvicorn.Config(app, host=host, port=port, log_level="warning", access_log=False)
+    )
+    app.state.serving = asyncio.create_task(server.serve())
+    while not server.started:
+        if app.state.serving.done():
+            app.state.serving.result()
+        await asyncio.sleep(0.01)
+    return server
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Run one upstream stand-in")
+    parser.add_argument("upstream", choices=["open_meteo", "openai"])
+    parser.add_argument("--port", type=int, required=True)
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Extra random seconds")
+    args = parser.parse_args()
+    latency = Latency(args.latency, args.jitter)
+    app = open_meteo_app(latency) if args.upstream == "open_meteo" else openai_app(latency)
+    uvicorn.run(app, host="127.0.0.1", port=args.port, log_level="warning", access_log=False)
+
+
+if __name__ == "__main__":
+    main()
@@ -33,8 +33,9 @@ def _request_to_weather_data(request) -> WeatherData:
 
 
 class DressAdviceServicer(dress_advice_pb2_grpc.DressAdviceServiceServicer):
-    def __init__(self, get_advice_uc):
+    def __init__(self, get_advice_uc, stream_advice_uc=None):
         self._get_advice = get_advice_uc
+        self._stream_advice = stream_advice_uc
 
     async def GetAdvice(self, request, context):
         locale = request.locale or "en"
@@ -54,3 +55,26 @@ class DressAdviceServicer(dress_advice_pb2_grpc.DressAdviceServiceServicer):
             context.set_code(grpc.StatusCode.INTERNAL)
             context.set_details(str(e))
             return dress_advice_pb2.GetAdviceResponse(advice_text="")
+
+    async def StreamAdvice(self, request, context):
+        locale = request.locale or "en"
+        logger.info("StreamAdvice locale=%s", locale)
+        if self._stream_advice is None:
+            context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+            context.set_details("StreamAdvice not configured")
+            return
+        try:
+            wd = _request_to_weather_data(request)
+            async for text in self._stream_advice.run(wd, locale):
+                yield dress_advice_pb2.AdviceChunk(text=text)
+        except DomainError as e:
+            code, msg = domain_error_to_grpc(e)
+            logger.warning(
+                "StreamAdvice DomainError locale=%s code=%s", locale, getattr(e, "code", e)
+            )
+            context.set_code(code)
+            context.set_details(msg)
+        except Exception as e:
+            logger.exception("StreamAdvice failed locale=%s: %s", locale, e)
+            context.set_code(grpc.StatusCode.INTERNAL)
+            context.set_details(str(e))
@@ -0,0 +1,105 @@
+"""Banded advice cache keys: readings that get the same advice share a key."""
+
+import math
+from collections.abc import Iterator
+from dataclasses import dataclass
+
+from dress_advice.application.use_cases.get_advice import (
+    AdviceKeyPolicy,
+    ExactKeyPolicy,
+    WeatherData,
+)
+
+# Beaufort scale upper bounds, m/s: class n covers [BEAUFORT[n-1], BEAUFORT[n])
+BEAUFORT_UPPER_MS = (0.5, 1.6, 3.4, 5.5, 8.0, 10.8, 13.9, 17.2, 20.8, 24.5, 28.5, 32.7)
+# Precipitation, mm/h: none / light / moderate / heavy
+RAIN_UPPER_MM = (0.1, 2.5, 7.6)
+# Relative humidity, %: dry / normal / humid
+HUMIDITY_UPPER_PCT = (40.0, 70.0)
+
+
+@dataclass(frozen=True)
+class WeatherBucket:
+    temperature_band: int
+    wind_class: int
+    rain_class: int
+    humidity_class: int
+
+
+def _class_of(value: float, upper_bounds: tuple[float, ...]) -> int:
+    for i, upper in enumerate(upper_bounds):
+        if value < upper:
+            return i
+    return len(upper_bounds)
+
+
+def _midpoint(cls: int, upper_bounds: tuple[float, ...], floor: float = 0.0) -> float:
+    low = floor if cls == 0 else upper_bounds[cls - 1]
+    if cls >= len(upper_bounds):
+        return low
+    return (low + upper_bounds[cls]) / 2
+
+
+class BandedKeyPolicy:
+    """Quantised advice keys.
+
+    Temperature is cut into `temperature_step` °C bands clamped to
+    [`min_temperature`, `max_temperature`], wind into Beaufort classes, precipitation
+    into none/light/moderate/heavy and humidity into dry/normal/humid.
+    """
+
+    def __init__(
+        self,
+        temperature_step: float = 3.0,
+        min_temperature: float = -40.0,
+        max_temperature: float = 45.0,
+    ):
+        if temperature_step <= 0:
+            raise ValueError("temperature_step must be positive")
+        self._step = temperature_step
+        self._min_band = math.floor(min_temperature / temperature_step)
+        self._max_band = math.floor(max_temperature / temperature_step)
+
+    def bucket(self, weather_data: WeatherData) -> WeatherBucket:
+        band = math.floor(weather_data.temperature / self._step)
+        return WeatherBucket(
+            temperature_band=min(max(band, self._min_band), self._max_band),
+            wind_class=_class_of(weather_data.wind_speed, BEAUFORT_UPPER_MS),
+            rain_class=_class_of(weather_data.precipitation, RAIN_UPPER_MM),
+            humidity_class=_class_of(weather_data.humidity, HUMIDITY_UPPER_PCT),
+        )
+
+    def bucket_key(self, bucket: WeatherBucket, locale: str) -> str:
+        return (
+            f"advice:b{self._step:g}:t{bucket.temperature_band}:w{bucket.wind_class}:"
+            f"r{bucket.rain_class}:h{bucket.humidity_class}:{locale}"
+        )
+
+    def key(self, weather_data: WeatherData, locale: str) -> str:
+        return self.bucket_key(self.bucket(weather_data), locale)
+
+    def representative(self, bucket: WeatherBucket) -> WeatherData:
+        """Mid-bucket reading, used to generate advice that stands for the whole bucket."""
+        return WeatherData(
+            temperature=(bucket.temperature_band + 0.5) * self._step,
+            humidity=_midpoint(bucket.humidity_class, HUMIDITY_UPPER_PCT),
+            wind_speed=_midpoint(bucket.wind_class, BEAUFORT_UPPER_MS),
+            precipitation=_midpoint(bucket.rain_class, RAIN_UPPER_MM),
+            time="",
+        )
+
+    def grid(self) -> Iterator[WeatherBucket]:
+        """Every bucket the policy can produce."""
+        for band in range(self._min_band, self._max_band + 1):
+            for wind in range(len(BEAUFORT_UPPER_MS) + 1):
+                for rain in range(len(RAIN_UPPER_MM) + 1):
+                    for humidity in range(len(HUMIDITY_UPPER_PCT) + 1):
+                        yield WeatherBucket(band, wind, rain, humidity)
+
+
+def build_key_policy(name: str, temperature_step: float = 3.0) -> AdviceKeyPolicy:
+    if name == "exact":
+        return ExactKeyPolicy()
+    if name == "banded":
+        return BandedKeyPolicy(temperature_step)
+    raise ValueError(f"Unknown advice key policy: {name}")
@@ -0,0 +1,252 @@
+"""AdviceProvider combinators: fallback, hedging and deadline-bounded primary calls."""
+
+import asyncio
+import logging
+from collections import deque
+from typing import Protocol
+
+from dress_advice.application.use_cases.get_advice import (
+    AdviceProvider,
+    DegradedAdvice,
+    WeatherData,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class FallbackAdviceProvider:
+    """Primary with a deadline; on timeout or any error the fallback answers instead
+    (as DegradedAdvice)."""
+
+    def __init__(self, primary: AdviceProvider, fallback: AdviceProvider, timeout_seconds: float):
+        self._primary = primary
+        self._fallback = fallback
+        self._timeout = timeout_seconds
+
+    async def get_advice(self, weather_data: WeatherData, locale: str = "en") -> str:
+        try:
+            return await asyncio.wait_for(
+                self._primary.get_advice(weather_data, locale), self._timeout
+            )
+        except asyncio.TimeoutError:
+            logger.warning("Advice primary timed out after %.2fs, using fallback", self._timeout)
+        except Exception as e:
+            logger.warning("Advice primary failed, using fallback: %s", e)
+        return DegradedAdvice(await self._fallback.get_advice(weather_data, locale))
+
+
+class HedgedAdviceProvider:
+    """Start the primary; if it has not answered after `hedge_after_seconds` (or fails),
+    start the hedge too and return whichever succeeds first. The loser is cancelled.
+    A hedge answer is the stand-in (local rules), so it comes back as DegradedAdvice.
+    """
+
+    def __init__(self, primary: AdviceProvider, hedge: AdviceProvider, hedge_after_seconds: float):
+        self._primary = primary
+        self._hedge = hedge
+        self._hedge_after = hedge_after_seconds
+
+    async def get_advice(self, weather_data: WeatherData, locale: str = "en") -> str:
+        primary = asyncio.ensure_future(self._primary.get_advice(weather_data, locale))
+        tasks = [primary]
+        try:
+            done, _ = await asyncio.wait({primary}, timeout=self._hedge_after)
+            if done and primary.exception() is None:
+                return primary.result()
+            hedge = asyncio.ensure_future(self._hedge.get_advice(weather_data, locale))
+            tasks.append(hedge)
+            pending = {task for task in tasks if not task.done()}
+            error: BaseException | None = primary.exception() if done else None
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        return DegradedAdvice(task.result()) if task is hedge else task.result()
+                    error = task.exception()
+            raise error
+        finally:
+            # Also runs when the caller is cancelled mid-wait: nothing outlives the request
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+
+
+class LatencyObserver(Protocol):
+    def observe(self, outcome: str, seconds: float) -> None: ...
+
+
+class LatencyWindow:
+    """Recent primary latencies; `quantile` drives the adaptive hedge delay."""
+
+    def __init__(self, initial_seconds: float, size: int = 200, min_samples: int = 20):
+        self._initial = initial_seconds
+        self._samples: deque[float] = deque(maxlen=size)
+        self._min_samples = min_samples
+
+    def add(self, seconds: float) -> None:
+        self._samples.append(seconds)
+
+    def quantile(self, q: float) -> float:
+        if len(self._samples) < self._min_samples:
+            return self._initial
+        ordered = sorted(self._samples)
+        return ordered[min(int(q * len(ordered)), len(ordered) - 1)]
+
+
+class DeadlineAdviceProvider:
+    """Hard deadline for the primary with one hedged duplicate request.
+
+    The primary starts at once. When it has not answered within the hedge delay (the
+    `hedge_quantile` of recent latencies, or `hedge_after_seconds` until enough samples),
+    or fails, an identical second request starts. The first success wins and the other is
+    cancelled. When both fail or `deadline_seconds` passes, the fallback answers (as
+    DegradedAdvice).
+    Every call is reported to `observer` as primary / hedge / fallback / failed.
+    """
+
+    def __init__(
+        self,
+        primary: AdviceProvider,
+        fallback: AdviceProvider,
+        deadline_seconds: float,
+        hedge_after_seconds: float,
+        hedge_quantile: float | None = 0.95,
+        observer: LatencyObserver | None = None,
+    ):
+        self._primary = primary
+        self._fallback = fallback
+        self._deadline = deadline_seconds
+        self._hedge_after = hedge_after_seconds
+        self._hedge_quantile = hedge_quantile
+        self._latencies = LatencyWindow(hedge_after_seconds)
+        self._observer = observer
+
+    def hedge_delay(self) -> float:
+        if self._hedge_quantile is None:
+            return min(self._hedge_after, self._deadline)
+        return min(self._latencies.quantile(self._hedge_quantile), self._deadline)
+
+    async def get_advice(self, weather_data: WeatherData, locale: str = "en") -> str:
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        attempts: dict[asyncio.Future, tuple[str, float]] = {}
+
+        def launch(name: str) -> None:
+            task = asyncio.ensure_future(self._primary.get_advice(weather_data, locale))
+            attempts[task] = (name, loop.time())
+
+        launch("primary")
+        hedge_at = started + self.hedge_delay()
+        deadline_at = started + self._deadline
+        pending = set(attempts)
+        try:
+            while True:
+                wake = deadline_at if len(attempts) > 1 else min(hedge_at, deadline_at)
+                done, pending = await asyncio.wait(
+                    pending, timeout=max(wake - loop.time(), 0), return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    name, task_started = attempts[task]
+                    if task.exception() is None:
+                        self._latencies.add(loop.time() - task_started)
+                        self._record(name, started)
+                        return task.result()
+                    logger.warning("Advice %s request failed: %s", name, task.exception())
+                now = loop.time()
+                if len(attempts) == 1 and now < deadline_at and (now >= hedge_at or not pending):
+                    launch("hedge")
+                    pending = {t for t in attempts if not t.done()}
+                    continue
+                if now >= deadline_at or not pending:
+                    break
+        finally:
+            for task in pending:
+                task.cancel()
+        if pending:
+            # Censored sample: these attempts took at least until the deadline
+            self._latencies.add(self._deadline)
+            logger.warning("Advice deadline %.2fs exceeded, using fallback", self._deadline)
+        try:
+            text = await self._fallback.get_advice(weather_data, locale)
+        except Exception:
+            self._record("failed", started)
+            raise
+        self._record("fallback", started)
+        return DegradedAdvice(text)
+
+    def _record(self, outcome: str, started: float) -> None:
+        if self._observer:
+            self._observer.observe(outcome, asyncio.get_running_loop().time() - started)
+
+
+class BatchAdviceProvider(Protocol):
+    async def get_advice(self, weather_data: WeatherData, locale: str = "en") -> str: ...
+    async def get_advice_batch(self, items: list[tuple[WeatherData, str]]) -> list[str]: ...
+
+
+class BatchingAdviceProvider:
+    """Collects concurrent requests for `window_seconds` and answers them with one batch call.
+
+    Identical (weather, locale) requests in a window share one slot. A batch is sent early
+    once it holds `max_batch` distinct requests; a lone request uses the plain call.
+    """
+
+    def __init__(self, provider: BatchAdviceProvider, window_seconds: float, max_batch: int = 16):
+        self._provider = provider
+        self._window = window_seconds
+        self._max_batch = max_batch
+        self._pending: dict[tuple, tuple[WeatherData, str, list[asyncio.Future]]] = {}
+        self._timer: asyncio.TimerHandle | None = None
+        self._tasks: set[asyncio.Task] = set()
+
+    async def get_advice(self, weather_data: WeatherData, locale: str = "en") -> str:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        key = (
+            weather_data.temperature,
+            weather_data.humidity,
+            weather_data.wind_speed,
+            weather_data.precipitation,
+            locale,
+        )
+        if key in self._pending:
+            self._pending[key][2].append(future)
+        else:
+            self._pending[key] = (weather_data, locale, [future])
+        if len(self._pending) >= self._max_batch:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self._window, self._flush)
+        return await future
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = list(self._pending.values()), {}
+        task = asyncio.get_running_loop().create_task(self._send(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _send(self, batch: list[tuple[WeatherData, str, list[asyncio.Future]]]) -> None:
+        # Callers cancelled while waiting (deadline, hedge loser) need no answer
+        batch = [entry for entry in batch if any(not f.done() for f in entry[2])]
+        if not batch:
+            return
+        try:
+            if len(batch) == 1:
+                wd, locale, _ = batch[0]
+                texts = [await self._provider.get_advice(wd, locale)]
+            else:
+                logger.debug("Advice batch size=%s", len(batch))
+                texts = await self._provider.get_advice_batch([(wd, loc) for wd, loc, _ in batch])
+        except Exception as e:
+            for _, _, futures in batch:
+                for f in futures:
+                    if not f.done():
+                        f.set_exception(e)
+            return
+        for (_, _, futures), text in zip(batch, texts, strict=True):
+            for f in futures:
+                if not f.done():
+                    f.set_result(text)
@@ -1,8 +1,13 @@
-"""GetAdvice use case (cache-aside + AdviceProvider)."""
+"""GetAdvice and StreamAdvice use cases (precomputed table -> cache-aside + AdviceProvider)."""
 
+import asyncio
+import logging
+from collections.abc import AsyncIterator, Hashable
 from dataclasses import dataclass
 from typing import Protocol
 
+logger = logging.getLogger(__name__)
+
 
 @dataclass
 class WeatherData:
@@ -13,27 +18,183 @@ class WeatherData:
     time: str
 
 
+class DegradedAdvice(str):
+    """Advice from a stand-in path (local rules after an OpenAI timeout, error or lost race).
+
+    Providers return it in place of a plain str; the use cases cache it only for
+    `degraded_ttl_seconds` so one OpenAI blip does not pin it for a whole bucket.
+    """
+
+
 class AdviceProvider(Protocol):
     async def get_advice(self, weather_data: WeatherData, locale: str = "en") -> str: ...
 
 
+class StreamingAdviceProvider(Protocol):
+    def stream_advice(
+        self, weather_data: WeatherData, locale: str = "en"
+    ) -> AsyncIterator[str]: ...
+
+
 class AdviceCache(Protocol):
     async def get(self, key: str) -> str | None: ...
-    async def set(self, key: str, text: str, ttl_seconds: int = 3600) -> None: ...
+    async def set(self, key: str, text: str, ttl_seconds: int | None = None) -> None: ...
+
+
+class AdviceTable(Protocol):
+    """Precomputed advice held in memory; lookups never leave the process."""
+
+    def get(self, key: str) -> str | None: ...
+
+
+class AdviceKeyPolicy(Protocol):
+    """Maps readings to buckets that share one cached advice text.
+
+    On a miss the advice is generated from `representative(bucket)`, not from the exact
+    reading, so the cached text holds for every reading in the bucket.
+    """
+
+    def bucket(self, weather_data: WeatherData) -> Hashable: ...
+    def bucket_key(self, bucket: Hashable, locale: str) -> str: ...
+    def representative(self, bucket: Hashable) -> WeatherData: ...
+    def key(self, weather_data: WeatherData, locale: str) -> str: ...
+
+
+class ExactKeyPolicy:
+    """One key per reading at 0.1 °C / 1 % / 0.1 m/s / 0.1 mm."""
+
+    def bucket(self, weather_data: WeatherData) -> tuple[float, float, float, float]:
+        w = weather_data
+        return (
+            round(w.temperature, 1),
+            round(w.humidity),
+            round(w.wind_speed, 1),
+            round(w.precipitation, 1),
+        )
+
+    def bucket_key(self, bucket: tuple[float, float, float, float], locale: str) -> str:
+        temperature, humidity, wind_speed, precipitation = bucket
+        return (
+            f"advice:{temperature:.1f}:{humidity:.0f}:{wind_speed:.1f}:{precipitation:.1f}:{locale}"
+        )
+
+    def key(self, weather_data: WeatherData, locale: str) -> str:
+        return self.bucket_key(self.bucket(weather_data), locale)
+
+    def representative(self, bucket: tuple[float, float, float, float]) -> WeatherData:
+        temperature, humidity, wind_speed, precipitation = bucket
+        return WeatherData(temperature, humidity, wind_speed, precipitation, time="")
+
+
+async def _store(cache: AdviceCache, key: str, text: str, degraded_ttl: int) -> None:
+    """Cache `text` with the cache's default TTL; degraded advice only for `degraded_ttl`
+    seconds (0 = not at all)."""
+    if not isinstance(text, DegradedAdvice):
+        await cache.set(key, text)
+    elif degraded_ttl > 0:
+        await cache.set(key, str(text), degraded_ttl)
 
 
 class GetAdviceUseCase:
-    def __init__(self, provider: AdviceProvider, cache: AdviceCache | None = None):
+    def __init__(
+        self,
+        provider: AdviceProvider,
+        cache: AdviceCache | None = None,
+        key_policy: AdviceKeyPolicy | None = None,
+        table: AdviceTable | None = None,
+        degraded_ttl_seconds: int = 60,
+    ):
         self._provider = provider
         self._cache = cache
+        self._key_policy = key_policy or ExactKeyPolicy()
+        self._table = table
+        self._degraded_ttl = degraded_ttl_seconds
 
     async def run(self, weather_data: WeatherData, locale: str = "en") -> str:
-        key = f"advice:{weather_data.temperature:.1f}:{weather_data.humidity:.0f}:{weather_data.wind_speed:.1f}:{weather_data.precipitation:.1f}:{locale}"
+        bucket = self._key_policy.bucket(weather_data)
+        key = self._key_policy.bucket_key(bucket, locale)
+        if self._table:
+            text = self._table.get(key)
+            if text is not None:
+                return text
         if self._cache:
             cached = await self._cache.get(key)
             if cached is not None:
                 return cached
-        text = await self._provider.get_advice(weather_data, locale)
+        text = await self._provider.get_advice(self._key_policy.representative(bucket), locale)
         if self._cache:
-            await self._cache.set(key, text)
+            await _store(self._cache, key, text, self._degraded_ttl)
         return text
+
+
+class StreamAdviceUseCase:
+    """Like GetAdvice, but a miss relays the model's text as it is generated.
+
+    Table and cache hits come back as a single chunk. If the stream fails or produces
+    nothing within `first_chunk_timeout_seconds`, `fallback` (local rules; `provider` when
+    not given) answers instead as DegradedAdvice, so the request does not wait on the model
+    a second time. Once chunks have been sent, a failure is raised to the caller.
+    """
+
+    def __init__(
+        self,
+        stream_provider: StreamingAdviceProvider | None,
+        provider: AdviceProvider,
+        cache: AdviceCache | None = None,
+        key_policy: AdviceKeyPolicy | None = None,
+        table: AdviceTable | None = None,
+        first_chunk_timeout_seconds: float = 3.0,
+        degraded_ttl_seconds: int = 60,
+        fallback: AdviceProvider | None = None,
+    ):
+        self._stream_provider = stream_provider
+        self._provider = provider
+        self._fallback = fallback
+        self._cache = cache
+        self._key_policy = key_policy or ExactKeyPolicy()
+        self._table = table
+        self._first_chunk_timeout = first_chunk_timeout_seconds
+        self._degraded_ttl = degraded_ttl_seconds
+
+    async def run(self, weather_data: WeatherData, locale: str = "en") -> AsyncIterator[str]:
+        bucket = self._key_policy.bucket(weather_data)
+        key = self._key_policy.bucket_key(bucket, locale)
+        text = self._table.get(key) if self._table else None
+        if text is None and self._cache:
+            text = await self._cache.get(key)
+        if text is not None:
+            yield text
+            return
+        weather_data = self._key_policy.representative(bucket)
+        parts: list[str] = []
+        if self._stream_provider is not None:
+            stream = self._stream_provider.stream_advice(weather_data, locale)
+            try:
+                first = await asyncio.wait_for(anext(stream), self._first_chunk_timeout)
+                parts.append(first)
+                yield first
+                async for chunk in stream:
+                    parts.append(chunk)
+                    yield chunk
+            except StopAsyncIteration:
+                pass
+            except asyncio.TimeoutError:
+                logger.warning(
+                    "Advice stream silent for %.1fs, answering in one piece",
+                    self._first_chunk_timeout,
+                )
+            except Exception as e:
+                if parts:
+                    raise
+                logger.warning("Advice stream failed before first chunk: %s", e)
+            finally:
+                await stream.aclose()
+        text = "".join(parts).strip()
+        if not parts:
+            if self._stream_provider is not None and self._fallback is not None:
+                text = DegradedAdvice(await self._fallback.get_advice(weather_data, locale))
+            else:
+                text = await self._provider.get_advice(weather_data, locale)
+            yield text
+        if text and self._cache:
+            await _store(self._cache, key, text, self._degraded_ttl)
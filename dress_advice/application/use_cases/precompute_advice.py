@@ -0,0 +1,67 @@
+"""PrecomputeAdvice use case: advice for every (weather bucket, locale) of a banded policy."""
+
+import asyncio
+import logging
+from collections.abc import Callable
+
+from dress_advice.application.advice_keys import BandedKeyPolicy
+from dress_advice.application.use_cases.get_advice import AdviceProvider
+
+logger = logging.getLogger(__name__)
+
+
+class PrecomputeAdviceUseCase:
+    def __init__(self, provider: AdviceProvider, policy: BandedKeyPolicy, concurrency: int = 8):
+        self._provider = provider
+        self._policy = policy
+        self._concurrency = concurrency
+
+    async def run(
+        self,
+        locales: list[str],
+        skip_keys: set[str],
+        on_batch: Callable[[list[tuple[str, str]]], None],
+        batch_size: int = 100,
+    ) -> tuple[int, int]:
+        """Generate missing advice, handing (key, text) rows to `on_batch` as they complete.
+
+        Returns (generated, failed). Failed buckets are logged and left for the next run.
+        """
+        todo = [
+            (self._policy.bucket_key(bucket, locale), bucket, locale)
+            for bucket in self._policy.grid()
+            for locale in locales
+        ]
+        todo = [item for item in todo if item[0] not in skip_keys]
+        logger.info("Precompute advice todo=%s skipped=%s", len(todo), len(skip_keys))
+        semaphore = asyncio.Semaphore(self._concurrency)
+        batch: list[tuple[str, str]] = []
+        generated = failed = 0
+
+        async def one(key, bucket, locale) -> tuple[str, str] | None:
+            async with semaphore:
+                try:
+                    text = await self._provider.get_advice(
+                        self._policy.representative(bucket), locale
+                    )
+                except Exception as e:
+                    logger.warning("Precompute advice failed key=%s: %s", key, e)
+                    return None
+            return (key, text) if text else None
+
+        def flush() -> None:
+            if batch:
+                on_batch(list(batch))
+                batch.clear()
+
+        for task in asyncio.as_completed([one(*item) for item in todo]):
+            row = await task
+            if row is None:
+                failed += 1
+                continue
+            generated += 1
+            batch.append(row)
+            if len(batch) >= batch_size:
+                flush()
+        flush()
+        return generated, failed
@@ -1,16 +1,19 @@
 """Dress Advice service settings (pydantic-settings)."""
 
 from pathlib import Path
+from typing import Literal
 
 from pydantic import Field
-from pydantic_settings import BaseSettings, SettingsConfigDict
+from pydantic_settings import SettingsConfigDict
+
+from shared.grpc_server import GrpcServerSettings
 
 # .env next to project root (parent of dress_advice package) so it's found regardless of cwd
 _PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
 _ENV_FILE = _PROJECT_ROOT / ".env"
 
 
-class Settings(BaseSettings):
+class Settings(GrpcServerSettings):
     model_config = SettingsConfigDict(
         env_prefix="DRESS_ADVICE_",
         env_file=_ENV_FILE if _ENV_FILE.exists() else None,
@@ -21,6 +24,47 @@ class Settings(BaseSettings):
     grpc_host: str = "0.0.0.0"  # nosec B104 - default for dev; override via env in prod
     grpc_port: int = 50052
     log_level: str = "INFO"
+    # Advice cache keys: "banded" (temperature bands, Beaufort wind, rain/humidity classes)
+    # or "exact" (one key per 0.1 °C reading)
+    advice_key_policy: Literal["exact", "banded"] = "banded"
+    advice_temperature_step: float = Field(default=3.0, gt=0)
+    # SQLite table from `python -m dress_advice.precompute`; loaded into memory at startup
+    advice_table_path: str = ""
+    precompute_locales: list[str] = ["en", "ru"]
+    precompute_concurrency: int = Field(default=8, ge=1)
+
+    # openai | local (rule tables) | fallback (local after timeout/error) | hedge (local
+    # races OpenAI once OpenAI is slower than advice_hedge_after_seconds) | deadline (a second
+    # OpenAI request after the p95 delay, local once advice_timeout_seconds passes)
+    advice_provider: Literal["openai", "local", "fallback", "hedge", "deadline"] = "deadline"
+    advice_timeout_seconds: float = Field(default=3.0, gt=0)
+    advice_hedge_after_seconds: float = Field(default=1.0, ge=0)
+    # deadline mode: hedge at this quantile of recent OpenAI latencies; 0 = fixed
+    # advice_hedge_after_seconds
+    advice_hedge_quantile: float = Field(default=0.95, ge=0, lt=1)
+    # Concurrent OpenAI misses within this window go out as one JSON completion; 0 = off
+    advice_batch_window_seconds: float = Field(default=0.025, ge=0)
+    advice_batch_max_size: int = Field(default=16, ge=1)
+    # Advice cache TTL for stand-in answers (local rules after an OpenAI timeout/error);
+    # normal answers keep the cache default. 0 = never cache them
+    advice_degraded_cache_ttl_seconds: int = Field(default=60, ge=0)
+    # Pre-fork: worker processes sharing grpc_port via SO_REUSEPORT (1 = single process)
+    workers: int = Field(default=1, ge=1)
+    # Prometheus /metrics port; 0 = disabled
+    metrics_port: int = 0
 
     openai_api_key: str = Field(default="", validation_alias="OPENAI_API_KEY")
     openai_http_proxy: str | None = Field(default=None, validation_alias="OPENAI_HTTP_PROXY")
+    openai_timeout_seconds: float = Field(
+        default=10.0, gt=0, validation_alias="OPENAI_TIMEOUT_SECONDS"
+    )
+    openai_max_retries: int = Field(default=2, ge=0, validation_alias="OPENAI_MAX_RETRIES")
+    # OpenAI-compatible endpoint override (e.g. the benchmarks stub server); empty = api.openai.com
+    openai_base_url: str = Field(default="", validation_alias="OPENAI_BASE_URL")
+    # httpx pool shared by all OpenAI calls; size max_connections for peak concurrent
+    # completions (scripts/load_openai_pool.py)
+    openai_max_connections: int = Field(default=100, ge=1)
+    openai_max_keepalive_connections: int = Field(default=50, ge=0)
+    openai_keepalive_expiry_seconds: float = Field(default=30.0, ge=0)
+    openai_connect_timeout_seconds: float = Field(default=5.0, gt=0)
+    openai_http2: bool = False
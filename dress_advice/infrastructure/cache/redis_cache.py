@@ -3,8 +3,18 @@
 import logging
 
 import redis.asyncio as redis
+from opentelemetry import trace
+from opentelemetry.trace import SpanKind
+
+from shared.metrics import CACHE_REQUESTS
 
 logger = logging.getLogger(__name__)
+tracer = trace.get_tracer(__name__)
+
+_DB = {"db.system": "redis", "dresscast.cache": "dress_advice"}
+_HITS = CACHE_REQUESTS.labels(cache="dress_advice", result="hit")
+_MISSES = CACHE_REQUESTS.labels(cache="dress_advice", result="miss")
+_ERRORS = CACHE_REQUESTS.labels(cache="dress_advice", result="error")
 
 
 class RedisAdviceCache:
@@ -21,13 +31,22 @@ class RedisAdviceCache:
     async def get(self, key: str) -> str | None:
         try:
             client = await self._get_client()
-            return await client.get(key)
+            with tracer.start_as_current_span("redis GET", kind=SpanKind.CLIENT, attributes=_DB):
+                text = await client.get(key)
         except Exception:
+            _ERRORS.inc()
             return None
+        (_MISSES if text is None else _HITS).inc()
+        return text
 
     async def set(self, key: str, text: str, ttl_seconds: int | None = None) -> None:
         try:
             client = await self._get_client()
-            await client.set(key, text, ex=ttl_seconds or self._ttl)
+            with tracer.start_as_current_span("redis SET", kind=SpanKind.CLIENT, attributes=_DB):
+                await client.set(key, text, ex=ttl_seconds or self._ttl)
         except Exception as e:
             logger.warning("Redis advice cache set failed key=%s: %s", key, e)
+
+    async def aclose(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
@@ -1,47 +1,172 @@
 """OpenAI-based advice provider (AdviceProvider)."""
 
+import json
 import logging
+from collections.abc import AsyncIterator
 
-from openai import AsyncOpenAI, DefaultAsyncHttpxClient
+import httpx
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient, Timeout
+from opentelemetry import trace
+from opentelemetry.trace import SpanKind
 
 from dress_advice.application.use_cases.get_advice import AdviceProvider, WeatherData
+from dress_advice.config.settings import Settings
 from dress_advice.domain.exceptions import AdviceProviderNotConfiguredError
+from shared.metrics import UpstreamTimer
 
 logger = logging.getLogger(__name__)
+tracer = trace.get_tracer(__name__)
+
+_MODEL = "gpt-4o-mini"
+_TOKENS_PER_ADVICE = 120
+
+
+def _describe(weather_data: WeatherData) -> str:
+    return (
+        f"temperature {weather_data.temperature}°C, humidity {weather_data.humidity}%, "
+        f"wind {weather_data.wind_speed} m/s, precipitation {weather_data.precipitation} mm"
+    )
+
+
+def _prompt(weather_data: WeatherData, locale: str) -> str:
+    return (
+        f"You are a friendly outfit advisor. Given: {_describe(weather_data)}. "
+        f"Reply in {locale} in 1-2 short, lively sentences. "
+        "Use 1-3 relevant emoji (weather/clothing, e.g. ☀️🧥☔️). Keep it concise and warm."
+    )
 
 
 class OpenAIAdviceProvider(AdviceProvider):
-    def __init__(self, api_key: str, proxy: str | None = None):
+    """One AsyncOpenAI client (and httpx connection pool) for the provider's lifetime."""
+
+    def __init__(
+        self,
+        api_key: str,
+        proxy: str | None = None,
+        timeout_seconds: float = 10.0,
+        max_retries: int = 2,
+        base_url: str | None = None,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 50,
+        keepalive_expiry_seconds: float = 30.0,
+        connect_timeout_seconds: float = 5.0,
+        http2: bool = False,
+    ):
         self._api_key = (api_key or "").strip()
         if self._api_key:
-            if proxy:
-                http_client = DefaultAsyncHttpxClient(proxy=proxy)
-                self._client = AsyncOpenAI(api_key=self._api_key, http_client=http_client)
-            else:
-                self._client = AsyncOpenAI(api_key=self._api_key)
+            timeout = Timeout(timeout_seconds, connect=connect_timeout_seconds)
+            http_client = DefaultAsyncHttpxClient(
+                proxy=proxy or None,
+                http2=http2,
+                limits=httpx.Limits(
+                    max_connections=max_connections,
+                    max_keepalive_connections=max_keepalive_connections,
+                    keepalive_expiry=keepalive_expiry_seconds,
+                ),
+                timeout=timeout,
+            )
+            self._client = AsyncOpenAI(
+                api_key=self._api_key,
+                base_url=base_url or None,
+                http_client=http_client,
+                timeout=timeout,
+                max_retries=max_retries,
+            )
         else:
             self._client = None
 
-    async def get_advice(self, weather_data: WeatherData, locale: str = "en") -> str:
+    async def aclose(self) -> None:
+        if self._client is not None:
+            await self._client.close()
+
+    def _require_client(self) -> AsyncOpenAI:
         if not self._api_key or self._client is None:
             raise AdviceProviderNotConfiguredError(
                 "OpenAI API key not set; set OPENAI_API_KEY to enable dress advice."
             )
+        return self._client
+
+    async def get_advice(self, weather_data: WeatherData, locale: str = "en") -> str:
+        client = self._require_client()
         logger.debug("OpenAI get_advice locale=%s", locale)
-        prompt = (
-            "You are a friendly outfit advisor. Given: "
-            f"temperature {weather_data.temperature}°C, humidity {weather_data.humidity}%, "
-            f"wind {weather_data.wind_speed} m/s, precipitation {weather_data.precipitation} mm. "
-            f"Reply in {locale} in 1-2 short, lively sentences. "
-            "Use 1-3 relevant emoji (weather/clothing, e.g. ☀️🧥☔️). Keep it concise and warm."
-        )
         try:
-            r = await self._client.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=[{"role": "user", "content": prompt}],
-                max_tokens=200,
-            )
+            async with UpstreamTimer("openai", "advice"):
+                with tracer.start_as_current_span("openai advice", kind=SpanKind.CLIENT):
+                    r = await client.chat.completions.create(
+                        model=_MODEL,
+                        messages=[{"role": "user", "content": _prompt(weather_data, locale)}],
+                        max_tokens=200,
+                    )
             return (r.choices[0].message.content or "").strip()
         except Exception as e:
             logger.exception("OpenAI get_advice failed locale=%s: %s", locale, e)
             raise
+
+    async def stream_advice(
+        self, weather_data: WeatherData, locale: str = "en"
+    ) -> AsyncIterator[str]:
+        """Yield advice text deltas as OpenAI streams them."""
+        client = self._require_client()
+        logger.debug("OpenAI stream_advice locale=%s", locale)
+        # Time until the response stream opens; the deltas follow at generation speed
+        async with UpstreamTimer("openai", "advice_stream"):
+            with tracer.start_as_current_span("openai advice_stream", kind=SpanKind.CLIENT):
+                stream = await client.chat.completions.create(
+                    model=_MODEL,
+                    messages=[{"role": "user", "content": _prompt(weather_data, locale)}],
+                    max_tokens=200,
+                    stream=True,
+                )
+        try:
+            async for event in stream:
+                if event.choices and event.choices[0].delta.content:
+                    yield event.choices[0].delta.content
+        finally:
+            await stream.close()
+
+    async def get_advice_batch(self, items: list[tuple[WeatherData, str]]) -> list[str]:
+        """Advice for several (weather, locale) pairs from one JSON-mode completion."""
+        client = self._require_client()
+        logger.debug("OpenAI get_advice_batch size=%s", len(items))
+        lines = "\n".join(
+            f"{i}. [{locale}] {_describe(wd)}" for i, (wd, locale) in enumerate(items, 1)
+        )
+        prompt = (
+            "You are a friendly outfit advisor. For each numbered weather reading below, "
+            "write advice in the language given in brackets: 1-2 short, lively sentences "
+            "with 1-3 relevant emoji (weather/clothing, e.g. ☀️🧥☔️). Keep it concise and warm.\n"
+            f'Return JSON {{"advice": [...]}} with exactly {len(items)} strings, '
+            "in the same order.\n"
+            f"{lines}"
+        )
+        try:
+            async with UpstreamTimer("openai", "advice_batch"):
+                with tracer.start_as_current_span("openai advice_batch", kind=SpanKind.CLIENT):
+                    r = await client.chat.completions.create(
+                        model=_MODEL,
+                        messages=[{"role": "user", "content": prompt}],
+                        max_tokens=_TOKENS_PER_ADVICE * len(items) + 20,
+                        response_format={"type": "json_object"},
+                    )
+            advice = json.loads(r.choices[0].message.content or "{}").get("advice")
+        except Exception as e:
+            logger.exception("OpenAI get_advice_batch failed size=%s: %s", len(items), e)
+            raise
+        if not isinstance(advice, list) or len(advice) != len(items):
+            raise ValueError(f"OpenAI batch returned {advice!r:.200} for {len(items)} items")
+        return [str(text).strip() for text in advice]
+
+
+def build_openai_provider(settings: Settings) -> OpenAIAdviceProvider:
+    return OpenAIAdviceProvider(
+        api_key=settings.openai_api_key,
+        proxy=settings.openai_http_proxy,
+        timeout_seconds=settings.openai_timeout_seconds,
+        max_retries=settings.openai_max_retries,
+        base_url=settings.openai_base_url,
+        max_connections=settings.openai_max_connections,
+        max_keepalive_connections=settings.openai_max_keepalive_connections,
+        keepalive_expiry_seconds=settings.openai_keepalive_expiry_seconds,
+        connect_timeout_seconds=settings.openai_connect_timeout_seconds,
+        http2=settings.openai_http2,
+    )
@@ -0,0 +1 @@
+# Local (rule-based) advice
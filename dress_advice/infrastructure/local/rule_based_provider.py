@@ -0,0 +1,54 @@
+"""Rule-based advice provider (AdviceProvider): JSON rule tables per locale, no network."""
+
+import json
+from pathlib import Path
+
+from dress_advice.application.use_cases.get_advice import AdviceProvider, WeatherData
+
+_RULES_DIR = Path(__file__).resolve().parent / "rules"
+
+# Sections in output order, mapped to the WeatherData field their min/max bounds apply to
+_SECTIONS = (
+    ("temperature", "temperature"),
+    ("precipitation", "precipitation"),
+    ("wind", "wind_speed"),
+    ("humidity", "humidity"),
+)
+
+
+def _matches(rule: dict, value: float, temperature: float) -> bool:
+    """Lower bounds are inclusive, upper bounds exclusive; absent bounds always pass."""
+    return (
+        value >= rule.get("min", value)
+        and ("max" not in rule or value < rule["max"])
+        and temperature >= rule.get("min_temperature", temperature)
+        and ("max_temperature" not in rule or temperature < rule["max_temperature"])
+    )
+
+
+class RuleBasedAdviceProvider(AdviceProvider):
+    """Deterministic advice: the first matching rule of each section, joined in order."""
+
+    def __init__(self, default_locale: str = "en"):
+        # Every table is read up front, so a request locale is only ever a dict key
+        self._tables = {
+            p.stem: json.loads(p.read_text(encoding="utf-8"))
+            for p in sorted(_RULES_DIR.glob("*.json"))
+        }
+        self._default_locale = default_locale
+
+    def advise(self, weather_data: WeatherData, locale: str = "en") -> str:
+        if locale not in self._tables:
+            locale = self._default_locale
+        rules = self._tables.get(locale, {})
+        parts = []
+        for section, field in _SECTIONS:
+            value = getattr(weather_data, field)
+            for rule in rules.get(section, []):
+                if _matches(rule, value, weather_data.temperature):
+                    parts.append(rule["text"])
+                    break
+        return " ".join(parts)
+
+    async def get_advice(self, weather_data: WeatherData, locale: str = "en") -> str:
+        return self.advise(weather_data, locale)
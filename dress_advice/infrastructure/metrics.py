@@ -0,0 +1,20 @@
+"""Prometheus metrics for Dress Advice."""
+
+from prometheus_client import Histogram
+
+ADVICE_PROVIDER_LATENCY = Histogram(
+    "dresscast_advice_provider_latency_seconds",
+    "Advice provider latency by outcome (primary, hedge, fallback, failed)",
+    ["outcome"],
+    buckets=(0.05, 0.1, 0.25, 0.5, 0.75, 1.0, 1.5, 2.0, 3.0, 5.0, 8.0, 13.0),
+)
+
+
+class PrometheusLatencyObserver:
+    """LatencyObserver backed by a labelled Prometheus histogram."""
+
+    def __init__(self, histogram: Histogram = ADVICE_PROVIDER_LATENCY):
+        self._histogram = histogram
+
+    def observe(self, outcome: str, seconds: float) -> None:
+        self._histogram.labels(outcome=outcome).observe(seconds)
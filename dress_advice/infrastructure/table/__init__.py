@@ -0,0 +1 @@
+# Precomputed advice table
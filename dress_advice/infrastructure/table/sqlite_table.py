@@ -0,0 +1,46 @@
+"""Precomputed advice table: SQLite file on disk, plain dict in memory (AdviceTable)."""
+
+import sqlite3
+from collections.abc import Iterable
+from contextlib import closing
+from pathlib import Path
+
+_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS advice (key TEXT PRIMARY KEY, text TEXT NOT NULL) WITHOUT ROWID"
+)
+
+
+class SqliteAdviceTable:
+    """Read-only advice lookup; the whole table is loaded at startup (a few thousand rows)."""
+
+    def __init__(self, entries: dict[str, str]):
+        self._entries = entries
+
+    @classmethod
+    def load(cls, path: str | Path) -> "SqliteAdviceTable":
+        with closing(sqlite3.connect(f"file:{path}?mode=ro", uri=True)) as conn:
+            return cls(dict(conn.execute("SELECT key, text FROM advice")))
+
+    def get(self, key: str) -> str | None:
+        return self._entries.get(key)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SqliteAdviceTableWriter:
+    """Appends generated advice; existing keys are kept so an interrupted run can resume."""
+
+    def __init__(self, path: str | Path):
+        self._conn = sqlite3.connect(path)
+        self._conn.execute(_SCHEMA)
+
+    def existing_keys(self) -> set[str]:
+        return {row[0] for row in self._conn.execute("SELECT key FROM advice")}
+
+    def write(self, rows: Iterable[tuple[str, str]]) -> None:
+        with self._conn:
+            self._conn.executemany("INSERT OR IGNORE INTO advice (key, text) VALUES (?, ?)", rows)
+
+    def close(self) -> None:
+        self._conn.close()
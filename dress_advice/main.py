@@ -12,48 +12,148 @@ if str(ROOT / "proto_gen") not in sys.path:
     sys.path.insert(0, str(ROOT / "proto_gen"))
 
 import dress_advice_pb2_grpc
-from grpc import aio
 
 from dress_advice.api.servicer import DressAdviceServicer
-from dress_advice.application.use_cases.get_advice import GetAdviceUseCase
+from dress_advice.application.advice_keys import build_key_policy
+from dress_advice.application.providers import (
+    BatchingAdviceProvider,
+    DeadlineAdviceProvider,
+    FallbackAdviceProvider,
+    HedgedAdviceProvider,
+)
+from dress_advice.application.use_cases.get_advice import (
+    AdviceProvider,
+    GetAdviceUseCase,
+    StreamAdviceUseCase,
+)
 from dress_advice.config.settings import Settings
 from dress_advice.infrastructure.cache.redis_cache import RedisAdviceCache
-from dress_advice.infrastructure.external.openai_provider import OpenAIAdviceProvider
+from dress_advice.infrastructure.external.openai_provider import (
+    OpenAIAdviceProvider,
+    build_openai_provider,
+)
+from dress_advice.infrastructure.local.rule_based_provider import RuleBasedAdviceProvider
+from dress_advice.infrastructure.metrics import PrometheusLatencyObserver
+from dress_advice.infrastructure.table.sqlite_table import SqliteAdviceTable
+from shared.grpc_server import create_server, serve_until_signal
+from shared.logging_setup import setup_logging
+from shared.metrics import start_metrics_server
+from shared.prefork import run_workers
+from shared.tracing import setup_tracing
 
 logger = logging.getLogger(__name__)
 
 
-def main() -> None:
-    settings = Settings()
-    logging.basicConfig(
-        level=getattr(logging, settings.log_level.upper(), logging.INFO),
-        format="%(asctime)s %(levelname)s [%(name)s] %(message)s",
-    )
-    provider = OpenAIAdviceProvider(
-        api_key=settings.openai_api_key,
-        proxy=settings.openai_http_proxy,
-    )
+def _build_provider(
+    settings: Settings, openai: OpenAIAdviceProvider, local: AdviceProvider
+) -> AdviceProvider:
+    if settings.advice_provider == "local":
+        return local
+    primary: AdviceProvider = openai
+    if settings.advice_batch_window_seconds > 0:
+        primary = BatchingAdviceProvider(
+            primary, settings.advice_batch_window_seconds, settings.advice_batch_max_size
+        )
+    if settings.advice_provider == "fallback":
+        return FallbackAdviceProvider(primary, local, settings.advice_timeout_seconds)
+    if settings.advice_provider == "hedge":
+        return HedgedAdviceProvider(primary, local, settings.advice_hedge_after_seconds)
+    if settings.advice_provider == "deadline":
+        return DeadlineAdviceProvider(
+            primary,
+            local,
+            deadline_seconds=settings.advice_timeout_seconds,
+            hedge_after_seconds=settings.advice_hedge_after_seconds,
+            hedge_quantile=settings.advice_hedge_quantile or None,
+            observer=PrometheusLatencyObserver(),
+        )
+    return primary
+
+
+def _serve(settings: Settings, worker: int = 0) -> None:
+    """Build the service and serve until SIGTERM/SIGINT (alone or as pre-fork worker `worker`)."""
+    setup_logging(settings.log_level, "dress_advice")
+    setup_tracing("dress_advice")
+    openai = build_openai_provider(settings)
+    local = RuleBasedAdviceProvider()
+    provider = _build_provider(settings, openai, local)
 
     try:
         cache = RedisAdviceCache(settings.redis_url)
     except Exception:
         cache = None
         logger.warning("Redis unavailable, running without cache")
-    get_advice_uc = GetAdviceUseCase(provider, cache)
-    servicer = DressAdviceServicer(get_advice_uc)
+    key_policy = build_key_policy(settings.advice_key_policy, settings.advice_temperature_step)
+    table = None
+    if settings.advice_table_path:
+        if settings.advice_key_policy != "banded":
+            logger.warning("Advice table needs advice_key_policy=banded; table not loaded")
+        else:
+            table = SqliteAdviceTable.load(settings.advice_table_path)
+            logger.info("Loaded advice table entries=%s", len(table))
+    get_advice_uc = GetAdviceUseCase(
+        provider,
+        cache,
+        key_policy,
+        table,
+        degraded_ttl_seconds=settings.advice_degraded_cache_ttl_seconds,
+    )
+    streams = settings.advice_provider != "local" and bool(settings.openai_api_key.strip())
+    stream_advice_uc = StreamAdviceUseCase(
+        openai if streams else None,
+        provider,
+        cache,
+        key_policy,
+        table,
+        first_chunk_timeout_seconds=settings.advice_timeout_seconds,
+        degraded_ttl_seconds=settings.advice_degraded_cache_ttl_seconds,
+        # The stream already spent advice_timeout_seconds; don't start another OpenAI call
+        fallback=local,
+    )
+    servicer = DressAdviceServicer(get_advice_uc, stream_advice_uc)
+
+    # Pre-fork workers each export their own registry on metrics_port + worker
+    start_metrics_server(settings.metrics_port and settings.metrics_port + worker, "Dress Advice")
 
     async def serve() -> None:
-        server = aio.server()
+        server = create_server(settings, reuse_port=settings.workers > 1)
         dress_advice_pb2_grpc.add_DressAdviceServiceServicer_to_server(servicer, server)
         server.add_insecure_port(f"{settings.grpc_host}:{settings.grpc_port}")
         await server.start()
         logger.info(
-            "Dress Advice gRPC server listening on %s:%s", settings.grpc_host, settings.grpc_port
+            "Dress Advice gRPC server listening on %s:%s worker=%s",
+            settings.grpc_host,
+            settings.grpc_port,
+            worker,
         )
-        await server.wait_for_termination()
+        try:
+            await serve_until_signal(server, settings.grpc_server_shutdown_grace_seconds)
+        finally:
+            await openai.aclose()
+            if cache is not None:
+                await cache.aclose()
 
     asyncio.run(serve())
 
 
+def run_worker(index: int) -> None:
+    _serve(Settings(), index)
+
+
+def main() -> None:
+    settings = Settings()
+    if settings.workers > 1:
+        setup_logging(settings.log_level, "dress_advice")
+        sys.exit(
+            run_workers(
+                "dress_advice.main:run_worker",
+                settings.workers,
+                "dress_advice",
+                settings.grpc_server_shutdown_grace_seconds,
+            )
+        )
+    _serve(settings)
+
+
 if __name__ == "__main__":
     main()
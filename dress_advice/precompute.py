@@ -0,0 +1,59 @@
+"""Offline job: generate advice for the whole weather grid into an SQLite table.
+
+Run from project root (resumable; existing keys are skipped):
+    python -m dress_advice.precompute --out advice_table.sqlite
+Then set DRESS_ADVICE_ADVICE_TABLE_PATH to the file.
+"""
+
+import argparse
+import asyncio
+import logging
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from dress_advice.application.advice_keys import BandedKeyPolicy
+from dress_advice.application.use_cases.precompute_advice import PrecomputeAdviceUseCase
+from dress_advice.config.settings import Settings
+from dress_advice.infrastructure.external.openai_provider import build_openai_provider
+from dress_advice.infrastructure.table.sqlite_table import SqliteAdviceTableWriter
+from shared.logging_setup import setup_logging
+
+logger = logging.getLogger(__name__)
+
+
+def main() -> None:
+    settings = Settings()
+    parser = argparse.ArgumentParser(description="Precompute dress advice table")
+    parser.add_argument("--out", default=settings.advice_table_path or "advice_table.sqlite")
+    parser.add_argument("--locales", default=",".join(settings.precompute_locales))
+    parser.add_argument("--concurrency", type=int, default=settings.precompute_concurrency)
+    args = parser.parse_args()
+    setup_logging(settings.log_level, "dress_advice")
+    provider = build_openai_provider(settings)
+    policy = BandedKeyPolicy(settings.advice_temperature_step)
+    use_case = PrecomputeAdviceUseCase(provider, policy, args.concurrency)
+    locales = [loc.strip() for loc in args.locales.split(",") if loc.strip()]
+    writer = SqliteAdviceTableWriter(args.out)
+    started = time.perf_counter()
+    try:
+        generated, failed = asyncio.run(
+            use_case.run(locales, writer.existing_keys(), on_batch=writer.write)
+        )
+    finally:
+        writer.close()
+    logger.info(
+        "Advice table %s: generated=%s failed=%s in %.1fs",
+        args.out,
+        generated,
+        failed,
+        time.perf_counter() - started,
+    )
+
+
+if __name__ == "__main__":
+    main()
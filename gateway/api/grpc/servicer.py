@@ -28,12 +28,14 @@ class GatewayServicer(gateway_pb2_grpc.GatewayServiceServicer):
         list_cities_uc,
         add_city_uc,
         get_or_create_telegram_uc,
+        stream_dress_advice_uc=None,
     ):
         self._get_forecast = get_forecast_uc
         self._get_dress_advice = get_dress_advice_uc
         self._list_cities = list_cities_uc
         self._add_city = add_city_uc
         self._get_or_create_telegram = get_or_create_telegram_uc
+        self._stream_dress_advice = stream_dress_advice_uc
 
     def _set_error(self, context, code: str, grpc_code: grpc.StatusCode, locale: str = "en"):
         context.set_code(grpc_code)
@@ -119,6 +121,48 @@ class GatewayServicer(gateway_pb2_grpc.GatewayServiceServicer):
             context.set_details(str(e))
             return gateway_pb2.GetDressAdviceResponse(advice_text="")
 
+    async def StreamDressAdvice(self, request, context):
+        logger.info(
+            "StreamDressAdvice user_id=%s city_name=%s locale=%s",
+            request.user_id,
+            request.city_name,
+            request.locale or "en",
+        )
+        if self._stream_dress_advice is None:
+            context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+            context.set_details("StreamDressAdvice not configured")
+            return
+        try:
+            async for text in self._stream_dress_advice.run(
+                request.user_id,
+                request.city_name,
+                request.date or "",
+                request.time or "",
+                request.locale or "en",
+            ):
+                yield gateway_pb2.DressAdviceChunk(text=text)
+        except ValueError as e:
+            if "CITY_NOT_FOUND" in str(e):
+                logger.warning(
+                    "StreamDressAdvice CITY_NOT_FOUND user_id=%s city_name=%s",
+                    request.user_id,
+                    request.city_name,
+                )
+                self._set_error(context, "CITY_NOT_FOUND", grpc.StatusCode.NOT_FOUND)
+            else:
+                logger.warning("StreamDressAdvice ValueError user_id=%s: %s", request.user_id, e)
+                context.set_code(grpc.StatusCode.UNKNOWN)
+                context.set_details(str(e))
+        except Exception as e:
+            logger.exception(
+                "StreamDressAdvice failed user_id=%s city_name=%s: %s",
+                request.user_id,
+                request.city_name,
+                e,
+            )
+            context.set_code(grpc.StatusCode.INTERNAL)
+            context.set_details(str(e))
+
     async def ListUserCities(self, request, context):
         logger.info("ListUserCities user_id=%s", request.user_id)
         try:
@@ -0,0 +1,54 @@
+"""HTTP request metrics for the gateway (pure ASGI middleware, streaming-safe)."""
+
+import time
+
+from prometheus_client import Counter, Histogram
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from shared.metrics import LATENCY_BUCKETS
+
+HTTP_REQUESTS = Counter(
+    "dresscast_http_requests_total",
+    "HTTP requests handled by the gateway by method, route template and status",
+    ["method", "route", "status"],
+)
+HTTP_LATENCY = Histogram(
+    "dresscast_http_request_seconds",
+    "Gateway HTTP request duration by method and route template",
+    ["method", "route"],
+    buckets=LATENCY_BUCKETS,
+)
+
+
+class PrometheusMiddleware:
+    """Records count and duration per route template (`/api/v2/forecast/{city_id}`).
+
+    Paths that matched no route are labelled `unmatched` to keep label cardinality bounded.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        started = time.perf_counter()
+        status = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            route = scope.get("route")
+            template = getattr(route, "path", "unmatched")
+            method = scope["method"]
+            HTTP_LATENCY.labels(method=method, route=template).observe(
+                time.perf_counter() - started
+            )
+            HTTP_REQUESTS.labels(method=method, route=template, status=str(status)).inc()
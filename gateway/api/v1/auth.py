@@ -2,45 +2,43 @@
 
 import logging
 
-import bcrypt
+import grpc
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
 
 logger = logging.getLogger(__name__)
 
-import users_pb2
-
 from gateway.api.v1.auth_service import AuthService
+from gateway.api.v1.errors import SERVICE_OVERLOADED, SERVICE_UNAVAILABLE, message_for_code
 from gateway.api.v1.schemas.auth import LoginBody, RegisterBody, RegisterResponse, TokenResponse
-from gateway.application.use_cases.users import CreateUserUseCase
-from gateway.config.settings import Settings
-from gateway.deps import get_settings
-from gateway.infrastructure.grpc_clients.clients import users_stub
+from gateway.container import UseCases
+from gateway.deps import get_auth_service, get_password_hasher, get_use_cases
+from shared.password_hashing import PasswordHasher
 
 router = APIRouter(prefix="/auth", tags=["auth"])
 
-# bcrypt limits password to 72 bytes
-_MAX_PASSWORD_BYTES = 72
-
-
-def _hash_password(password: str) -> str:
-    raw = password.encode("utf-8")[:_MAX_PASSWORD_BYTES]
-    return bcrypt.hashpw(raw, bcrypt.gensalt()).decode("utf-8")
-
-
-def _auth_service(settings: Settings) -> AuthService:
-    return AuthService(settings)
+# Statuses Users returns for a wrong password or unknown user (see users/api/errors.py)
+_CREDENTIAL_ERRORS = frozenset(
+    {
+        grpc.StatusCode.UNAUTHENTICATED,
+        grpc.StatusCode.NOT_FOUND,
+        grpc.StatusCode.INVALID_ARGUMENT,
+    }
+)
 
 
 @router.post("/register", response_model=RegisterResponse)
 async def register(
     body: RegisterBody,
-    settings: Settings = Depends(get_settings),
+    auth: AuthService = Depends(get_auth_service),
+    use_cases: UseCases = Depends(get_use_cases),
+    hasher: PasswordHasher = Depends(get_password_hasher),
 ):
-    uc = CreateUserUseCase(settings.users_grpc_addr)
-    password_hash = _hash_password(body.password)
+    password_hash = await hasher.hash(body.password)
     try:
-        result = await uc.run(username=body.username, password_hash=password_hash)
+        result = await use_cases.create_user.run(
+            username=body.username, password_hash=password_hash
+        )
     except Exception as e:
         if "already exists" in str(e).lower():
             logger.warning("register failed: username already exists username=%s", body.username)
@@ -50,7 +48,6 @@ async def register(
             ) from e
         raise
     user = result.user
-    auth = AuthService(settings)
     token = auth.create_token(user.id, user.username, user.is_admin)
     logger.info("register success user_id=%s username=%s", user.id, user.username)
     return RegisterResponse(
@@ -60,28 +57,52 @@ async def register(
     )
 
 
-@router.post("/login", response_model=TokenResponse)
-async def login(
-    body: LoginBody,
-    settings: Settings = Depends(get_settings),
-):
-    u = await users_stub(settings.users_grpc_addr)
+async def _verify_credentials(use_cases: UseCases, username: str, password: str, action: str):
+    """User for valid credentials; 401 for bad ones, 429 when Users sheds load and 503 when
+    it is unreachable. Any other failure propagates as a server error, not a 401."""
     try:
-        user = await u.GetUserByUsername(users_pb2.GetUserByUsernameRequest(username=body.username))
-    except Exception as err:
-        logger.warning("login failed: invalid credentials username=%s", body.username)
+        user = await use_cases.verify_credentials.run(username, password)
+    except grpc.RpcError as err:
+        code = err.code()
+        if code == grpc.StatusCode.RESOURCE_EXHAUSTED:
+            logger.warning(
+                "%s throttled: credential checks overloaded username=%s", action, username
+            )
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail=message_for_code(SERVICE_OVERLOADED),
+                headers={"Retry-After": "1"},
+            ) from err
+        if code == grpc.StatusCode.UNAVAILABLE:
+            logger.warning("%s failed: users service unavailable username=%s", action, username)
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail=message_for_code(SERVICE_UNAVAILABLE),
+                headers={"Retry-After": "1"},
+            ) from err
+        if code not in _CREDENTIAL_ERRORS:
+            raise
+        logger.warning("%s failed: invalid credentials username=%s", action, username)
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid credentials",
         ) from err
     if not user.id:
-        logger.warning("login failed: user not found username=%s", body.username)
+        logger.warning("%s failed: user not found username=%s", action, username)
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid credentials",
         )
-    # We don't have password in response - in real flow Gateway would verify via separate call or Users would expose VerifyPassword
-    auth = AuthService(settings)
+    return user
+
+
+@router.post("/login", response_model=TokenResponse)
+async def login(
+    body: LoginBody,
+    auth: AuthService = Depends(get_auth_service),
+    use_cases: UseCases = Depends(get_use_cases),
+):
+    user = await _verify_credentials(use_cases, body.username, body.password, "login")
     token = auth.create_token(user.id, user.username, user.is_admin)
     logger.info("login success user_id=%s username=%s", user.id, user.username)
     return TokenResponse(access_token=token, token_type="bearer")  # nosec B106 - OAuth2 token type
@@ -90,27 +111,11 @@ async def login(
 @router.post("/token", response_model=TokenResponse)
 async def token(
     form_data: OAuth2PasswordRequestForm = Depends(),
-    settings: Settings = Depends(get_settings),
+    auth: AuthService = Depends(get_auth_service),
+    use_cases: UseCases = Depends(get_use_cases),
 ):
     """OAuth2 password flow: form-urlencoded username/password, returns access_token for Bearer."""
-    u = await users_stub(settings.users_grpc_addr)
-    try:
-        user = await u.GetUserByUsername(
-            users_pb2.GetUserByUsernameRequest(username=form_data.username)
-        )
-    except Exception as err:
-        logger.warning("token failed: invalid credentials username=%s", form_data.username)
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid credentials",
-        ) from err
-    if not user.id:
-        logger.warning("token failed: user not found username=%s", form_data.username)
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid credentials",
-        )
-    auth = AuthService(settings)
+    user = await _verify_credentials(use_cases, form_data.username, form_data.password, "token")
     token_str = auth.create_token(user.id, user.username, user.is_admin)
     logger.info("token success user_id=%s username=%s", user.id, user.username)
     return TokenResponse(access_token=token_str, token_type="bearer")  # nosec B106
@@ -1,5 +1,9 @@
 """AuthService: JWT create/verify, get_current_user. AccessPolicy: require_admin, require_same_user_or_admin."""
 
+import hashlib
+import threading
+import time
+from collections import OrderedDict
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from typing import Annotated
@@ -18,11 +22,48 @@ class CurrentUser:
     is_admin: bool
 
 
+class _VerifiedTokens:
+    """Bounded LRU: sha256(token) -> (CurrentUser, exp). Entries are dropped once expired."""
+
+    def __init__(self, max_size: int):
+        self._max_size = max_size
+        self._entries: OrderedDict[bytes, tuple[CurrentUser, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: bytes, now: float) -> CurrentUser | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[1] <= now:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry[0]
+
+    def put(self, key: bytes, user: CurrentUser, exp: float) -> None:
+        if self._max_size <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (user, exp)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
 class AuthService:
-    def __init__(self, settings: Settings):
+    """One per process: verified tokens are remembered until their `exp`, so repeat
+    requests with the same bearer token skip HMAC verification and claim parsing."""
+
+    def __init__(self, settings: Settings, clock=time.time):
         self._secret = settings.jwt_secret
         self._algorithm = settings.jwt_algorithm
         self._expire_minutes = settings.jwt_expire_minutes
+        self._clock = clock
+        self._verified = _VerifiedTokens(settings.jwt_cache_size)
 
     def create_token(self, user_id: int, username: str, is_admin: bool) -> str:
         now = datetime.now(timezone.utc)
@@ -36,9 +77,18 @@ class AuthService:
         return jwt.encode(payload, self._secret, algorithm=self._algorithm)
 
     def decode_token(self, token: str) -> CurrentUser:
+        key = hashlib.sha256(token.encode("utf-8")).digest()
+        cached = self._verified.get(key, self._clock())
+        if cached is not None:
+            return cached
         try:
-            payload = jwt.decode(token, self._secret, algorithms=[self._algorithm])
-            return CurrentUser(
+            payload = jwt.decode(
+                token,
+                self._secret,
+                algorithms=[self._algorithm],
+                options={"require": ["exp"]},
+            )
+            user = CurrentUser(
                 user_id=int(payload["sub"]),
                 username=payload["username"],
                 is_admin=payload.get("is_admin", False),
@@ -48,6 +98,8 @@ class AuthService:
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Invalid or expired token",
             ) from e
+        self._verified.put(key, user, float(payload["exp"]))
+        return user
 
     def get_current_user(
         self,
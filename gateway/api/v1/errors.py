@@ -8,6 +8,7 @@ USER_NOT_FOUND = "USER_NOT_FOUND"
 INVALID_CREDENTIALS = "INVALID_CREDENTIALS"
 VALIDATION_ERROR = "VALIDATION_ERROR"
 SERVICE_UNAVAILABLE = "SERVICE_UNAVAILABLE"
+SERVICE_OVERLOADED = "SERVICE_OVERLOADED"
 
 
 @dataclass
@@ -24,5 +25,9 @@ def message_for_code(code: str, locale: str = "en") -> str:
         INVALID_CREDENTIALS: {"en": "Invalid credentials", "ru": "Неверные данные"},
         VALIDATION_ERROR: {"en": "Validation error", "ru": "Ошибка проверки"},
         SERVICE_UNAVAILABLE: {"en": "Service unavailable", "ru": "Сервис недоступен"},
+        SERVICE_OVERLOADED: {
+            "en": "Too many requests, retry later",
+            "ru": "Слишком много запросов, повторите позже",
+        },
     }
     return messages.get(code, {}).get(locale, messages.get(code, {}).get("en", code))
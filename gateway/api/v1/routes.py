@@ -10,26 +10,22 @@ logger = logging.getLogger(__name__)
 from gateway.api.v1.schemas.cities import AddCityBody, CityResponse, ListCitiesResponse
 from gateway.api.v1.schemas.dress_advice import DressAdviceResponse
 from gateway.api.v1.schemas.weather import CurrentWeatherResponse, ForecastResponse
-from gateway.application.use_cases.cities import AddCityUseCase, ListUserCitiesUseCase
-from gateway.application.use_cases.dress_advice import GetDressAdviceForUserCityUseCase
-from gateway.application.use_cases.forecast import GetForecastForUserCityUseCase
-from gateway.config.settings import Settings
+from gateway.container import UseCases
 
 router = APIRouter(prefix="/api/v1", tags=["api"])
 
 ALLOWED_FORECAST_FIELDS = {"temperature", "humidity", "wind_speed", "precipitation", "time"}
 
 
-from gateway.deps import get_settings
+from gateway.deps import get_use_cases
 
 
 @router.get("/users/{user_id}/cities", response_model=ListCitiesResponse)
 async def list_cities(
     user_id: int,
-    settings: Settings = Depends(get_settings),
+    use_cases: UseCases = Depends(get_use_cases),
 ):
-    uc = ListUserCitiesUseCase(settings.users_grpc_addr)
-    result = await uc.run(user_id)
+    result = await use_cases.list_cities.run(user_id)
     logger.info("list_cities user_id=%s count=%s", user_id, len(result.cities))
     return ListCitiesResponse(
         cities=[
@@ -43,10 +39,9 @@ async def list_cities(
 async def add_city(
     user_id: int,
     body: AddCityBody,
-    settings: Settings = Depends(get_settings),
+    use_cases: UseCases = Depends(get_use_cases),
 ):
-    uc = AddCityUseCase(settings.users_grpc_addr)
-    result = await uc.run(user_id, body.name, body.lat, body.lon)
+    result = await use_cases.add_city.run(user_id, body.name, body.lat, body.lon)
     logger.info("add_city user_id=%s name=%s id=%s", user_id, body.name, result.id)
     return CityResponse(
         id=result.id,
@@ -76,12 +71,11 @@ async def get_forecast(
         None,
         description="Comma-separated: temperature, humidity, wind_speed, precipitation, time. Omit = all.",
     ),
-    settings: Settings = Depends(get_settings),
+    use_cases: UseCases = Depends(get_use_cases),
 ):
     if not date:
         date = date_type.today().isoformat()
-    uc = GetForecastForUserCityUseCase(settings.users_grpc_addr, settings.weather_grpc_addr)
-    result = await uc.run(user_id, city_name, date, time)
+    result = await use_cases.get_forecast.run(user_id, city_name, date, time)
     d = result.data
     if fields is not None and fields.strip():
         requested = {f.strip().lower() for f in fields.split(",") if f.strip()}
@@ -110,13 +104,8 @@ async def get_dress_advice(
     date: str = "",
     time: str = "",
     locale: str = "en",
-    settings: Settings = Depends(get_settings),
+    use_cases: UseCases = Depends(get_use_cases),
 ):
-    uc = GetDressAdviceForUserCityUseCase(
-        settings.users_grpc_addr,
-        settings.weather_grpc_addr,
-        settings.dress_advice_grpc_addr,
-    )
-    result = await uc.run(user_id, city_name, date, time, locale)
+    result = await use_cases.get_dress_advice.run(user_id, city_name, date, time, locale)
     logger.info("get_dress_advice user_id=%s city_name=%s locale=%s", user_id, city_name, locale)
     return DressAdviceResponse(advice_text=result.advice_text)
@@ -19,3 +19,28 @@ class AddCityBody(BaseModel):
 
 class ListCitiesResponse(BaseModel):
     cities: list[CityResponse]
+
+
+class ImportCityRow(BaseModel):
+    user_id: int
+    name: str
+    lat: float
+    lon: float
+
+
+class ImportCitiesBody(BaseModel):
+    rows: list[ImportCityRow]
+
+
+class ImportCityError(BaseModel):
+    row_index: int
+    code: str
+    message: str
+
+
+class ImportCitiesResponse(BaseModel):
+    received_count: int
+    imported_count: int
+    errors: list[ImportCityError]
+    elapsed_seconds: float
+    rows_per_second: float
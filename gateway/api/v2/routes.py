@@ -1,27 +1,34 @@
 """REST API v2: all endpoints require Bearer token; user from JWT, no user_id in URL."""
 
 import logging
+from collections.abc import Awaitable, Callable
 from datetime import date as date_type
 
 import grpc
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from pydantic import BaseModel
 
-from gateway.api.v1.auth_service import CurrentUser
+from gateway.api.v1.auth_service import AuthService, CurrentUser
 from gateway.api.v1.errors import CITY_NOT_FOUND, message_for_code
-from gateway.api.v1.schemas.cities import AddCityBody, CityResponse, ListCitiesResponse
+from gateway.api.v1.schemas.cities import (
+    AddCityBody,
+    CityResponse,
+    ImportCitiesBody,
+    ImportCitiesResponse,
+    ImportCityError,
+    ListCitiesResponse,
+)
 from gateway.api.v1.schemas.dress_advice import DressAdviceResponse
 from gateway.api.v1.schemas.users import UserResponse
 from gateway.api.v1.schemas.weather import CurrentWeatherResponse, ForecastResponse
-from gateway.application.use_cases.cities import (
-    AddCityUseCase,
-    GetCityUseCase,
-    ListUserCitiesUseCase,
+from gateway.container import UseCases
+from gateway.deps import (
+    get_auth_service,
+    get_current_user,
+    get_response_cache,
+    get_use_cases,
 )
-from gateway.application.use_cases.dress_advice import GetDressAdviceForUserCityUseCase
-from gateway.application.use_cases.forecast import GetForecastForUserCityUseCase
-from gateway.application.use_cases.users import GetUserByIdUseCase
-from gateway.config.settings import Settings
-from gateway.deps import get_current_user, get_settings
+from gateway.infrastructure.cache.response_cache import CachedResponse, ResponseCache
 
 logger = logging.getLogger(__name__)
 
@@ -30,13 +37,46 @@ router = APIRouter(prefix="/api/v2", tags=["api-v2"])
 ALLOWED_FORECAST_FIELDS = {"temperature", "humidity", "wind_speed", "precipitation", "time"}
 
 
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    tags = {t.strip().removeprefix("W/") for t in if_none_match.split(",")}
+    return "*" in tags or etag in tags
+
+
+def _cached_response(request: Request, entry: CachedResponse, cache: ResponseCache) -> Response:
+    headers = {
+        "ETag": entry.etag,
+        "Cache-Control": f"private, max-age={entry.max_age(cache.now())}",
+    }
+    if _etag_matches(request.headers.get("if-none-match"), entry.etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=entry.body, media_type="application/json", headers=headers)
+
+
+async def _serve_cached(
+    request: Request,
+    cache: ResponseCache,
+    key: tuple,
+    build: Callable[[], Awaitable[BaseModel]],
+    exclude_none: bool = False,
+) -> Response:
+    """Serve `key` from the response cache, or build, store and serve it (errors are not cached)."""
+    entry = cache.get(key)
+    if entry is None:
+        model = await build()
+        entry = cache.set(key, model.model_dump_json(exclude_none=exclude_none).encode())
+    else:
+        logger.debug("v2 response cache hit key=%s", key)
+    return _cached_response(request, entry, cache)
+
+
 @router.get("/me", response_model=UserResponse)
 async def get_me(
     current_user: CurrentUser = Depends(get_current_user),
-    settings: Settings = Depends(get_settings),
+    use_cases: UseCases = Depends(get_use_cases),
 ):
-    uc = GetUserByIdUseCase(settings.users_grpc_addr)
-    user = await uc.run(current_user.user_id)
+    user = await use_cases.get_user_by_id.run(current_user.user_id)
     logger.info("v2 get_me user_id=%s", current_user.user_id)
     return UserResponse(
         id=user.id,
@@ -50,11 +90,10 @@ async def get_me(
 async def get_city(
     city_name: str,
     current_user: CurrentUser = Depends(get_current_user),
-    settings: Settings = Depends(get_settings),
+    use_cases: UseCases = Depends(get_use_cases),
 ):
-    uc = GetCityUseCase(settings.users_grpc_addr)
     try:
-        city = await uc.run(current_user.user_id, city_name)
+        city = await use_cases.get_city.run(current_user.user_id, city_name)
     except grpc.RpcError as e:
         if e.code() == grpc.StatusCode.NOT_FOUND:
             raise HTTPException(
@@ -75,10 +114,9 @@ async def get_city(
 @router.get("/cities", response_model=ListCitiesResponse)
 async def list_cities(
     current_user: CurrentUser = Depends(get_current_user),
-    settings: Settings = Depends(get_settings),
+    use_cases: UseCases = Depends(get_use_cases),
 ):
-    uc = ListUserCitiesUseCase(settings.users_grpc_addr)
-    result = await uc.run(current_user.user_id)
+    result = await use_cases.list_cities.run(current_user.user_id)
     logger.info("v2 list_cities user_id=%s count=%s", current_user.user_id, len(result.cities))
     return ListCitiesResponse(
         cities=[
@@ -92,10 +130,9 @@ async def list_cities(
 async def add_city(
     body: AddCityBody,
     current_user: CurrentUser = Depends(get_current_user),
-    settings: Settings = Depends(get_settings),
+    use_cases: UseCases = Depends(get_use_cases),
 ):
-    uc = AddCityUseCase(settings.users_grpc_addr)
-    result = await uc.run(current_user.user_id, body.name, body.lat, body.lon)
+    result = await use_cases.add_city.run(current_user.user_id, body.name, body.lat, body.lon)
     logger.info("v2 add_city user_id=%s name=%s id=%s", current_user.user_id, body.name, result.id)
     return CityResponse(
         id=result.id,
@@ -106,6 +143,35 @@ async def add_city(
     )
 
 
+@router.post("/admin/cities/import", response_model=ImportCitiesResponse)
+async def import_cities(
+    body: ImportCitiesBody,
+    current_user: CurrentUser = Depends(get_current_user),
+    auth: AuthService = Depends(get_auth_service),
+    use_cases: UseCases = Depends(get_use_cases),
+):
+    """Bulk-load cities for any users (admin only); per-row errors are reported, not raised."""
+    auth.require_admin(current_user)
+    result = await use_cases.import_cities.run(body.rows)
+    logger.info(
+        "v2 import_cities user_id=%s received=%s imported=%s errors=%s",
+        current_user.user_id,
+        result.received_count,
+        result.imported_count,
+        len(result.errors),
+    )
+    return ImportCitiesResponse(
+        received_count=result.received_count,
+        imported_count=result.imported_count,
+        errors=[
+            ImportCityError(row_index=e.row_index, code=e.code, message=e.message)
+            for e in result.errors
+        ],
+        elapsed_seconds=result.elapsed_seconds,
+        rows_per_second=result.rows_per_second,
+    )
+
+
 @router.get(
     "/forecast",
     response_model=ForecastResponse,
@@ -115,6 +181,7 @@ async def add_city(
     "Use `fields` to request only specific parameters: temperature, humidity, wind_speed, precipitation, time.",
 )
 async def get_forecast(
+    request: Request,
     city_name: str,
     current_user: CurrentUser = Depends(get_current_user),
     time: str = Query(
@@ -125,54 +192,66 @@ async def get_forecast(
         None,
         description="Comma-separated: temperature, humidity, wind_speed, precipitation, time. Omit = all.",
     ),
-    settings: Settings = Depends(get_settings),
+    use_cases: UseCases = Depends(get_use_cases),
+    cache: ResponseCache = Depends(get_response_cache),
 ):
     if not date:
         date = date_type.today().isoformat()
-    uc = GetForecastForUserCityUseCase(settings.users_grpc_addr, settings.weather_grpc_addr)
-    result = await uc.run(current_user.user_id, city_name, date, time)
-    d = result.data
     if fields is not None and fields.strip():
         requested = {f.strip().lower() for f in fields.split(",") if f.strip()}
         requested &= ALLOWED_FORECAST_FIELDS
     else:
         requested = ALLOWED_FORECAST_FIELDS
-    data = CurrentWeatherResponse()
-    if "temperature" in requested:
-        data.temperature = d.temperature
-    if "humidity" in requested:
-        data.humidity = d.humidity
-    if "wind_speed" in requested:
-        data.wind_speed = d.wind_speed
-    if "precipitation" in requested:
-        data.precipitation = d.precipitation
-    if "time" in requested:
-        data.time = d.time or ""
+
+    async def build() -> ForecastResponse:
+        result = await use_cases.get_forecast.run(current_user.user_id, city_name, date, time)
+        d = result.data
+        data = CurrentWeatherResponse()
+        if "temperature" in requested:
+            data.temperature = d.temperature
+        if "humidity" in requested:
+            data.humidity = d.humidity
+        if "wind_speed" in requested:
+            data.wind_speed = d.wind_speed
+        if "precipitation" in requested:
+            data.precipitation = d.precipitation
+        if "time" in requested:
+            data.time = d.time or ""
+        return ForecastResponse(data=data)
+
+    key = ("forecast", current_user.user_id, city_name, date, time, tuple(sorted(requested)))
+    response = await _serve_cached(request, cache, key, build, exclude_none=True)
     logger.info(
         "v2 get_forecast user_id=%s city_name=%s date=%s", current_user.user_id, city_name, date
     )
-    return ForecastResponse(data=data)
+    return response
 
 
 @router.get("/dress-advice", response_model=DressAdviceResponse)
 async def get_dress_advice(
+    request: Request,
     city_name: str,
     current_user: CurrentUser = Depends(get_current_user),
     date: str = "",
     time: str = "",
     locale: str = "en",
-    settings: Settings = Depends(get_settings),
+    use_cases: UseCases = Depends(get_use_cases),
+    cache: ResponseCache = Depends(get_response_cache),
 ):
-    uc = GetDressAdviceForUserCityUseCase(
-        settings.users_grpc_addr,
-        settings.weather_grpc_addr,
-        settings.dress_advice_grpc_addr,
-    )
-    result = await uc.run(current_user.user_id, city_name, date, time, locale)
+    async def build() -> DressAdviceResponse:
+        result = await use_cases.get_dress_advice.run(
+            current_user.user_id, city_name, date, time, locale
+        )
+        return DressAdviceResponse(advice_text=result.advice_text)
+
+    # Empty date means "today" downstream; key on the actual day so entries roll over
+    key_date = date or date_type.today().isoformat()
+    key = ("dress-advice", current_user.user_id, city_name, key_date, time, locale)
+    response = await _serve_cached(request, cache, key, build)
     logger.info(
         "v2 get_dress_advice user_id=%s city_name=%s locale=%s",
         current_user.user_id,
         city_name,
         locale,
     )
-    return DressAdviceResponse(advice_text=result.advice_text)
+    return response
@@ -1,34 +1,44 @@
-"""ListUserCities, AddCity, GetCity via Users stub."""
+"""ListUserCities, AddCity, GetCity, ImportCities via Users stub."""
 
 import users_pb2
-
-from gateway.infrastructure.grpc_clients.clients import users_stub
+import users_pb2_grpc
 
 
 class ListUserCitiesUseCase:
-    def __init__(self, users_address: str):
-        self._users_addr = users_address
+    def __init__(self, users: users_pb2_grpc.UsersServiceStub):
+        self._users = users
 
     async def run(self, user_id: int):
-        u = await users_stub(self._users_addr)
-        return await u.ListCities(users_pb2.ListCitiesRequest(user_id=user_id))
+        return await self._users.ListCities(users_pb2.ListCitiesRequest(user_id=user_id))
 
 
 class AddCityUseCase:
-    def __init__(self, users_address: str):
-        self._users_addr = users_address
+    def __init__(self, users: users_pb2_grpc.UsersServiceStub):
+        self._users = users
 
     async def run(self, user_id: int, name: str, lat: float, lon: float):
-        u = await users_stub(self._users_addr)
-        return await u.AddCity(
+        return await self._users.AddCity(
             users_pb2.AddCityRequest(user_id=user_id, name=name, lat=lat, lon=lon)
         )
 
 
 class GetCityUseCase:
-    def __init__(self, users_address: str):
-        self._users_addr = users_address
+    def __init__(self, users: users_pb2_grpc.UsersServiceStub):
+        self._users = users
 
     async def run(self, user_id: int, city_name: str):
-        u = await users_stub(self._users_addr)
-        return await u.GetCity(users_pb2.GetCityRequest(user_id=user_id, city_name=city_name))
+        return await self._users.GetCity(
+            users_pb2.GetCityRequest(user_id=user_id, city_name=city_name)
+        )
+
+
+class ImportCitiesUseCase:
+    def __init__(self, users: users_pb2_grpc.UsersServiceStub):
+        self._users = users
+
+    async def run(self, rows):
+        """Stream (user_id, name, lat, lon) rows to Users.ImportCities in one call."""
+        return await self._users.ImportCities(
+            users_pb2.ImportCityRow(user_id=r.user_id, name=r.name, lat=r.lat, lon=r.lon)
+            for r in rows
+        )
@@ -1,26 +1,46 @@
-"""GetDressAdviceForUserCity: get forecast then advice."""
+"""GetDressAdviceForUserCity / StreamDressAdviceForUserCity: get forecast then advice."""
+
+from collections.abc import AsyncIterator
 
 import dress_advice_pb2
+import dress_advice_pb2_grpc
 import users_pb2
+import users_pb2_grpc
 import weather_pb2
+import weather_pb2_grpc
+from opentelemetry import trace
+
+tracer = trace.get_tracer(__name__)
 
-from gateway.infrastructure.grpc_clients.clients import (
-    dress_advice_stub,
-    users_stub,
-    weather_stub,
-)
+
+async def _advice_request(
+    users: users_pb2_grpc.UsersServiceStub,
+    weather: weather_pb2_grpc.WeatherServiceStub,
+    user_id: int,
+    city_name: str,
+    date: str,
+    time: str,
+    locale: str,
+) -> dress_advice_pb2.GetAdviceRequest:
+    city = await users.GetCity(users_pb2.GetCityRequest(user_id=user_id, city_name=city_name))
+    if not city.name:
+        raise ValueError("CITY_NOT_FOUND")
+    forecast = await weather.GetForecast(
+        weather_pb2.GetForecastRequest(lat=city.lat, lon=city.lon, date=date, time=time)
+    )
+    return dress_advice_pb2.GetAdviceRequest(weather_data=forecast.data, locale=locale)
 
 
 class GetDressAdviceForUserCityUseCase:
     def __init__(
         self,
-        users_address: str,
-        weather_address: str,
-        dress_advice_address: str,
+        users: users_pb2_grpc.UsersServiceStub,
+        weather: weather_pb2_grpc.WeatherServiceStub,
+        dress_advice: dress_advice_pb2_grpc.DressAdviceServiceStub,
     ):
-        self._users_addr = users_address
-        self._weather_addr = weather_address
-        self._dress_advice_addr = dress_advice_address
+        self._users = users
+        self._weather = weather
+        self._dress_advice = dress_advice
 
     async def run(
         self,
@@ -30,18 +50,50 @@ class GetDressAdviceForUserCityUseCase:
         time: str = "",
         locale: str = "en",
     ):
-        u = await users_stub(self._users_addr)
-        city = await u.GetCity(users_pb2.GetCityRequest(user_id=user_id, city_name=city_name))
-        if not city.name:
-            raise ValueError("CITY_NOT_FOUND")
-        w = await weather_stub(self._weather_addr)
-        forecast = await w.GetForecast(
-            weather_pb2.GetForecastRequest(lat=city.lat, lon=city.lon, date=date, time=time)
-        )
-        d = await dress_advice_stub(self._dress_advice_addr)
-        return await d.GetAdvice(
-            dress_advice_pb2.GetAdviceRequest(
-                weather_data=forecast.data,
-                locale=locale,
+        with tracer.start_as_current_span("GetDressAdviceForUserCity") as span:
+            span.set_attribute("dresscast.locale", locale)
+            request = await _advice_request(
+                self._users, self._weather, user_id, city_name, date, time, locale
             )
-        )
+            return await self._dress_advice.GetAdvice(request)
+
+
+class StreamDressAdviceForUserCityUseCase:
+    def __init__(
+        self,
+        users: users_pb2_grpc.UsersServiceStub,
+        weather: weather_pb2_grpc.WeatherServiceStub,
+        dress_advice: dress_advice_pb2_grpc.DressAdviceServiceStub,
+    ):
+        self._users = users
+        self._weather = weather
+        self._dress_advice = dress_advice
+
+    async def run(
+        self,
+        user_id: int,
+        city_name: str,
+        date: str = "",
+        time: str = "",
+        locale: str = "en",
+    ) -> AsyncIterator[str]:
+        """Yield advice text chunks; their concatenation is the full advice."""
+        # Not start_as_current_span: a context attached across `yield` would leak into the
+        # consumer. The span is current only while the RPCs are started.
+        span = tracer.start_span("StreamDressAdviceForUserCity")
+        span.set_attribute("dresscast.locale", locale)
+        try:
+            with trace.use_span(span):
+                request = await _advice_request(
+                    self._users, self._weather, user_id, city_name, date, time, locale
+                )
+                call = self._dress_advice.StreamAdvice(request)
+            async for chunk in call:
+                if chunk.text:
+                    yield chunk.text
+        except Exception as e:
+            span.record_exception(e)
+            span.set_status(trace.StatusCode.ERROR, str(e))
+            raise
+        finally:
+            span.end()
@@ -1,37 +1,45 @@
-"""CreateUser, GetUserById, GetOrCreateUserByTelegramId via Users stub."""
+"""CreateUser, GetUserById, VerifyCredentials, GetOrCreateUserByTelegramId via Users stub."""
 
 import users_pb2
-
-from gateway.infrastructure.grpc_clients.clients import users_stub
+import users_pb2_grpc
 
 
 class GetUserByIdUseCase:
-    def __init__(self, users_address: str):
-        self._users_addr = users_address
+    def __init__(self, users: users_pb2_grpc.UsersServiceStub):
+        self._users = users
 
     async def run(self, user_id: int):
-        u = await users_stub(self._users_addr)
-        return await u.GetUserById(users_pb2.GetUserByIdRequest(user_id=user_id))
+        return await self._users.GetUserById(users_pb2.GetUserByIdRequest(user_id=user_id))
+
+
+class VerifyCredentialsUseCase:
+    """Password check runs in Users; the gateway never sees the hash."""
+
+    def __init__(self, users: users_pb2_grpc.UsersServiceStub):
+        self._users = users
+
+    async def run(self, username: str, password: str):
+        return await self._users.VerifyCredentials(
+            users_pb2.VerifyCredentialsRequest(username=username, password=password)
+        )
 
 
 class CreateUserUseCase:
-    def __init__(self, users_address: str):
-        self._users_addr = users_address
+    def __init__(self, users: users_pb2_grpc.UsersServiceStub):
+        self._users = users
 
     async def run(self, username: str, password_hash: str):
-        u = await users_stub(self._users_addr)
-        return await u.CreateUser(
+        return await self._users.CreateUser(
             users_pb2.CreateUserRequest(username=username, password_hash=password_hash)
         )
 
 
 class GetOrCreateUserByTelegramIdUseCase:
-    def __init__(self, users_address: str):
-        self._users_addr = users_address
+    def __init__(self, users: users_pb2_grpc.UsersServiceStub):
+        self._users = users
 
     async def run(self, telegram_id: str, username: str = "", locale: str = "en"):
-        u = await users_stub(self._users_addr)
-        return await u.GetOrCreateUserByTelegramId(
+        return await self._users.GetOrCreateUserByTelegramId(
             users_pb2.GetOrCreateUserByTelegramIdRequest(
                 telegram_id=telegram_id,
                 username=username or "",
@@ -1,14 +1,27 @@
 """Gateway settings (pydantic-settings)."""
 
-from pydantic_settings import BaseSettings, SettingsConfigDict
+from typing import Literal
 
+from pydantic import Field
+from pydantic_settings import SettingsConfigDict
 
-class Settings(BaseSettings):
+from shared.grpc_server import GrpcServerSettings
+
+
+class Settings(GrpcServerSettings):
     model_config = SettingsConfigDict(env_prefix="GATEWAY_", env_file=".env", extra="ignore")
 
     weather_grpc_addr: str = "localhost:50051"
     dress_advice_grpc_addr: str = "localhost:50052"
     users_grpc_addr: str = "localhost:50053"
+    # Channels per backend address and how calls are spread over them
+    grpc_channels_per_target: int = 1
+    grpc_pool_policy: Literal["round_robin", "least_outstanding"] = "round_robin"
+    # round_robin: resolve each address via DNS and balance over all replicas
+    grpc_lb_policy: Literal["pick_first", "round_robin"] = "pick_first"
+    grpc_keepalive_time_ms: int = 0  # 0 = no client keepalive pings
+    grpc_keepalive_timeout_ms: int = 20_000
+    grpc_max_message_bytes: int = 4 * 1024 * 1024
     http_host: str = "0.0.0.0"  # nosec B104 - default for dev; override via env in prod
     http_port: int = 8000
     grpc_host: str = "0.0.0.0"  # nosec B104 - default for dev; override via env in prod
@@ -16,4 +29,17 @@ class Settings(BaseSettings):
     jwt_secret: str = "change-me-in-production"
     jwt_algorithm: str = "HS256"
     jwt_expire_minutes: int = 60 * 24  # 1 day
+    # Verified tokens remembered until exp (0 = verify every request)
+    jwt_cache_size: int = Field(default=10_000, ge=0)
+    # bcrypt cost (2**rounds iterations) and threads hashing in parallel, off the event loop.
+    # BCRYPT_ROUNDS (no prefix) is shared with Users, whose dummy hash must match this cost
+    bcrypt_rounds: int = Field(default=12, ge=4, le=31, validation_alias="BCRYPT_ROUNDS")
+    password_hash_workers: int = Field(default=2, ge=1)
     log_level: str = "INFO"
+    # Prometheus /metrics port; 0 = disabled
+    metrics_port: int = 0
+    # Whole-response cache for v2 forecast/dress-advice. A hit can be served from a forecast
+    # already up to the weather cache TTL (1 h) old, so keep this well below it: worst-case
+    # age is the sum of the two. 0 = off
+    response_cache_ttl_seconds: int = Field(default=300, ge=0)
+    response_cache_max_entries: int = 10_000
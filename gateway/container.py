@@ -0,0 +1,75 @@
+"""Use cases wired to shared gRPC stubs; built once per process in the app lifespan."""
+
+from dataclasses import dataclass
+
+from gateway.application.use_cases.cities import (
+    AddCityUseCase,
+    GetCityUseCase,
+    ImportCitiesUseCase,
+    ListUserCitiesUseCase,
+)
+from gateway.application.use_cases.dress_advice import (
+    GetDressAdviceForUserCityUseCase,
+    StreamDressAdviceForUserCityUseCase,
+)
+from gateway.application.use_cases.forecast import GetForecastForUserCityUseCase
+from gateway.application.use_cases.users import (
+    CreateUserUseCase,
+    GetOrCreateUserByTelegramIdUseCase,
+    GetUserByIdUseCase,
+    VerifyCredentialsUseCase,
+)
+from gateway.config.settings import Settings
+from gateway.infrastructure.grpc_clients.clients import (
+    dress_advice_stub,
+    users_stub,
+    weather_stub,
+)
+from gateway.infrastructure.grpc_clients.pool import PoolConfig
+
+
+@dataclass(frozen=True)
+class UseCases:
+    get_user_by_id: GetUserByIdUseCase
+    verify_credentials: VerifyCredentialsUseCase
+    create_user: CreateUserUseCase
+    get_or_create_telegram_user: GetOrCreateUserByTelegramIdUseCase
+    list_cities: ListUserCitiesUseCase
+    add_city: AddCityUseCase
+    get_city: GetCityUseCase
+    import_cities: ImportCitiesUseCase
+    get_forecast: GetForecastForUserCityUseCase
+    get_dress_advice: GetDressAdviceForUserCityUseCase
+    stream_dress_advice: StreamDressAdviceForUserCityUseCase
+
+
+def pool_config(settings: Settings) -> PoolConfig:
+    return PoolConfig(
+        size=settings.grpc_channels_per_target,
+        policy=settings.grpc_pool_policy,
+        lb_policy=settings.grpc_lb_policy,
+        keepalive_time_ms=settings.grpc_keepalive_time_ms,
+        keepalive_timeout_ms=settings.grpc_keepalive_timeout_ms,
+        max_message_bytes=settings.grpc_max_message_bytes,
+    )
+
+
+def build_use_cases(settings: Settings) -> UseCases:
+    """Must run inside the event loop that will serve requests (channels are per loop)."""
+    config = pool_config(settings)
+    users = users_stub(settings.users_grpc_addr, config)
+    weather = weather_stub(settings.weather_grpc_addr, config)
+    dress_advice = dress_advice_stub(settings.dress_advice_grpc_addr, config)
+    return UseCases(
+        get_user_by_id=GetUserByIdUseCase(users),
+        verify_credentials=VerifyCredentialsUseCase(users),
+        create_user=CreateUserUseCase(users),
+        get_or_create_telegram_user=GetOrCreateUserByTelegramIdUseCase(users),
+        list_cities=ListUserCitiesUseCase(users),
+        add_city=AddCityUseCase(users),
+        get_city=GetCityUseCase(users),
+        import_cities=ImportCitiesUseCase(users),
+        get_forecast=GetForecastForUserCityUseCase(users, weather),
+        get_dress_advice=GetDressAdviceForUserCityUseCase(users, weather, dress_advice),
+        stream_dress_advice=StreamDressAdviceForUserCityUseCase(users, weather, dress_advice),
+    )
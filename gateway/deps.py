@@ -1,27 +1,57 @@
-"""FastAPI dependencies: Settings, AuthService, get_current_user."""
+"""FastAPI dependencies: Settings, AuthService, get_current_user, caches, hasher, use cases."""
 
-from fastapi import Depends
+from fastapi import Depends, Request
 from fastapi.security import OAuth2PasswordBearer
 
 from gateway.api.v1.auth_service import AuthService, CurrentUser
 from gateway.config.settings import Settings
+from gateway.container import UseCases
+from gateway.infrastructure.cache.response_cache import ResponseCache
+from shared.password_hashing import PasswordHasher
 
 # Path used by Swagger UI for OAuth2 password flow (login/password form)
 OAUTH2_TOKEN_URL = "/api/v1/auth/token"  # nosec B105 - URL path, not a password
 
 
-def get_settings() -> Settings:
-    return Settings()
+# Dependencies are async so FastAPI resolves them on the loop instead of hopping to
+# its threadpool once per dependency per request.
 
+_settings: Settings | None = None
 
-def get_auth_service(settings: Settings = Depends(get_settings)) -> AuthService:
-    return AuthService(settings)
+
+async def get_settings() -> Settings:
+    """Read env/.env once per process."""
+    global _settings
+    if _settings is None:
+        _settings = Settings()
+    return _settings
+
+
+async def get_auth_service(request: Request) -> AuthService:
+    """AuthService built in the app lifespan, so its verified-token cache is shared by all
+    requests of that app (see gateway.main)."""
+    return request.app.state.auth_service
+
+
+async def get_use_cases(request: Request) -> UseCases:
+    """Use cases built once in the app lifespan (see gateway.main)."""
+    return request.app.state.use_cases
+
+
+async def get_response_cache(request: Request) -> ResponseCache:
+    """Response cache built in the app lifespan (see gateway.main)."""
+    return request.app.state.response_cache
+
+
+async def get_password_hasher(request: Request) -> PasswordHasher:
+    """bcrypt pool built in the app lifespan and shut down with it (see gateway.main)."""
+    return request.app.state.password_hasher
 
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl=OAUTH2_TOKEN_URL, auto_error=True)
 
 
-def get_current_user(
+async def get_current_user(
     auth: AuthService = Depends(get_auth_service),
     token: str = Depends(oauth2_scheme),
 ) -> CurrentUser:
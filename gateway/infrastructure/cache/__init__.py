@@ -0,0 +1 @@
+# HTTP response cache
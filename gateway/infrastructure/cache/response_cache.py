@@ -0,0 +1,63 @@
+"""In-process LRU cache for whole HTTP response bodies, with ETags."""
+
+import hashlib
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    body: bytes
+    etag: str
+    expires_at: float
+
+    def max_age(self, now: float) -> int:
+        return max(0, int(self.expires_at - now))
+
+
+def make_etag(body: bytes) -> str:
+    return '"' + hashlib.sha256(body).hexdigest()[:32] + '"'
+
+
+class ResponseCache:
+    """Bounded LRU of serialized responses; entries expire `ttl_seconds` after being stored.
+
+    Per-process: each gateway worker keeps its own copy. `ttl_seconds=0` disables caching.
+    """
+
+    def __init__(self, max_entries: int = 10_000, ttl_seconds: float = 300, clock=time.monotonic):
+        self._max_entries = max_entries
+        self._ttl = ttl_seconds
+        self._clock = clock
+        self._entries: OrderedDict[tuple, CachedResponse] = OrderedDict()
+
+    @property
+    def enabled(self) -> bool:
+        return self._ttl > 0 and self._max_entries > 0
+
+    def now(self) -> float:
+        return self._clock()
+
+    def get(self, key: tuple) -> CachedResponse | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry.expires_at <= self._clock():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def set(self, key: tuple, body: bytes) -> CachedResponse:
+        entry = CachedResponse(body, make_etag(body), self._clock() + self._ttl)
+        if not self.enabled:
+            return entry
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+        return entry
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -1,4 +1,4 @@
-"""gRPC stubs for Weather, DressAdvice, Users (created from pool)."""
+"""gRPC stubs for Weather, DressAdvice, Users (spread over a channel pool per address)."""
 
 import sys
 from pathlib import Path
@@ -13,19 +13,16 @@ import dress_advice_pb2_grpc
 import users_pb2_grpc
 import weather_pb2_grpc
 
-from gateway.infrastructure.grpc_clients.pool import get_channel
+from gateway.infrastructure.grpc_clients.pool import PoolConfig, PooledStub, get_pool
 
 
-async def weather_stub(address: str) -> weather_pb2_grpc.WeatherServiceStub:
-    ch = await get_channel(address)
-    return weather_pb2_grpc.WeatherServiceStub(ch)
+def weather_stub(address: str, config: PoolConfig | None = None) -> PooledStub:
+    return PooledStub(weather_pb2_grpc.WeatherServiceStub, get_pool(address, config))
 
 
-async def dress_advice_stub(address: str) -> dress_advice_pb2_grpc.DressAdviceServiceStub:
-    ch = await get_channel(address)
-    return dress_advice_pb2_grpc.DressAdviceServiceStub(ch)
+def dress_advice_stub(address: str, config: PoolConfig | None = None) -> PooledStub:
+    return PooledStub(dress_advice_pb2_grpc.DressAdviceServiceStub, get_pool(address, config))
 
 
-async def users_stub(address: str) -> users_pb2_grpc.UsersServiceStub:
-    ch = await get_channel(address)
-    return users_pb2_grpc.UsersServiceStub(ch)
+def users_stub(address: str, config: PoolConfig | None = None) -> PooledStub:
+    return PooledStub(users_pb2_grpc.UsersServiceStub, get_pool(address, config))
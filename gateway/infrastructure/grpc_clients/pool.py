@@ -1,21 +1,150 @@
-"""Channel pool by address and event loop."""
+"""Channel pools by address and event loop: N channels per target, picked per call."""
 
 import asyncio
+import itertools
 import logging
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Literal
 
 from grpc import aio
 
+from shared.tracing import client_interceptors
+
 logger = logging.getLogger(__name__)
 
-_channel_cache: dict[tuple[str, id], aio.Channel] = {}
-_lock = asyncio.Lock()
+PoolPolicy = Literal["round_robin", "least_outstanding"]
+LbPolicy = Literal["pick_first", "round_robin"]
+
+# Targets already naming a resolver are passed through; bare host:port gets dns:///
+_RESOLVER_SCHEMES = ("dns:", "ipv4:", "ipv6:", "unix:", "unix-abstract:", "vsock:", "xds:")
+
+
+@dataclass(frozen=True)
+class PoolConfig:
+    """How many channels to open per target, how to pick one, and their channel args.
+
+    `lb_policy="round_robin"` resolves the target via DNS and spreads each channel's
+    calls over every resolved replica; `pick_first` (gRPC default) sticks to one address.
+    """
+
+    size: int = 1
+    policy: PoolPolicy = "round_robin"
+    lb_policy: LbPolicy = "pick_first"
+    keepalive_time_ms: int = 0
+    keepalive_timeout_ms: int = 20_000
+    max_message_bytes: int = 4 * 1024 * 1024
+
+    def target(self, address: str) -> str:
+        if self.lb_policy == "round_robin" and not address.startswith(_RESOLVER_SCHEMES):
+            return f"dns:///{address}"
+        return address
+
+    def options(self) -> list[tuple[str, int | str]]:
+        options: list[tuple[str, int | str]] = [
+            ("grpc.lb_policy_name", self.lb_policy),
+            ("grpc.max_send_message_length", self.max_message_bytes),
+            ("grpc.max_receive_message_length", self.max_message_bytes),
+        ]
+        if self.size > 1:
+            # Otherwise channels with equal args share subchannels, i.e. one connection
+            options.append(("grpc.use_local_subchannel_pool", 1))
+        if self.keepalive_time_ms:
+            options += [
+                ("grpc.keepalive_time_ms", self.keepalive_time_ms),
+                ("grpc.keepalive_timeout_ms", self.keepalive_timeout_ms),
+                ("grpc.keepalive_permit_without_calls", 0),
+            ]
+        return options
+
+
+class ChannelPool:
+    """`config.size` channels to one target; `acquire` picks one per call."""
+
+    def __init__(self, address: str, config: PoolConfig):
+        self.address = address
+        self._policy = config.policy
+        target = config.target(address)
+        options = config.options()
+        interceptors = client_interceptors() or None
+        self.channels = [
+            aio.insecure_channel(target, options=options, interceptors=interceptors)
+            for _ in range(max(1, config.size))
+        ]
+        self._outstanding = [0] * len(self.channels)
+        self._next = itertools.cycle(range(len(self.channels)))
+
+    def acquire(self) -> int:
+        if self._policy == "least_outstanding":
+            index = min(range(len(self.channels)), key=self._outstanding.__getitem__)
+        else:
+            index = next(self._next)
+        self._outstanding[index] += 1
+        return index
+
+    def release(self, index: int) -> None:
+        self._outstanding[index] -= 1
+
+    @property
+    def outstanding(self) -> list[int]:
+        return list(self._outstanding)
+
+    async def close(self) -> None:
+        for channel in self.channels:
+            await channel.close()
+
+
+class PooledStub:
+    """Stub facade over a ChannelPool: each RPC goes to the channel the pool picks.
+
+    The channel counts as busy until the call finishes (including streams and
+    cancellation), which is what `least_outstanding` balances on.
+    """
+
+    def __init__(self, stub_class: Callable[[aio.Channel], object], pool: ChannelPool):
+        self._pool = pool
+        self._stubs = [stub_class(channel) for channel in pool.channels]
+
+    def __getattr__(self, name: str):
+        def invoke(*args, **kwargs):
+            index = self._pool.acquire()
+            try:
+                call = getattr(self._stubs[index], name)(*args, **kwargs)
+            except BaseException:
+                self._pool.release(index)
+                raise
+            call.add_done_callback(lambda _call: self._pool.release(index))
+            return call
+
+        return invoke
+
+
+_pools: dict[tuple[str, int], ChannelPool] = {}
+
+
+def get_pool(address: str, config: PoolConfig | None = None) -> ChannelPool:
+    """Shared pool for `address` on the running loop (created on first use with `config`).
+
+    Lock-free: the lookup never awaits, so no other task can interleave between the
+    miss and the insert on the same loop.
+    """
+    key = (address, id(asyncio.get_running_loop()))
+    pool = _pools.get(key)
+    if pool is None:
+        config = config or PoolConfig()
+        logger.debug(
+            "gRPC channel pool created address=%s size=%s policy=%s lb=%s",
+            address,
+            config.size,
+            config.policy,
+            config.lb_policy,
+        )
+        pool = _pools[key] = ChannelPool(address, config)
+    return pool
 
 
-async def get_channel(address: str) -> aio.Channel:
-    loop = asyncio.get_event_loop()
-    key = (address, id(loop))
-    async with _lock:
-        if key not in _channel_cache:
-            logger.debug("gRPC channel created for address=%s", address)
-            _channel_cache[key] = aio.insecure_channel(address)
-        return _channel_cache[key]
+async def close_channels() -> None:
+    """Close every pool opened on the running loop (app shutdown)."""
+    loop_id = id(asyncio.get_running_loop())
+    for key in [k for k in _pools if k[1] == loop_id]:
+        await _pools.pop(key).close()
@@ -12,27 +12,33 @@ if str(ROOT / "proto_gen") not in sys.path:
 
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI
-from grpc import aio
+import grpc
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
 
 from gateway.config.settings import Settings
+from shared.logging_setup import setup_logging
+from shared.tracing import setup_tracing
 
 _settings = Settings()
-logging.basicConfig(
-    level=getattr(logging, _settings.log_level.upper(), logging.INFO),
-    format="%(asctime)s %(levelname)s [%(name)s] %(message)s",
-)
+setup_logging(_settings.log_level, "gateway")
+# FastAPI records HTTP server spans itself once a global TracerProvider is installed
+setup_tracing("gateway")
 
 import gateway_pb2_grpc
 
 from gateway.api.grpc.servicer import GatewayServicer
+from gateway.api.metrics import PrometheusMiddleware
 from gateway.api.v1.auth import router as auth_router
+from gateway.api.v1.auth_service import AuthService
 from gateway.api.v1.routes import router as api_router
 from gateway.api.v2.routes import router as api_v2_router
-from gateway.application.use_cases.cities import AddCityUseCase, ListUserCitiesUseCase
-from gateway.application.use_cases.dress_advice import GetDressAdviceForUserCityUseCase
-from gateway.application.use_cases.forecast import GetForecastForUserCityUseCase
-from gateway.application.use_cases.users import GetOrCreateUserByTelegramIdUseCase
+from gateway.container import build_use_cases
+from gateway.infrastructure.cache.response_cache import ResponseCache
+from gateway.infrastructure.grpc_clients.pool import close_channels
+from shared.grpc_server import create_server
+from shared.metrics import start_metrics_server
+from shared.password_hashing import PasswordHasher
 
 logger = logging.getLogger(__name__)
 
@@ -40,40 +46,56 @@ logger = logging.getLogger(__name__)
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     settings = _settings
-    get_forecast_uc = GetForecastForUserCityUseCase(
-        settings.users_grpc_addr, settings.weather_grpc_addr
+    use_cases = build_use_cases(settings)
+    app.state.use_cases = use_cases
+    app.state.auth_service = AuthService(settings)
+    app.state.response_cache = ResponseCache(
+        settings.response_cache_max_entries, settings.response_cache_ttl_seconds
     )
-    get_dress_advice_uc = GetDressAdviceForUserCityUseCase(
-        settings.users_grpc_addr,
-        settings.weather_grpc_addr,
-        settings.dress_advice_grpc_addr,
+    app.state.password_hasher = PasswordHasher(
+        settings.bcrypt_rounds, settings.password_hash_workers
     )
-    list_cities_uc = ListUserCitiesUseCase(settings.users_grpc_addr)
-    add_city_uc = AddCityUseCase(settings.users_grpc_addr)
-    get_or_create_telegram_uc = GetOrCreateUserByTelegramIdUseCase(settings.users_grpc_addr)
     servicer = GatewayServicer(
-        get_forecast_uc=get_forecast_uc,
-        get_dress_advice_uc=get_dress_advice_uc,
-        list_cities_uc=list_cities_uc,
-        add_city_uc=add_city_uc,
-        get_or_create_telegram_uc=get_or_create_telegram_uc,
+        get_forecast_uc=use_cases.get_forecast,
+        get_dress_advice_uc=use_cases.get_dress_advice,
+        list_cities_uc=use_cases.list_cities,
+        add_city_uc=use_cases.add_city,
+        get_or_create_telegram_uc=use_cases.get_or_create_telegram_user,
+        stream_dress_advice_uc=use_cases.stream_dress_advice,
     )
-    server = aio.server()
+    server = create_server(settings)
     gateway_pb2_grpc.add_GatewayServiceServicer_to_server(servicer, server)
     server.add_insecure_port(f"{settings.grpc_host}:{settings.grpc_port}")
     await server.start()
     app.state.grpc_server = server
+    start_metrics_server(settings.metrics_port, "Gateway")
     logger.info("Gateway gRPC listening on %s:%s", settings.grpc_host, settings.grpc_port)
     yield
-    await server.stop(grace=2)
+    await server.stop(settings.grpc_server_shutdown_grace_seconds)
+    await close_channels()
+    app.state.password_hasher.close()
 
 
 app = FastAPI(title="DressCast Gateway", version="0.1.0", lifespan=lifespan)
+app.add_middleware(PrometheusMiddleware)
 app.include_router(auth_router, prefix="/api/v1")
 app.include_router(api_router)
 app.include_router(api_v2_router)
 
 
+@app.exception_handler(grpc.RpcError)
+async def backend_overloaded(request: Request, exc: grpc.RpcError):
+    """A backend shedding load (RESOURCE_EXHAUSTED) is a 503 for REST clients, not a 500."""
+    if exc.code() != grpc.StatusCode.RESOURCE_EXHAUSTED:
+        raise exc
+    logger.warning("backend overloaded path=%s: %s", request.url.path, exc.details())
+    return JSONResponse(
+        status_code=503,
+        content={"detail": "Service overloaded, retry later"},
+        headers={"Retry-After": "1"},
+    )
+
+
 @app.get("/health")
 def health():
     return {"status": "ok"}
@@ -88,6 +110,8 @@ def main() -> None:
         host=settings.http_host,
         port=settings.http_port,
         reload=False,
+        # uvicorn's own loggers propagate to the root queue pipeline
+        log_config=None,
     )
 
 
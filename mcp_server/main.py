@@ -14,16 +14,14 @@ from mcp_server.app import McpApplication
 from mcp_server.config import McpConfig
 from mcp_server.gateway_client import GatewayClient
 from mcp_server.tools.handlers import DressCastToolHandlers
+from shared.logging_setup import setup_logging
 
 logger = logging.getLogger(__name__)
 
 
 def main() -> None:
     config = McpConfig()
-    logging.basicConfig(
-        level=getattr(logging, config.log_level.upper(), logging.INFO),
-        format="%(asctime)s %(levelname)s [%(name)s] %(message)s",
-    )
+    setup_logging(config.log_level, "mcp_server")
     logger.info("MCP server starting")
     client = GatewayClient(config.gateway_grpc_addr)
     handlers = DressCastToolHandlers(client)
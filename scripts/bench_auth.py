@@ -0,0 +1,56 @@
+"""Per-request bearer-auth overhead in the gateway: before vs after the token cache.
+
+before: Settings() + AuthService() + full jwt.decode on every request (the old deps)
+after:  process-wide AuthService; repeat tokens come from the verified-token LRU
+
+Run from project root:
+    python scripts/bench_auth.py --requests 20000 --tokens 100
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from gateway.api.v1.auth_service import AuthService
+from gateway.config.settings import Settings
+
+_SECRET = "bench-secret-at-least-32-bytes-long-for-hmac"  # nosec B105 - benchmark only
+
+
+def _per_request_us(fn, tokens: list[str], requests: int) -> float:
+    started = time.perf_counter()
+    for i in range(requests):
+        fn(tokens[i % len(tokens)])
+    return (time.perf_counter() - started) / requests * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=20_000)
+    parser.add_argument("--tokens", type=int, default=100, help="Distinct active users")
+    args = parser.parse_args()
+
+    settings = Settings(jwt_secret=_SECRET)
+    issuer = AuthService(settings)
+    tokens = [issuer.create_token(i, f"user{i}", False) for i in range(args.tokens)]
+
+    def before(token: str):
+        return AuthService(Settings(jwt_secret=_SECRET, jwt_cache_size=0)).decode_token(token)
+
+    uncached = AuthService(Settings(jwt_secret=_SECRET, jwt_cache_size=0))
+    cached = AuthService(settings)
+
+    for name, fn in (
+        ("before", before),
+        ("singleton, no cache", uncached.decode_token),
+        ("after", cached.decode_token),
+    ):
+        print(f"{name:>20}: {_per_request_us(fn, tokens, args.requests):8.2f} µs/request")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""Event-loop lag during a registration burst: bcrypt on the loop vs PasswordHasher.
+
+A probe task sleeps `--interval` seconds in a loop and records how late it wakes up;
+meanwhile `--burst` passwords are hashed either inline (as register used to) or in the
+PasswordHasher thread pool.
+
+Run from project root:
+    python scripts/bench_password_hashing.py --burst 20 --rounds 12 --workers 2
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from shared.password_hashing import PasswordHasher, hash_password
+
+
+async def _probe(interval: float, lags: list[float], stop: asyncio.Event) -> None:
+    while not stop.is_set():
+        started = time.perf_counter()
+        await asyncio.sleep(interval)
+        lags.append(time.perf_counter() - started - interval)
+
+
+async def _burst(mode: str, burst: int, rounds: int, workers: int, interval: float) -> None:
+    lags: list[float] = []
+    stop = asyncio.Event()
+    probe = asyncio.create_task(_probe(interval, lags, stop))
+    await asyncio.sleep(interval * 3)
+    started = time.perf_counter()
+    if mode == "inline":
+
+        async def register(i: int) -> str:
+            return hash_password(f"password-{i}", rounds)
+
+        await asyncio.gather(*(register(i) for i in range(burst)))
+    else:
+        hasher = PasswordHasher(rounds, workers)
+        await asyncio.gather(*(hasher.hash(f"password-{i}") for i in range(burst)))
+        hasher.close()
+    elapsed = time.perf_counter() - started
+    stop.set()
+    await probe
+    print(
+        f"{mode:>6}: burst {elapsed * 1000:8.1f} ms  loop lag "
+        f"p50 {statistics.median(lags) * 1000:7.1f} ms  max {max(lags) * 1000:7.1f} ms"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--burst", type=int, default=20, help="Concurrent registrations")
+    parser.add_argument("--rounds", type=int, default=12, help="bcrypt cost")
+    parser.add_argument("--workers", type=int, default=2, help="PasswordHasher threads")
+    parser.add_argument("--interval", type=float, default=0.01, help="Probe period, seconds")
+    args = parser.parse_args()
+    for mode in ("inline", "pooled"):
+        asyncio.run(_burst(mode, args.burst, args.rounds, args.workers, args.interval))
+
+
+if __name__ == "__main__":
+    main()
@@ -28,19 +28,17 @@ def main() -> None:
 
 
 async def _create_admin(username: str) -> None:
-    import bcrypt
-
+    from shared.password_hashing import hash_password
     from users.application.use_cases.create_user import CreateUserUseCase
     from users.config.settings import Settings
     from users.infrastructure.db.repositories.user_repository import UserRepositoryImpl
-    from users.infrastructure.db.session import get_session_factory
+    from users.infrastructure.db.session import SessionRouter, get_session_factory
 
     settings = Settings()
     session_factory = get_session_factory(settings)
     user_repo = UserRepositoryImpl(session_factory)
-    use_case = CreateUserUseCase(user_repo, session_factory)
-    raw = b"admin"[:72]
-    password_hash = bcrypt.hashpw(raw, bcrypt.gensalt()).decode("utf-8")
+    use_case = CreateUserUseCase(user_repo, SessionRouter(session_factory))
+    password_hash = hash_password("admin", settings.bcrypt_rounds)
     try:
         user = await use_case.run(username=username, password_hash=password_hash, is_admin=True)
         print(f"Admin user created: id={user.id}, username={user.username}")
@@ -0,0 +1,121 @@
+"""Load-test OpenAIAdviceProvider pool settings against a local OpenAI-compatible stub.
+
+Starts a stub `/v1/chat/completions` server on localhost (fixed latency, counts TCP
+connections it accepted), then fires `--requests` concurrent GetAdvice calls through
+one provider per `--max-connections` value and prints throughput, latency percentiles
+and how many connections the pool opened.
+
+Run from project root:
+    python scripts/load_openai_pool.py --requests 2000 --concurrency 200 \\
+        --max-connections 10 --max-connections 50 --max-connections 200
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+import uvicorn
+from fastapi import FastAPI, Request
+
+from dress_advice.application.use_cases.get_advice import WeatherData
+from dress_advice.infrastructure.external.openai_provider import OpenAIAdviceProvider
+
+
+def stub_app(latency_seconds: float) -> FastAPI:
+    app = FastAPI()
+    app.state.connections = set()
+
+    @app.post("/v1/chat/completions")
+    async def chat_completions(request: Request) -> dict:
+        app.state.connections.add(request.client)
+        await asyncio.sleep(latency_seconds)
+        return {
+            "id": "chatcmpl-stub",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": "stub",
+            "choices": [
+                {
+                    "index": 0,
+                    "message": {"role": "assistant", "content": "Light jacket 🧥"},
+                    "finish_reason": "stop",
+                }
+            ],
+        }
+
+    return app
+
+
+def _percentile(samples: list[float], q: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+async def _run(provider: OpenAIAdviceProvider, requests: int, concurrency: int) -> list[float]:
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: list[float] = []
+    wd = WeatherData(temperature=12.0, humidity=60, wind_speed=3, precipitation=0, time="")
+
+    async def one() -> None:
+        async with semaphore:
+            started = time.perf_counter()
+            await provider.get_advice(wd, "en")
+            latencies.append(time.perf_counter() - started)
+
+    await asyncio.gather(*(one() for _ in range(requests)))
+    return latencies
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, default=100)
+    parser.add_argument("--max-connections", type=int, action="append")
+    parser.add_argument("--keepalive", type=int, default=None, help="Default: max-connections")
+    parser.add_argument("--latency", type=float, default=0.05, help="Stub latency, seconds")
+    parser.add_argument("--http2", action="store_true")
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    app = stub_app(args.latency)
+    config = uvicorn.Config(app, host="127.0.0.1", port=args.port, log_level="warning")
+    server = uvicorn.Server(config)
+    serving = asyncio.create_task(server.serve())
+    while not server.started:
+        await asyncio.sleep(0.01)
+
+    try:
+        for limit in args.max_connections or [10, 100]:
+            app.state.connections.clear()
+            provider = OpenAIAdviceProvider(
+                api_key="stub",  # nosec B106
+                base_url=f"http://127.0.0.1:{args.port}/v1",
+                max_retries=0,
+                max_connections=limit,
+                max_keepalive_connections=args.keepalive if args.keepalive is not None else limit,
+                http2=args.http2,
+            )
+            started = time.perf_counter()
+            latencies = await _run(provider, args.requests, args.concurrency)
+            elapsed = time.perf_counter() - started
+            await provider.aclose()
+            print(
+                f"max_connections={limit:>4}: {len(latencies) / elapsed:8.1f} req/s  "
+                f"p50 {statistics.median(latencies) * 1000:6.1f} ms  "
+                f"p95 {_percentile(latencies, 0.95) * 1000:6.1f} ms  "
+                f"p99 {_percentile(latencies, 0.99) * 1000:6.1f} ms  "
+                f"connections {len(app.state.connections)}"
+            )
+    finally:
+        server.should_exit = True
+        await serving
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
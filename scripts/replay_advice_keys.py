@@ -0,0 +1,79 @@
+"""Replay advice requests against key policies: hit rate and OpenAI calls/cost.
+
+Input is JSON Lines, one GetAdvice request per line:
+    {"temperature": 14.3, "humidity": 71, "wind_speed": 3.2, "precipitation": 0.0,
+     "locale": "ru", "ts": 1760000000}
+`ts` (epoch seconds) is optional; with it, cached entries expire after --ttl seconds.
+
+Run from project root:
+    python scripts/replay_advice_keys.py requests.jsonl --policy exact --policy banded
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from dress_advice.application.advice_keys import build_key_policy
+from dress_advice.application.use_cases.get_advice import WeatherData
+
+
+def _load(path: Path) -> list[tuple[WeatherData, str, float | None]]:
+    requests = []
+    with path.open(encoding="utf-8") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            r = json.loads(line)
+            wd = WeatherData(
+                temperature=float(r["temperature"]),
+                humidity=float(r.get("humidity", 0)),
+                wind_speed=float(r.get("wind_speed", 0)),
+                precipitation=float(r.get("precipitation", 0)),
+                time="",
+            )
+            requests.append((wd, r.get("locale", "en"), r.get("ts")))
+    return requests
+
+
+def replay(requests, policy, ttl: float) -> tuple[int, int]:
+    """Return (hits, misses) for a cache keyed by `policy` with entries living `ttl` seconds."""
+    expires: dict[str, float] = {}
+    hits = misses = 0
+    for wd, locale, ts in requests:
+        key = policy.key(wd, locale)
+        now = float(ts) if ts is not None else 0.0
+        if key in expires and (ts is None or expires[key] > now):
+            hits += 1
+        else:
+            misses += 1
+            expires[key] = now + ttl
+    return hits, misses
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("requests", type=Path, help="JSON Lines file of GetAdvice requests")
+    parser.add_argument("--policy", action="append", choices=["exact", "banded"])
+    parser.add_argument("--temperature-step", type=float, default=3.0)
+    parser.add_argument("--ttl", type=float, default=3600, help="Cache TTL, seconds")
+    parser.add_argument("--cost-per-call", type=float, default=0.0002, help="USD per call")
+    args = parser.parse_args()
+
+    requests = _load(args.requests)
+    print(f"requests: {len(requests)}")
+    for name in args.policy or ["exact", "banded"]:
+        policy = build_key_policy(name, args.temperature_step)
+        hits, misses = replay(requests, policy, args.ttl)
+        rate = hits / len(requests) if requests else 0.0
+        print(
+            f"{name:>7}: hit rate {rate:6.1%}  openai calls {misses:>8}  "
+            f"cost ${misses * args.cost_per_call:,.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
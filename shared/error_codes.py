@@ -7,4 +7,5 @@ USER_ALREADY_EXISTS = "USER_ALREADY_EXISTS"
 INVALID_CREDENTIALS = "INVALID_CREDENTIALS"
 VALIDATION_ERROR = "VALIDATION_ERROR"
 SERVICE_UNAVAILABLE = "SERVICE_UNAVAILABLE"
+SERVICE_OVERLOADED = "SERVICE_OVERLOADED"
 ADVICE_PROVIDER_NOT_CONFIGURED = "ADVICE_PROVIDER_NOT_CONFIGURED"
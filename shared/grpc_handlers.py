@@ -0,0 +1,56 @@
+"""Rebuild a grpc.aio RpcMethodHandler around a wrapped behavior (for server interceptors)."""
+
+import asyncio
+from collections.abc import AsyncIterator, Awaitable, Callable
+
+import grpc
+
+# (request, context) -> awaitable response, or async iterator of responses
+UnaryBehavior = Callable[..., Awaitable]
+StreamingBehavior = Callable[..., AsyncIterator]
+
+_FACTORIES = {
+    (False, False): grpc.unary_unary_rpc_method_handler,
+    (False, True): grpc.unary_stream_rpc_method_handler,
+    (True, False): grpc.stream_unary_rpc_method_handler,
+    (True, True): grpc.stream_stream_rpc_method_handler,
+}
+
+
+def wrap_rpc_handler(
+    handler: grpc.RpcMethodHandler,
+    wrap_unary: Callable[[UnaryBehavior], UnaryBehavior],
+    wrap_streaming: Callable[[StreamingBehavior], StreamingBehavior],
+) -> grpc.RpcMethodHandler:
+    """Same handler with its behavior replaced by `wrap_unary(b)` or `wrap_streaming(b)`.
+
+    Single-response RPCs (unary-unary, stream-unary) go through `wrap_unary`;
+    response-streaming RPCs (unary-stream, stream-stream) through `wrap_streaming`.
+    """
+    if handler.response_streaming:
+        behavior = wrap_streaming(handler.unary_stream or handler.stream_stream)
+    else:
+        behavior = wrap_unary(handler.unary_unary or handler.stream_unary)
+    factory = _FACTORIES[(handler.request_streaming, handler.response_streaming)]
+    return factory(
+        behavior,
+        request_deserializer=handler.request_deserializer,
+        response_serializer=handler.response_serializer,
+    )
+
+
+def split_method(full_method: str) -> tuple[str, str]:
+    """'/weather.WeatherService/GetForecast' -> ('weather.WeatherService', 'GetForecast')."""
+    _, _, rest = full_method.partition("/")
+    service, _, method = rest.partition("/")
+    return service, method
+
+
+def status_name(context, error: BaseException | None) -> str:
+    """Final status of a call as a StatusCode name, from the servicer context."""
+    if isinstance(error, asyncio.CancelledError):
+        return grpc.StatusCode.CANCELLED.name
+    code = context.code()
+    if isinstance(code, grpc.StatusCode):
+        return code.name
+    return "UNKNOWN" if error is not None else grpc.StatusCode.OK.name
@@ -0,0 +1,92 @@
+"""grpc.aio server factory: concurrency limit, keepalive, message size and compression.
+
+Every service builds its server with `create_server(settings)`, so the tuning knobs and
+the standard interceptors (tracing, metrics) are the same everywhere.
+`serve_until_signal` stops a server gracefully on SIGTERM/SIGINT. With
+`grpc_server_max_concurrent_rpcs` set, calls beyond the limit are shed immediately with
+RESOURCE_EXHAUSTED instead of queueing on the event loop.
+"""
+
+import asyncio
+import logging
+import signal
+from typing import Literal
+
+import grpc
+from grpc import aio
+from pydantic import Field
+from pydantic_settings import BaseSettings
+
+from shared.metrics import MetricsServerInterceptor
+from shared.tracing import server_interceptors
+
+logger = logging.getLogger(__name__)
+
+_COMPRESSION = {"none": grpc.Compression.NoCompression, "gzip": grpc.Compression.Gzip}
+
+
+class GrpcServerSettings(BaseSettings):
+    """Server tuning fields. Service Settings inherit them and read them under their own
+    env prefix, e.g. WEATHER_GRPC_SERVER_MAX_CONCURRENT_RPCS."""
+
+    # In-flight RPC limit per process; further calls get RESOURCE_EXHAUSTED. 0 = unlimited
+    grpc_server_max_concurrent_rpcs: int = Field(default=0, ge=0)
+    grpc_server_max_message_bytes: int = Field(default=4 * 1024 * 1024, ge=1)
+    # Server pings on idle connections to detect dead peers; 0 = off
+    grpc_server_keepalive_time_ms: int = Field(default=0, ge=0)
+    grpc_server_keepalive_timeout_ms: int = Field(default=20_000, gt=0)
+    # Most frequent client keepalive ping accepted (keep <= GATEWAY_GRPC_KEEPALIVE_TIME_MS)
+    grpc_server_min_ping_interval_ms: int = Field(default=10_000, ge=0)
+    # Default response compression; gzip pays off for large streamed responses
+    grpc_server_compression: Literal["none", "gzip"] = "none"
+    # On SIGTERM/SIGINT: stop accepting calls, let in-flight ones finish for this long
+    grpc_server_shutdown_grace_seconds: float = Field(default=5.0, ge=0)
+
+
+def server_options(settings: GrpcServerSettings, reuse_port: bool = False) -> list[tuple[str, int]]:
+    """Channel args for `settings`. `reuse_port` lets pre-fork workers share one port;
+    without it a second process binding the same port fails instead of splitting traffic."""
+    options = [
+        ("grpc.so_reuseport", int(reuse_port)),
+        ("grpc.max_send_message_length", settings.grpc_server_max_message_bytes),
+        ("grpc.max_receive_message_length", settings.grpc_server_max_message_bytes),
+        ("grpc.http2.min_ping_interval_without_data_ms", settings.grpc_server_min_ping_interval_ms),
+        ("grpc.http2.max_ping_strikes", 2),
+    ]
+    if settings.grpc_server_keepalive_time_ms:
+        options += [
+            ("grpc.keepalive_time_ms", settings.grpc_server_keepalive_time_ms),
+            ("grpc.keepalive_timeout_ms", settings.grpc_server_keepalive_timeout_ms),
+        ]
+    return options
+
+
+def create_server(
+    settings: GrpcServerSettings,
+    interceptors: list[aio.ServerInterceptor] | None = None,
+    reuse_port: bool = False,
+) -> aio.Server:
+    """aio server tuned by `settings`; interceptors default to tracing (when on) + metrics."""
+    if interceptors is None:
+        interceptors = [*server_interceptors(), MetricsServerInterceptor()]
+    return aio.server(
+        interceptors=interceptors,
+        options=server_options(settings, reuse_port),
+        maximum_concurrent_rpcs=settings.grpc_server_max_concurrent_rpcs or None,
+        compression=_COMPRESSION[settings.grpc_server_compression],
+    )
+
+
+async def serve_until_signal(server: aio.Server, grace_seconds: float) -> None:
+    """Wait for SIGTERM/SIGINT, then stop `server`, giving in-flight calls `grace_seconds`."""
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGTERM, signal.SIGINT):
+        loop.add_signal_handler(sig, stop.set)
+    try:
+        await stop.wait()
+    finally:
+        for sig in (signal.SIGTERM, signal.SIGINT):
+            loop.remove_signal_handler(sig)
+    logger.info("Shutting down gRPC server grace=%ss", grace_seconds)
+    await server.stop(grace_seconds)
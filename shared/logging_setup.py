@@ -0,0 +1,139 @@
+"""Shared logging setup: records go through a queue and are written by a background thread.
+
+Request-path `logger.info` calls only filter, resolve the message and enqueue; formatting
+(JSON encoding, tracebacks) and the stream write happen on the QueueListener thread, so a
+slow stdout/stderr never blocks the event loop. Configured by LOG_* env vars (LoggingSettings).
+"""
+
+import atexit
+import contextlib
+import copy
+import json
+import logging
+import queue
+import random
+import sys
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from typing import Literal
+
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+_TEXT_FORMAT = "%(asctime)s %(levelname)s [%(name)s] %(message)s"
+_RESERVED = set(vars(logging.LogRecord("", 0, "", 0, "", None, None))) | {"message", "asctime"}
+
+
+class LoggingSettings(BaseSettings):
+    model_config = SettingsConfigDict(env_prefix="LOG_", env_file=".env", extra="ignore")
+
+    format: Literal["json", "text"] = "json"
+    # Fraction of INFO-and-below records kept per logger prefix, e.g.
+    # '{"weather.api.servicer": 0.1, "gateway.api": 0.01}'; WARNING+ is never sampled
+    sample_rates: dict[str, float] = {}
+    queue_size: int = 10_000
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line: ts, level, logger, msg, service, extras, exc."""
+
+    def __init__(self, service: str = ""):
+        super().__init__()
+        self._service = service
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "msg": record.getMessage(),
+        }
+        if self._service:
+            entry["service"] = self._service
+        for key, value in vars(record).items():
+            if key not in _RESERVED and not key.startswith("_"):
+                entry[key] = value
+        if record.exc_info:
+            entry["exc"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            entry["exc"] = record.exc_text
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class SamplingFilter(logging.Filter):
+    """Keep INFO-and-below records from `rates` prefixes with the given probability.
+
+    The longest matching prefix wins; unmatched loggers and WARNING+ always pass.
+    """
+
+    def __init__(self, rates: dict[str, float], rng=random.random):
+        super().__init__()
+        self._rates = sorted(rates.items(), key=lambda item: len(item[0]), reverse=True)
+        self._rng = rng
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING or not self._rates:
+            return True
+        for prefix, rate in self._rates:
+            if record.name == prefix or record.name.startswith(prefix + "."):
+                return self._rng() < rate
+        return True
+
+
+class _DroppingQueueHandler(QueueHandler):
+    """Never blocks the caller: when the queue is full the record is dropped."""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Unlike QueueHandler.prepare, do not format here: only resolve msg % args (args may
+        # be mutable objects) and keep exc_info, so the listener's formatter renders the
+        # traceback off the event loop and into its own field.
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        with contextlib.suppress(queue.Full):
+            self.queue.put_nowait(record)
+
+
+class _Listener(QueueListener):
+    """QueueListener whose stop() may be called again (e.g. explicitly and at exit)."""
+
+    def stop(self) -> None:
+        if self._thread is not None:
+            super().stop()
+
+
+def setup_logging(
+    level: str,
+    service: str = "",
+    settings: LoggingSettings | None = None,
+    stream=None,
+) -> QueueListener | None:
+    """Install the queue pipeline on the root logger; the listener is stopped at exit.
+
+    Like `logging.basicConfig`, does nothing (returns None) if root already has handlers.
+    """
+    root = logging.getLogger()
+    if root.handlers:
+        return None
+    settings = settings or LoggingSettings()
+    if settings.format == "json":
+        formatter: logging.Formatter = JsonFormatter(service)
+    else:
+        formatter = logging.Formatter(_TEXT_FORMAT)
+    output = logging.StreamHandler(stream or sys.stderr)
+    output.setFormatter(formatter)
+
+    records: queue.Queue = queue.Queue(maxsize=settings.queue_size)
+    handler = _DroppingQueueHandler(records)
+    if settings.sample_rates:
+        handler.addFilter(SamplingFilter(settings.sample_rates))
+
+    root.addHandler(handler)
+    root.setLevel(getattr(logging, level.upper(), logging.INFO))
+
+    listener = _Listener(records, output, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+    return listener
@@ -0,0 +1,126 @@
+"""Prometheus metrics shared by the services: gRPC server, caches and upstream calls.
+
+Each process exposes its registry with `start_metrics_server(port)` (port 0 = disabled).
+"""
+
+import logging
+import time
+from collections.abc import AsyncIterator, Callable
+
+import grpc
+from grpc import aio
+from prometheus_client import Counter, Histogram, start_http_server
+
+from shared.grpc_handlers import split_method, status_name, wrap_rpc_handler
+
+logger = logging.getLogger(__name__)
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+GRPC_SERVER_HANDLED = Counter(
+    "dresscast_grpc_server_handled_total",
+    "gRPC calls completed on the server by method and status code",
+    ["grpc_service", "grpc_method", "grpc_code"],
+)
+GRPC_SERVER_LATENCY = Histogram(
+    "dresscast_grpc_server_handling_seconds",
+    "gRPC server handling time by method",
+    ["grpc_service", "grpc_method"],
+    buckets=LATENCY_BUCKETS,
+)
+CACHE_REQUESTS = Counter(
+    "dresscast_cache_requests_total",
+    "Cache lookups by cache and result (hit, miss, error)",
+    ["cache", "result"],
+)
+UPSTREAM_LATENCY = Histogram(
+    "dresscast_upstream_request_seconds",
+    "Outbound request latency by upstream, operation and outcome (ok, error)",
+    ["upstream", "operation", "outcome"],
+    buckets=LATENCY_BUCKETS + (20.0, 30.0),
+)
+
+
+def start_metrics_server(port: int, service: str) -> None:
+    """Serve /metrics on `port` from a background thread; 0 disables it."""
+    if not port:
+        return
+    start_http_server(port)
+    logger.info("%s metrics on :%s/metrics", service, port)
+
+
+class UpstreamTimer:
+    """Async context manager observing one upstream call into UPSTREAM_LATENCY."""
+
+    def __init__(self, upstream: str, operation: str):
+        self._upstream = upstream
+        self._operation = operation
+        self._started = 0.0
+
+    async def __aenter__(self) -> "UpstreamTimer":
+        self._started = time.perf_counter()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        UPSTREAM_LATENCY.labels(
+            upstream=self._upstream,
+            operation=self._operation,
+            outcome="ok" if exc_type is None else "error",
+        ).observe(time.perf_counter() - self._started)
+
+
+class MetricsServerInterceptor(aio.ServerInterceptor):
+    """Counts completed calls by status code and observes handling time per method.
+
+    The status comes from `context.code()`, so servicers that report errors via
+    `context.set_code` (as ours do) are counted under that code, not OK.
+    """
+
+    async def intercept_service(
+        self,
+        continuation: Callable,
+        handler_call_details: grpc.HandlerCallDetails,
+    ):
+        handler = await continuation(handler_call_details)
+        if handler is None:
+            return None
+        service, method = split_method(handler_call_details.method)
+
+        def record(context, started: float, error: BaseException | None) -> None:
+            GRPC_SERVER_LATENCY.labels(grpc_service=service, grpc_method=method).observe(
+                time.perf_counter() - started
+            )
+            GRPC_SERVER_HANDLED.labels(
+                grpc_service=service, grpc_method=method, grpc_code=status_name(context, error)
+            ).inc()
+
+        def wrap_unary(behavior):
+            async def unary(request, context):
+                started = time.perf_counter()
+                error = None
+                try:
+                    return await behavior(request, context)
+                except BaseException as e:
+                    error = e
+                    raise
+                finally:
+                    record(context, started, error)
+
+            return unary
+
+        def wrap_streaming(behavior):
+            async def streaming(request, context) -> AsyncIterator:
+                started = time.perf_counter()
+                error = None
+                try:
+                    async for response in behavior(request, context):
+                        yield response
+                except BaseException as e:
+                    error = e
+                    raise
+                finally:
+                    record(context, started, error)
+
+            return streaming
+
+        return wrap_rpc_handler(handler, wrap_unary, wrap_streaming)
@@ -0,0 +1,77 @@
+"""bcrypt hashing off the event loop: a bounded thread pool shared per process."""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+import bcrypt
+
+# bcrypt limits password to 72 bytes
+MAX_PASSWORD_BYTES = 72
+DEFAULT_ROUNDS = 12
+
+
+def _encode(password: str) -> bytes:
+    return password.encode("utf-8")[:MAX_PASSWORD_BYTES]
+
+
+def hash_password(password: str, rounds: int = DEFAULT_ROUNDS) -> str:
+    """Blocking bcrypt hash (~2**rounds work); call via PasswordHasher from async code."""
+    return bcrypt.hashpw(_encode(password), bcrypt.gensalt(rounds)).decode("utf-8")
+
+
+def verify_password(password: str, password_hash: str) -> bool:
+    """Blocking bcrypt check; False for malformed hashes."""
+    try:
+        return bcrypt.checkpw(_encode(password), password_hash.encode("utf-8"))
+    except ValueError:
+        return False
+
+
+class HashingOverloadedError(Exception):
+    """More than `max_pending` hash/verify jobs are already queued or running."""
+
+
+class PasswordHasher:
+    """Runs bcrypt in at most `max_workers` threads (bcrypt releases the GIL while hashing).
+
+    The event loop only awaits the result, so a burst of registrations queues in the
+    pool instead of stalling every other request on the worker. With `max_pending`, jobs
+    beyond that many in flight fail fast with HashingOverloadedError instead of queueing.
+    """
+
+    def __init__(
+        self,
+        rounds: int = DEFAULT_ROUNDS,
+        max_workers: int = 2,
+        max_pending: int | None = None,
+    ):
+        if not 4 <= rounds <= 31:
+            raise ValueError("bcrypt rounds must be between 4 and 31")
+        self._rounds = rounds
+        self._max_pending = max_pending
+        self._pending = 0
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="password-hash"
+        )
+
+    @property
+    def pending(self) -> int:
+        return self._pending
+
+    async def _run(self, fn, *args):
+        if self._max_pending is not None and self._pending >= self._max_pending:
+            raise HashingOverloadedError(f"{self._pending} password jobs pending")
+        self._pending += 1
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._executor, fn, *args)
+        finally:
+            self._pending -= 1
+
+    async def hash(self, password: str) -> str:
+        return await self._run(hash_password, password, self._rounds)
+
+    async def verify(self, password: str, password_hash: str) -> bool:
+        return await self._run(verify_password, password, password_hash)
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,74 @@
+"""Pre-fork serving: N worker processes share one gRPC port through SO_REUSEPORT.
+
+Workers are started with the spawn method, so each is a fresh interpreter that builds
+its own event loop, gRPC server, Redis client and HTTP client; no gRPC or asyncio state
+crosses a fork. The kernel spreads new connections across the workers. One HTTP/2
+connection stays on one worker, so a client uses every worker only with several
+channels (GATEWAY_GRPC_CHANNELS_PER_TARGET >= workers).
+"""
+
+import importlib
+import logging
+import multiprocessing
+import signal
+from multiprocessing.connection import wait
+
+logger = logging.getLogger(__name__)
+
+
+def _run_target(target: str, index: int) -> None:
+    module, _, function = target.partition(":")
+    getattr(importlib.import_module(module), function)(index)
+
+
+def run_workers(target: str, workers: int, name: str, grace_seconds: float) -> int:
+    """Run `target(index)` in `workers` spawned processes until they exit; returns an exit code.
+
+    `target` is "module:function" (like uvicorn's app strings), so workers import the entry
+    module under its real name rather than as `__mp_main__`.
+
+    SIGTERM/SIGINT are forwarded to every worker as SIGTERM (each stops its server
+    gracefully); workers still alive `grace_seconds` later are killed. If one worker dies
+    on its own, the others are stopped too and the supervisor exits non-zero, leaving
+    restarts to the process manager.
+    """
+    ctx = multiprocessing.get_context("spawn")
+    processes = [
+        ctx.Process(target=_run_target, args=(target, i), name=f"{name}-worker-{i}")
+        for i in range(workers)
+    ]
+    stopping = False
+
+    def stop_all(signum=signal.SIGTERM, _frame=None) -> None:
+        nonlocal stopping
+        if not stopping:
+            logger.info("%s: stopping %s workers (signal %s)", name, workers, signum)
+        stopping = True
+        for process in processes:
+            if process.is_alive():
+                process.terminate()
+
+    previous = {sig: signal.signal(sig, stop_all) for sig in (signal.SIGTERM, signal.SIGINT)}
+    try:
+        for process in processes:
+            process.start()
+        logger.info("%s: started %s workers pids=%s", name, workers, [p.pid for p in processes])
+
+        exited = wait([p.sentinel for p in processes])
+        if not stopping:
+            failed = next(p for p in processes if p.sentinel in exited)
+            failed.join()
+            logger.error("%s: %s exited with %s", name, failed.name, failed.exitcode)
+            stop_all()
+
+        for process in processes:
+            process.join(grace_seconds + 1)
+            if process.is_alive():
+                logger.warning("%s: killing %s after %ss", name, process.name, grace_seconds)
+                process.kill()
+                process.join()
+    finally:
+        for sig, handler in previous.items():
+            signal.signal(sig, handler)
+    clean = all(p.exitcode == 0 for p in processes)
+    return 0 if stopping and clean else 1
@@ -0,0 +1,253 @@
+"""OpenTelemetry tracing: provider setup and W3C trace context over gRPC metadata.
+
+Tracing is off unless TRACING_EXPORTER is set (TracingSettings). While it is off the
+global tracer is the API's no-op one, and `server_interceptors()`/`client_interceptors()`
+return empty lists, so the request path pays nothing for it.
+"""
+
+import atexit
+import logging
+from collections.abc import AsyncIterator, Callable, Iterable
+from typing import Literal
+
+import grpc
+from grpc import aio
+from opentelemetry import propagate, trace
+from opentelemetry.sdk.resources import Resource
+from opentelemetry.sdk.trace import ReadableSpan, TracerProvider
+from opentelemetry.sdk.trace.export import (
+    BatchSpanProcessor,
+    ConsoleSpanExporter,
+    SimpleSpanProcessor,
+    SpanExporter,
+)
+from opentelemetry.sdk.trace.sampling import ParentBased, TraceIdRatioBased
+from opentelemetry.trace import SpanKind, Status, StatusCode
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+from shared.grpc_handlers import split_method, status_name, wrap_rpc_handler
+
+logger = logging.getLogger(__name__)
+
+tracer = trace.get_tracer("dresscast")
+
+_enabled = False
+
+
+class TracingSettings(BaseSettings):
+    model_config = SettingsConfigDict(env_prefix="TRACING_", env_file=".env", extra="ignore")
+
+    # none | console | otlp (OTLP over gRPC to otlp_endpoint)
+    exporter: Literal["none", "console", "otlp"] = "none"
+    otlp_endpoint: str = "http://localhost:4317"
+    # Fraction of new traces recorded; calls with a sampled parent are always recorded
+    sample_ratio: float = 1.0
+
+
+def _exporter(settings: TracingSettings) -> SpanExporter:
+    if settings.exporter == "console":
+        return ConsoleSpanExporter()
+    from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import OTLPSpanExporter
+
+    return OTLPSpanExporter(endpoint=settings.otlp_endpoint, insecure=True)
+
+
+def setup_tracing(
+    service: str,
+    settings: TracingSettings | None = None,
+    exporter: SpanExporter | None = None,
+) -> TracerProvider | None:
+    """Install a global TracerProvider for `service`; returns None when tracing is off.
+
+    An explicit `exporter` (e.g. InMemorySpanExporter in tests) is used synchronously
+    and regardless of settings; configured exporters are batched in a background thread.
+    """
+    global _enabled
+    settings = settings or TracingSettings()
+    if exporter is None and settings.exporter == "none":
+        return None
+    provider = TracerProvider(
+        resource=Resource.create({"service.name": service}),
+        sampler=ParentBased(TraceIdRatioBased(settings.sample_ratio)),
+    )
+    if exporter is not None:
+        provider.add_span_processor(SimpleSpanProcessor(exporter))
+    else:
+        provider.add_span_processor(BatchSpanProcessor(_exporter(settings)))
+        atexit.register(provider.shutdown)
+    trace.set_tracer_provider(provider)
+    _enabled = True
+    logger.info("Tracing enabled service=%s exporter=%s", service, settings.exporter)
+    return provider
+
+
+def server_interceptors() -> list[aio.ServerInterceptor]:
+    return [TracingServerInterceptor()] if _enabled else []
+
+
+def client_interceptors() -> list[aio.ClientInterceptor]:
+    return tracing_client_interceptors() if _enabled else []
+
+
+def _rpc_attributes(full_method: str) -> dict[str, str]:
+    service, method = split_method(full_method)
+    return {"rpc.system": "grpc", "rpc.service": service, "rpc.method": method}
+
+
+def _end(span: trace.Span, code: str) -> None:
+    span.set_attribute("rpc.grpc.status_code", code)
+    if code != grpc.StatusCode.OK.name:
+        span.set_status(Status(StatusCode.ERROR, code))
+
+
+class TracingServerInterceptor(aio.ServerInterceptor):
+    """SERVER span per call, child of the caller's span from `traceparent` metadata."""
+
+    async def intercept_service(
+        self,
+        continuation: Callable,
+        handler_call_details: grpc.HandlerCallDetails,
+    ):
+        handler = await continuation(handler_call_details)
+        if handler is None:
+            return None
+        name = handler_call_details.method.lstrip("/")
+        attributes = _rpc_attributes(handler_call_details.method)
+        parent = propagate.extract(dict(handler_call_details.invocation_metadata or ()))
+
+        def wrap_unary(behavior):
+            async def unary(request, context):
+                with tracer.start_as_current_span(
+                    name, context=parent, kind=SpanKind.SERVER, attributes=attributes
+                ) as span:
+                    error = None
+                    try:
+                        return await behavior(request, context)
+                    except BaseException as e:
+                        error = e
+                        raise
+                    finally:
+                        _end(span, status_name(context, error))
+
+            return unary
+
+        def wrap_streaming(behavior):
+            async def streaming(request, context) -> AsyncIterator:
+                with tracer.start_as_current_span(
+                    name, context=parent, kind=SpanKind.SERVER, attributes=attributes
+                ) as span:
+                    error = None
+                    try:
+                        async for response in behavior(request, context):
+                            yield response
+                    except BaseException as e:
+                        error = e
+                        raise
+                    finally:
+                        _end(span, status_name(context, error))
+
+            return streaming
+
+        return wrap_rpc_handler(handler, wrap_unary, wrap_streaming)
+
+
+class TracingClientInterceptor:
+    """CLIENT span per outgoing call; its context travels as `traceparent` metadata.
+
+    Single-response calls end the span with the final status; streaming calls end it
+    when the call completes. Install it via `tracing_client_interceptors()`.
+    """
+
+    def _start(self, details: aio.ClientCallDetails) -> tuple[trace.Span, aio.ClientCallDetails]:
+        method = details.method.decode() if isinstance(details.method, bytes) else details.method
+        span = tracer.start_span(
+            method.lstrip("/"), kind=SpanKind.CLIENT, attributes=_rpc_attributes(method)
+        )
+        carrier: dict[str, str] = {}
+        propagate.inject(carrier, context=trace.set_span_in_context(span))
+        metadata = aio.Metadata(*(details.metadata or ()), *carrier.items())
+        return span, details._replace(metadata=metadata)
+
+    async def _single(self, continuation, details, request):
+        span, details = self._start(details)
+        try:
+            call = await continuation(details, request)
+            _end(span, (await call.code()).name)
+            return call
+        except BaseException as e:
+            span.record_exception(e)
+            _end(span, grpc.StatusCode.UNKNOWN.name)
+            raise
+        finally:
+            span.end()
+
+    async def _streaming(self, continuation, details, request):
+        span, details = self._start(details)
+        try:
+            call = await continuation(details, request)
+        except BaseException:
+            _end(span, grpc.StatusCode.UNKNOWN.name)
+            span.end()
+            raise
+        call.add_done_callback(lambda _: span.end())
+        return call
+
+    async def intercept_unary_unary(self, continuation, client_call_details, request):
+        return await self._single(continuation, client_call_details, request)
+
+    async def intercept_stream_unary(self, continuation, client_call_details, request_iterator):
+        return await self._single(continuation, client_call_details, request_iterator)
+
+    async def intercept_unary_stream(self, continuation, client_call_details, request):
+        return await self._streaming(continuation, client_call_details, request)
+
+    async def intercept_stream_stream(self, continuation, client_call_details, request_iterator):
+        return await self._streaming(continuation, client_call_details, request_iterator)
+
+
+class _UnaryUnaryTracing(TracingClientInterceptor, aio.UnaryUnaryClientInterceptor):
+    pass
+
+
+class _UnaryStreamTracing(TracingClientInterceptor, aio.UnaryStreamClientInterceptor):
+    pass
+
+
+class _StreamUnaryTracing(TracingClientInterceptor, aio.StreamUnaryClientInterceptor):
+    pass
+
+
+class _StreamStreamTracing(TracingClientInterceptor, aio.StreamStreamClientInterceptor):
+    pass
+
+
+def tracing_client_interceptors() -> list[aio.ClientInterceptor]:
+    """One interceptor per call kind: a channel files each interceptor under the first
+    kind it matches, so a single combined one would only ever see unary-unary calls."""
+    return [
+        _UnaryUnaryTracing(),
+        _UnaryStreamTracing(),
+        _StreamUnaryTracing(),
+        _StreamStreamTracing(),
+    ]
+
+
+def format_span_tree(spans: Iterable[ReadableSpan]) -> str:
+    """Indented `name  duration ms` tree per trace: where a request spent its time."""
+    spans = sorted(spans, key=lambda s: s.start_time or 0)
+    ids = {s.context.span_id for s in spans}
+    children: dict[int | None, list[ReadableSpan]] = {}
+    for span in spans:
+        parent = span.parent.span_id if span.parent and span.parent.span_id in ids else None
+        children.setdefault(parent, []).append(span)
+
+    lines: list[str] = []
+
+    def walk(parent: int | None, depth: int) -> None:
+        for span in children.get(parent, []):
+            millis = ((span.end_time or 0) - (span.start_time or 0)) / 1e6
+            lines.append(f"{'  ' * depth}{span.name}  {millis:.1f} ms")
+            walk(span.context.span_id, depth + 1)
+
+    walk(None, 0)
+    return "\n".join(lines)
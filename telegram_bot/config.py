@@ -9,3 +9,8 @@ class TelegramBotConfig(BaseSettings):
     telegram_bot_token: str = ""
     gateway_grpc_addr: str = "localhost:50050"
     log_level: str = "INFO"
+    # Per-session cache of GetOrCreateUserByTelegramId results (0 disables)
+    user_cache_ttl_seconds: float = 300.0
+    user_cache_max_size: int = 10_000
+    # Minimum seconds between progressive edits of a streamed advice message
+    stream_edit_interval_seconds: float = 1.0
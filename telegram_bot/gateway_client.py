@@ -1,6 +1,8 @@
 """Gateway client for Telegram bot (gRPC stub wrapper)."""
 
 import sys
+import time
+from collections import OrderedDict
 from pathlib import Path
 
 ROOT = Path(__file__).resolve().parent.parent
@@ -15,10 +17,19 @@ from grpc import aio
 
 
 class GatewayClient:
-    def __init__(self, gateway_addr: str):
+    def __init__(
+        self,
+        gateway_addr: str,
+        user_cache_ttl_seconds: float = 300.0,
+        user_cache_max_size: int = 10_000,
+    ):
         self._addr = gateway_addr
         self._channel: aio.Channel | None = None
         self._stub = None
+        # telegram_id -> (expires_at, user): repeated button presses skip the RPC
+        self._user_cache: OrderedDict[str, tuple[float, object]] = OrderedDict()
+        self._user_cache_ttl = user_cache_ttl_seconds
+        self._user_cache_max_size = user_cache_max_size
 
     async def get_stub(self):
         if self._stub is None:
@@ -29,12 +40,25 @@ class GatewayClient:
     async def get_or_create_user_by_telegram(
         self, telegram_id: str, username: str = "", locale: str = "en"
     ):
+        cached = self._user_cache.get(telegram_id)
+        if cached is not None:
+            expires_at, user = cached
+            if expires_at > time.monotonic():
+                self._user_cache.move_to_end(telegram_id)
+                return user
+            del self._user_cache[telegram_id]
         s = await self.get_stub()
-        return await s.GetOrCreateUserByTelegramId(
+        user = await s.GetOrCreateUserByTelegramId(
             gateway_pb2.GetOrCreateUserByTelegramIdGatewayRequest(
                 telegram_id=telegram_id, username=username, locale=locale
             )
         )
+        if user.id and self._user_cache_ttl > 0:
+            self._user_cache[telegram_id] = (time.monotonic() + self._user_cache_ttl, user)
+            self._user_cache.move_to_end(telegram_id)
+            while len(self._user_cache) > self._user_cache_max_size:
+                self._user_cache.popitem(last=False)
+        return user
 
     async def list_cities(self, user_id: int):
         s = await self.get_stub()
@@ -59,3 +83,13 @@ class GatewayClient:
         return await s.GetDressAdvice(
             gateway_pb2.GetDressAdviceRequest(user_id=user_id, city_name=city_name, locale=locale)
         )
+
+    async def stream_dress_advice(self, user_id: int, city_name: str, locale: str = "en"):
+        """Yield advice text chunks as the gateway streams them."""
+        s = await self.get_stub()
+        call = s.StreamDressAdvice(
+            gateway_pb2.GetDressAdviceRequest(user_id=user_id, city_name=city_name, locale=locale)
+        )
+        async for chunk in call:
+            if chunk.text:
+                yield chunk.text
@@ -9,7 +9,7 @@ from telegram_bot.handlers.cities import (
     city_actions_keyboard,
     send_city_list_page,
 )
-from telegram_bot.handlers.dress import get_dress_message
+from telegram_bot.handlers.dress import edit_interval, stream_dress_message
 from telegram_bot.handlers.language import _language_keyboard
 from telegram_bot.handlers.weather import get_weather_message
 from telegram_bot.i18n import t
@@ -17,6 +17,19 @@ from telegram_bot.i18n import t
 logger = logging.getLogger(__name__)
 
 
+async def _stream_dress(query, context, gateway_client, user_id: int, city_name: str, locale: str):
+    """Show streamed dress advice in the callback's message, starting from a placeholder."""
+    await query.edit_message_text(text=t("commands.dress.thinking", locale))
+    await stream_dress_message(
+        gateway_client,
+        user_id,
+        city_name,
+        locale,
+        edit=lambda text: query.edit_message_text(text=text),
+        min_interval_seconds=edit_interval(context),
+    )
+
+
 async def _handle_main_menu(
     update: Update,
     context: ContextTypes.DEFAULT_TYPE,
@@ -111,8 +124,7 @@ async def _handle_city_selected(
     if intent == "dress":
         try:
             user = await gateway_client.get_or_create_user_by_telegram(telegram_id)
-            text = await get_dress_message(gateway_client, user.id, city_name, locale)
-            await query.edit_message_text(text=text)
+            await _stream_dress(query, context, gateway_client, user.id, city_name, locale)
         except Exception as e:
             logger.warning(
                 "City callback dress failed telegram_id=%s city=%s: %s", telegram_id, city_name, e
@@ -152,9 +164,9 @@ async def _handle_city_action(
         user = await gateway_client.get_or_create_user_by_telegram(telegram_id)
         if action == "w":
             text = await get_weather_message(gateway_client, user.id, city_name, locale)
+            await query.edit_message_text(text=text)
         else:
-            text = await get_dress_message(gateway_client, user.id, city_name, locale)
-        await query.edit_message_text(text=text)
+            await _stream_dress(query, context, gateway_client, user.id, city_name, locale)
     except Exception as e:
         logger.warning("City action failed telegram_id=%s city=%s: %s", telegram_id, city_name, e)
         await query.edit_message_text(text=t("commands.errors.generic", locale))
@@ -247,9 +259,9 @@ async def city_callback(
         user = await gateway_client.get_or_create_user_by_telegram(telegram_id)
         if kind == "w":
             text = await get_weather_message(gateway_client, user.id, city_name, locale)
+            await query.edit_message_text(text=text)
         else:
-            text = await get_dress_message(gateway_client, user.id, city_name, locale)
-        await query.edit_message_text(text=text)
+            await _stream_dress(query, context, gateway_client, user.id, city_name, locale)
     except Exception as e:
         logger.warning("City callback failed telegram_id=%s city=%s: %s", telegram_id, city_name, e)
         await query.edit_message_text(text=t("commands.errors.generic", locale))
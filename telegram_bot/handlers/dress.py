@@ -1,27 +1,55 @@
 """Dress advice command: /dress [city_name] — advice via gateway."""
 
 import logging
+from collections.abc import Awaitable, Callable
 
 from telegram import Update
 from telegram.ext import ContextTypes
 
 from telegram_bot.i18n import t
+from telegram_bot.streaming import DEFAULT_EDIT_INTERVAL_SECONDS, ThrottledMessageEditor
 
 logger = logging.getLogger(__name__)
 
 
-async def get_dress_message(gateway_client, user_id: int, city_name: str, locale: str) -> str:
-    """Fetch dress advice and return message text (or error message)."""
+def _error_text(e: Exception, locale: str) -> str:
+    err_msg = str(e).lower()
+    if "not found" in err_msg or "city_not_found" in err_msg:
+        return t("commands.errors.city_not_found", locale)
+    return t("commands.errors.generic", locale)
+
+
+def edit_interval(context: ContextTypes.DEFAULT_TYPE) -> float:
+    return (context.bot_data or {}).get(
+        "stream_edit_interval_seconds", DEFAULT_EDIT_INTERVAL_SECONDS
+    )
+
+
+async def stream_dress_message(
+    gateway_client,
+    user_id: int,
+    city_name: str,
+    locale: str,
+    edit: Callable[[str], Awaitable[object]],
+    min_interval_seconds: float = DEFAULT_EDIT_INTERVAL_SECONDS,
+) -> None:
+    """Render streamed advice into a message through `edit`, throttled to Telegram's limits.
+
+    Errors before any text replace the message with an error; a partial answer is kept.
+    """
+    editor = ThrottledMessageEditor(edit, min_interval_seconds)
     try:
-        r = await gateway_client.get_dress_advice(user_id, city_name, locale=locale)
-        text = (r.advice_text or "").strip() or t("commands.errors.city_not_found", locale)
-        return text
+        async for chunk in gateway_client.stream_dress_advice(user_id, city_name, locale=locale):
+            await editor.append(chunk)
     except Exception as e:
-        logger.warning("Dress advice failed for user_id=%s city %s: %s", user_id, city_name, e)
-        err_msg = str(e).lower()
-        if "not found" in err_msg or "city_not_found" in err_msg:
-            return t("commands.errors.city_not_found", locale)
-        return t("commands.errors.generic", locale)
+        logger.warning(
+            "Dress advice stream failed for user_id=%s city %s: %s", user_id, city_name, e
+        )
+        if not editor.text:
+            await edit(_error_text(e, locale))
+            return
+    if not await editor.finish():
+        await edit(t("commands.errors.city_not_found", locale))
 
 
 async def dress(
@@ -40,8 +68,15 @@ async def dress(
         return
     try:
         user = await gateway_client.get_or_create_user_by_telegram(telegram_id)
-        text = await get_dress_message(gateway_client, user.id, city_name, locale)
-        await update.message.reply_text(text)
+        message = await update.message.reply_text(t("commands.dress.thinking", locale))
+        await stream_dress_message(
+            gateway_client,
+            user.id,
+            city_name,
+            locale,
+            edit=lambda text: message.edit_text(text),
+            min_interval_seconds=edit_interval(context),
+        )
     except Exception as e:
         logger.warning("Dress advice failed for user %s city %s: %s", telegram_id, city_name, e)
         await update.message.reply_text(t("commands.errors.generic", locale))
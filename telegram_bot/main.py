@@ -21,6 +21,7 @@ from telegram.ext import (
     filters,
 )
 
+from shared.logging_setup import setup_logging
 from telegram_bot.config import TelegramBotConfig
 from telegram_bot.gateway_client import GatewayClient
 from telegram_bot.handlers.add_city import add_city
@@ -107,14 +108,15 @@ async def main_menu_handler(
 
 def main() -> None:
     config = TelegramBotConfig()
-    logging.basicConfig(
-        format="%(asctime)s %(levelname)s [%(name)s] %(message)s",
-        level=getattr(logging, config.log_level.upper(), logging.INFO),
-    )
+    setup_logging(config.log_level, "telegram_bot")
     if not config.telegram_bot_token:
         print("Set TELEGRAM_BOT_TOKEN to run the bot.")
         return
-    client = GatewayClient(config.gateway_grpc_addr)
+    client = GatewayClient(
+        config.gateway_grpc_addr,
+        user_cache_ttl_seconds=config.user_cache_ttl_seconds,
+        user_cache_max_size=config.user_cache_max_size,
+    )
 
     async def cities_cmd(update, context):
         await cities(update, context, gateway_client=client)
@@ -143,6 +145,7 @@ def main() -> None:
         await application.bot.set_my_commands(get_menu_commands("en"))
 
     app = Application.builder().token(config.telegram_bot_token).post_init(post_init).build()
+    app.bot_data["stream_edit_interval_seconds"] = config.stream_edit_interval_seconds
     app.add_handler(CommandHandler("start", start))
     app.add_handler(CommandHandler("cities", cities_cmd))
     app.add_handler(CommandHandler("add_city", add_city_cmd))
@@ -0,0 +1,55 @@
+"""Progressive rendering: edit a Telegram message as streamed text arrives, rate-limited."""
+
+import logging
+import time
+from collections.abc import Awaitable, Callable
+
+logger = logging.getLogger(__name__)
+
+# Telegram tolerates roughly one edit per second per chat before answering 429
+DEFAULT_EDIT_INTERVAL_SECONDS = 1.0
+
+
+class ThrottledMessageEditor:
+    """Accumulates chunks; the first chunk is shown at once, later ones at most every
+    `min_interval_seconds`. `finish` always shows the complete text.
+    """
+
+    def __init__(
+        self,
+        edit: Callable[[str], Awaitable[object]],
+        min_interval_seconds: float = DEFAULT_EDIT_INTERVAL_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._edit = edit
+        self._interval = min_interval_seconds
+        self._clock = clock
+        self._parts: list[str] = []
+        self._shown = ""
+        self._last_edit: float | None = None
+
+    @property
+    def text(self) -> str:
+        return "".join(self._parts).strip()
+
+    async def append(self, chunk: str) -> None:
+        self._parts.append(chunk)
+        now = self._clock()
+        if self._last_edit is None or now - self._last_edit >= self._interval:
+            try:
+                await self._show(now)
+            except Exception as e:
+                # An intermediate edit is best-effort (429, "message is not modified")
+                logger.debug("Progressive edit skipped: %s", e)
+
+    async def finish(self) -> str:
+        await self._show(self._clock())
+        return self.text
+
+    async def _show(self, now: float) -> None:
+        text = self.text
+        if not text or text == self._shown:
+            return
+        self._last_edit = now
+        await self._edit(text)
+        self._shown = text
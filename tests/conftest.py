@@ -3,8 +3,29 @@
 import sys
 from pathlib import Path
 
+import pytest
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+
 ROOT = Path(__file__).resolve().parent.parent
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 if str(ROOT / "proto_gen") not in sys.path:
     sys.path.insert(0, str(ROOT / "proto_gen"))
+
+
+@pytest.fixture(scope="session")
+def span_exporter():
+    """In-memory span exporter behind the global TracerProvider (installed once per session)."""
+    from shared.tracing import setup_tracing
+
+    exporter = InMemorySpanExporter()
+    setup_tracing("tests", exporter=exporter)
+    return exporter
+
+
+@pytest.fixture
+def spans(span_exporter):
+    """Finished spans of the current test."""
+    span_exporter.clear()
+    yield span_exporter
+    span_exporter.clear()
@@ -0,0 +1,67 @@
+"""Advice key policies: banded keys collapse equivalent readings."""
+
+from unittest.mock import AsyncMock
+
+import pytest
+
+from dress_advice.application.advice_keys import BandedKeyPolicy, build_key_policy
+from dress_advice.application.use_cases.get_advice import (
+    ExactKeyPolicy,
+    GetAdviceUseCase,
+    WeatherData,
+)
+from scripts.replay_advice_keys import replay
+
+
+def _wd(temperature=14.3, humidity=55.0, wind_speed=3.0, precipitation=0.0) -> WeatherData:
+    return WeatherData(temperature, humidity, wind_speed, precipitation, time="")
+
+
+def test_exact_policy_keeps_original_key_format():
+    assert ExactKeyPolicy().key(_wd(), "en") == "advice:14.3:55:3.0:0.0:en"
+
+
+def test_banded_policy_shares_key_for_nearby_readings():
+    policy = BandedKeyPolicy(temperature_step=3.0)
+    assert policy.key(_wd(14.3), "en") == policy.key(_wd(14.4, humidity=60, wind_speed=3.3), "en")
+    assert policy.key(_wd(14.3), "en") != policy.key(_wd(14.3), "ru")
+    assert policy.key(_wd(14.3), "en") != policy.key(_wd(14.3, precipitation=3.0), "en")
+
+
+@pytest.mark.parametrize(
+    ("wind_speed", "beaufort"), [(0.0, 0), (0.5, 1), (5.4, 3), (5.5, 4), (20.0, 8), (40.0, 12)]
+)
+def test_wind_uses_beaufort_classes(wind_speed, beaufort):
+    assert BandedKeyPolicy().bucket(_wd(wind_speed=wind_speed)).wind_class == beaufort
+
+
+def test_extreme_temperatures_are_clamped():
+    policy = BandedKeyPolicy(temperature_step=3.0, min_temperature=-40, max_temperature=45)
+    assert policy.key(_wd(-60), "en") == policy.key(_wd(-41), "en")
+
+
+def test_representative_falls_in_its_own_bucket():
+    policy = BandedKeyPolicy(temperature_step=2.5)
+    for bucket in policy.grid():
+        assert policy.bucket(policy.representative(bucket)) == bucket
+
+
+async def test_banded_miss_generates_from_bucket_representative():
+    policy = BandedKeyPolicy(temperature_step=3.0)
+    provider = AsyncMock()
+    provider.get_advice.return_value = "Wear a light jacket"
+    cache = AsyncMock()
+    cache.get.return_value = None
+
+    await GetAdviceUseCase(provider, cache, policy).run(_wd(14.3), "en")
+
+    sent = provider.get_advice.await_args.args[0]
+    assert sent == policy.representative(policy.bucket(_wd(14.3)))
+    assert sent.temperature == 13.5
+    cache.set.assert_awaited_once_with(policy.key(_wd(14.3), "en"), "Wear a light jacket")
+
+
+def test_replay_counts_hits_per_policy():
+    requests = [(_wd(t), "en", None) for t in (14.1, 14.2, 14.3, 14.4)]
+    assert replay(requests, build_key_policy("exact"), ttl=3600) == (0, 4)
+    assert replay(requests, build_key_policy("banded"), ttl=3600) == (3, 1)
@@ -0,0 +1,46 @@
+"""Precomputed advice table: grid generation, SQLite round trip, hot-path lookup."""
+
+from unittest.mock import AsyncMock
+
+from dress_advice.application.advice_keys import BandedKeyPolicy
+from dress_advice.application.use_cases.get_advice import GetAdviceUseCase, WeatherData
+from dress_advice.application.use_cases.precompute_advice import PrecomputeAdviceUseCase
+from dress_advice.infrastructure.table.sqlite_table import (
+    SqliteAdviceTable,
+    SqliteAdviceTableWriter,
+)
+
+
+def _policy() -> BandedKeyPolicy:
+    # Narrow range keeps the grid small: 2 bands x 13 wind x 4 rain x 3 humidity
+    return BandedKeyPolicy(temperature_step=5.0, min_temperature=10, max_temperature=15)
+
+
+async def test_precompute_writes_every_bucket_and_resumes(tmp_path):
+    path = tmp_path / "advice.sqlite"
+    provider = AsyncMock()
+    provider.get_advice.return_value = "Take a jacket"
+    writer = SqliteAdviceTableWriter(path)
+    use_case = PrecomputeAdviceUseCase(provider, _policy(), concurrency=4)
+
+    generated, failed = await use_case.run(["en", "ru"], writer.existing_keys(), writer.write)
+    assert (generated, failed) == (2 * 13 * 4 * 3 * 2, 0)
+
+    provider.get_advice.reset_mock()
+    assert await use_case.run(["en", "ru"], writer.existing_keys(), writer.write) == (0, 0)
+    provider.get_advice.assert_not_awaited()
+    writer.close()
+
+    assert len(SqliteAdviceTable.load(path)) == generated
+
+
+async def test_table_hit_skips_cache_and_provider():
+    policy = _policy()
+    wd = WeatherData(temperature=12.3, humidity=55, wind_speed=2.0, precipitation=0, time="")
+    table = SqliteAdviceTable({policy.key(wd, "en"): "Light jacket"})
+    provider, cache = AsyncMock(), AsyncMock()
+
+    use_case = GetAdviceUseCase(provider, cache, policy, table)
+    assert await use_case.run(wd, "en") == "Light jacket"
+    provider.get_advice.assert_not_awaited()
+    cache.get.assert_not_awaited()
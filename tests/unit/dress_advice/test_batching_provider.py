@@ -0,0 +1,89 @@
+"""BatchingAdviceProvider: concurrent misses share one batch completion."""
+
+import asyncio
+import json
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+
+from dress_advice.application.providers import BatchingAdviceProvider
+from dress_advice.application.use_cases.get_advice import WeatherData
+from dress_advice.infrastructure.external.openai_provider import OpenAIAdviceProvider
+
+
+def _wd(temperature: float) -> WeatherData:
+    return WeatherData(temperature, humidity=50, wind_speed=2, precipitation=0, time="")
+
+
+class _Recorder:
+    def __init__(self):
+        self.batches = []
+        self.singles = 0
+
+    async def get_advice(self, weather_data, locale="en"):
+        self.singles += 1
+        return f"{weather_data.temperature}:{locale}"
+
+    async def get_advice_batch(self, items):
+        self.batches.append(items)
+        return [f"{wd.temperature}:{locale}" for wd, locale in items]
+
+
+async def test_concurrent_requests_share_one_batch_and_dedupe():
+    recorder = _Recorder()
+    provider = BatchingAdviceProvider(recorder, window_seconds=0.01)
+    results = await asyncio.gather(
+        provider.get_advice(_wd(10), "en"),
+        provider.get_advice(_wd(10), "ru"),
+        provider.get_advice(_wd(10), "en"),
+        provider.get_advice(_wd(20), "en"),
+    )
+    assert results == ["10:en", "10:ru", "10:en", "20:en"]
+    assert len(recorder.batches) == 1
+    assert len(recorder.batches[0]) == 3
+    assert recorder.singles == 0
+
+
+async def test_lone_request_uses_plain_call_and_full_batch_flushes_early():
+    recorder = _Recorder()
+    assert await BatchingAdviceProvider(recorder, 0.01).get_advice(_wd(5)) == "5:en"
+    assert recorder.singles == 1
+
+    provider = BatchingAdviceProvider(recorder, window_seconds=10, max_batch=2)
+    both = asyncio.gather(provider.get_advice(_wd(1)), provider.get_advice(_wd(2)))
+    assert await asyncio.wait_for(both, 1) == ["1:en", "2:en"]
+
+
+async def test_batch_failure_reaches_every_caller():
+    recorder = _Recorder()
+    recorder.get_advice_batch = AsyncMock(side_effect=RuntimeError("429"))
+    provider = BatchingAdviceProvider(recorder, 0.01)
+    results = await asyncio.gather(
+        provider.get_advice(_wd(1)), provider.get_advice(_wd(2)), return_exceptions=True
+    )
+    assert all(isinstance(r, RuntimeError) for r in results)
+
+
+def _openai_returning(content: str) -> OpenAIAdviceProvider:
+    provider = OpenAIAdviceProvider(api_key="test")
+    message = SimpleNamespace(content=content)
+    create = AsyncMock(return_value=SimpleNamespace(choices=[SimpleNamespace(message=message)]))
+    provider._client = SimpleNamespace(
+        chat=SimpleNamespace(completions=SimpleNamespace(create=create))
+    )
+    return provider
+
+
+async def test_openai_batch_parses_json_advice_in_order():
+    provider = _openai_returning(json.dumps({"advice": [" Coat ", "Пальто"]}))
+    assert await provider.get_advice_batch([(_wd(0), "en"), (_wd(0), "ru")]) == ["Coat", "Пальто"]
+    kwargs = provider._client.chat.completions.create.await_args.kwargs
+    assert kwargs["response_format"] == {"type": "json_object"}
+    assert "1. [en]" in kwargs["messages"][0]["content"]
+
+
+async def test_openai_batch_rejects_wrong_item_count():
+    provider = _openai_returning(json.dumps({"advice": ["only one"]}))
+    with pytest.raises(ValueError):
+        await provider.get_advice_batch([(_wd(0), "en"), (_wd(0), "ru")])
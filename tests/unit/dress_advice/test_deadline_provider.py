@@ -0,0 +1,115 @@
+"""DeadlineAdviceProvider: hedged duplicate request, hard deadline, outcome latencies."""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from dress_advice.application.providers import DeadlineAdviceProvider, LatencyWindow
+from dress_advice.application.use_cases.get_advice import (
+    DegradedAdvice,
+    GetAdviceUseCase,
+    WeatherData,
+)
+
+WD = WeatherData(temperature=10, humidity=50, wind_speed=2, precipitation=0, time="")
+
+
+class _Scripted:
+    """Each call takes the next (delay, result) step; results that are exceptions are raised."""
+
+    def __init__(self, *steps):
+        self._steps = list(steps)
+        self.calls = 0
+        self.cancelled = 0
+
+    async def get_advice(self, *_):
+        delay, result = self._steps[self.calls]
+        self.calls += 1
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+
+class _Fallback:
+    async def get_advice(self, *_):
+        return "local"
+
+
+class _Outcomes:
+    def __init__(self):
+        self.seen = []
+
+    def observe(self, outcome, _seconds):
+        self.seen.append(outcome)
+
+
+def _provider(primary, deadline=1.0, hedge_after=0.05, observer=None):
+    return DeadlineAdviceProvider(
+        primary, _Fallback(), deadline, hedge_after, hedge_quantile=None, observer=observer
+    )
+
+
+async def test_fast_primary_is_not_hedged():
+    primary, outcomes = _Scripted((0, "openai")), _Outcomes()
+    assert await _provider(primary, observer=outcomes).get_advice(WD) == "openai"
+    assert primary.calls == 1
+    assert outcomes.seen == ["primary"]
+
+
+async def test_slow_primary_is_hedged_and_loser_cancelled():
+    primary, outcomes = _Scripted((1, "slow"), (0, "hedged")), _Outcomes()
+    assert await _provider(primary, observer=outcomes).get_advice(WD) == "hedged"
+    await asyncio.sleep(0)
+    assert (primary.calls, primary.cancelled) == (2, 1)
+    assert outcomes.seen == ["hedge"]
+
+
+async def test_primary_error_hedges_immediately():
+    primary = _Scripted((0, RuntimeError("500")), (0, "retry"))
+    provider = _provider(primary, hedge_after=10)
+    assert await asyncio.wait_for(provider.get_advice(WD), 1) == "retry"
+
+
+async def test_deadline_falls_back_and_cancels_both():
+    primary, outcomes = _Scripted((5, "a"), (5, "b")), _Outcomes()
+    provider = _provider(primary, deadline=0.1, hedge_after=0.02, observer=outcomes)
+    assert await provider.get_advice(WD) == "local"
+    await asyncio.sleep(0)
+    assert primary.cancelled == 2
+    assert outcomes.seen == ["fallback"]
+
+
+async def test_both_failing_falls_back():
+    primary = _Scripted((0, RuntimeError("a")), (0, RuntimeError("b")))
+    text = await _provider(primary).get_advice(WD)
+    assert text == "local"
+    assert isinstance(text, DegradedAdvice)
+
+
+@pytest.mark.parametrize(("degraded_ttl", "expected_sets"), [(60, [("local", 60)]), (0, [])])
+async def test_fallback_advice_is_cached_briefly_or_not_at_all(degraded_ttl, expected_sets):
+    cache = AsyncMock()
+    cache.get.return_value = None
+    primary = _Scripted((0, RuntimeError("a")), (0, RuntimeError("b")), (0, "openai"))
+    use_case = GetAdviceUseCase(_provider(primary), cache, degraded_ttl_seconds=degraded_ttl)
+
+    assert await use_case.run(WD) == "local"
+    assert [c.args[1:] for c in cache.set.await_args_list] == expected_sets
+
+    cache.set.reset_mock()
+    assert await use_case.run(WD) == "openai"
+    cache.set.assert_awaited_once_with("advice:10.0:50:2.0:0.0:en", "openai")
+
+
+def test_latency_window_quantile_after_warmup():
+    window = LatencyWindow(initial_seconds=1.5, min_samples=10)
+    assert window.quantile(0.95) == 1.5
+    for ms in range(1, 101):
+        window.add(ms / 1000)
+    assert window.quantile(0.95) == 0.096
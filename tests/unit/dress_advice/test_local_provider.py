@@ -0,0 +1,130 @@
+"""Rule-based advice and the fallback/hedge provider combinators."""
+
+import asyncio
+import json
+from pathlib import Path
+
+import pytest
+
+from dress_advice.application.advice_keys import BandedKeyPolicy
+from dress_advice.application.providers import FallbackAdviceProvider, HedgedAdviceProvider
+from dress_advice.application.use_cases.get_advice import DegradedAdvice, WeatherData
+from dress_advice.domain.exceptions import AdviceProviderNotConfiguredError
+from dress_advice.infrastructure.local.rule_based_provider import RuleBasedAdviceProvider
+
+RULES_DIR = Path(__file__).resolve().parents[3] / "dress_advice/infrastructure/local/rules"
+
+
+def _wd(temperature=14.0, humidity=55.0, wind_speed=3.0, precipitation=0.0) -> WeatherData:
+    return WeatherData(temperature, humidity, wind_speed, precipitation, time="")
+
+
+class _Provider:
+    def __init__(self, text: str = "", delay: float = 0.0, error: Exception | None = None):
+        self.text, self.delay, self.error = text, delay, error
+        self.cancelled = False
+
+    async def get_advice(self, *_):
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        if self.error:
+            raise self.error
+        return self.text
+
+
+def test_rules_combine_temperature_rain_and_wind():
+    text = RuleBasedAdviceProvider().advise(_wd(8, wind_speed=9, precipitation=3), "en")
+    assert text.startswith("🧥 Chilly")
+    assert "umbrella" in text and "windbreaker" in text
+
+
+def test_unknown_locale_falls_back_to_english():
+    provider = RuleBasedAdviceProvider()
+    assert provider.advise(_wd(), "de") == provider.advise(_wd(), "en")
+
+
+@pytest.mark.parametrize("locale", ["../rules/ru", "/etc/passwd", ""])
+def test_path_like_locale_is_treated_as_unknown(locale):
+    provider = RuleBasedAdviceProvider()
+    assert provider.advise(_wd(), locale) == provider.advise(_wd(), "en")
+    assert set(provider._tables) == {"en", "ru"}
+
+
+def test_locales_share_rule_bounds():
+    def bounds(locale):
+        rules = json.loads((RULES_DIR / f"{locale}.json").read_text(encoding="utf-8"))
+        return {
+            s: [{k: v for k, v in r.items() if k != "text"} for r in rs] for s, rs in rules.items()
+        }
+
+    assert bounds("ru") == bounds("en")
+
+
+@pytest.mark.parametrize("locale", ["en", "ru"])
+def test_every_weather_bucket_gets_advice(locale):
+    policy, provider = BandedKeyPolicy(), RuleBasedAdviceProvider()
+    for bucket in policy.grid():
+        assert provider.advise(policy.representative(bucket), locale)
+
+
+async def test_fallback_on_timeout_and_error():
+    local = _Provider("local")
+    slow = FallbackAdviceProvider(_Provider("openai", delay=1), local, timeout_seconds=0.01)
+    text = await slow.get_advice(_wd())
+    assert text == "local"
+    assert isinstance(text, DegradedAdvice)
+    broken = FallbackAdviceProvider(
+        _Provider(error=AdviceProviderNotConfiguredError()), local, timeout_seconds=1
+    )
+    assert await broken.get_advice(_wd()) == "local"
+    fast = FallbackAdviceProvider(_Provider("openai"), local, timeout_seconds=1)
+    text = await fast.get_advice(_wd())
+    assert text == "openai"
+    assert not isinstance(text, DegradedAdvice)
+
+
+async def test_hedge_returns_fast_primary_without_hedging():
+    hedge = _Provider("local", delay=1)
+    provider = HedgedAdviceProvider(_Provider("openai"), hedge, hedge_after_seconds=0.05)
+    assert await provider.get_advice(_wd()) == "openai"
+
+
+async def test_hedge_wins_over_slow_primary_and_cancels_it():
+    primary = _Provider("openai", delay=1)
+    provider = HedgedAdviceProvider(primary, _Provider("local"), hedge_after_seconds=0.01)
+    text = await provider.get_advice(_wd())
+    assert text == "local"
+    assert isinstance(text, DegradedAdvice)
+    await asyncio.sleep(0)
+    assert primary.cancelled
+
+
+@pytest.mark.parametrize("hedge_after", [5, 0.01])
+async def test_cancelled_caller_cancels_primary_and_hedge(hedge_after):
+    primary, hedge = _Provider("openai", delay=5), _Provider("local", delay=5)
+    provider = HedgedAdviceProvider(primary, hedge, hedge_after_seconds=hedge_after)
+    call = asyncio.ensure_future(provider.get_advice(_wd()))
+    await asyncio.sleep(0.05)
+    call.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await call
+    await asyncio.sleep(0)
+    assert primary.cancelled
+    assert hedge.cancelled == (hedge_after < 0.05)
+
+
+async def test_hedge_starts_immediately_when_primary_fails():
+    primary = _Provider(error=RuntimeError("boom"))
+    provider = HedgedAdviceProvider(primary, _Provider("local"), hedge_after_seconds=5)
+    assert await asyncio.wait_for(provider.get_advice(_wd()), 1) == "local"
+
+
+async def test_hedge_raises_when_both_fail():
+    provider = HedgedAdviceProvider(
+        _Provider(error=RuntimeError("a")), _Provider(error=RuntimeError("b")), 0
+    )
+    with pytest.raises(RuntimeError):
+        await provider.get_advice(_wd())
@@ -0,0 +1,30 @@
+"""OpenAIAdviceProvider builds one tuned HTTP client from settings."""
+
+from dress_advice.config.settings import Settings
+from dress_advice.infrastructure.external.openai_provider import build_openai_provider
+
+
+def test_pool_and_timeouts_come_from_settings():
+    settings = Settings(
+        OPENAI_API_KEY="sk-test",  # nosec B106
+        OPENAI_BASE_URL="http://127.0.0.1:8765/v1",
+        OPENAI_TIMEOUT_SECONDS=4,
+        openai_max_connections=7,
+        openai_max_keepalive_connections=3,
+        openai_connect_timeout_seconds=1.5,
+        openai_http2=True,
+    )
+
+    client = build_openai_provider(settings)._client
+
+    assert str(client.base_url) == "http://127.0.0.1:8765/v1/"
+    assert client.timeout.read == 4
+    assert client.timeout.connect == 1.5
+    pool = client._client._transport._pool
+    assert pool._max_connections == 7
+    assert pool._max_keepalive_connections == 3
+    assert pool._http2 is True
+
+
+def test_no_client_without_api_key():
+    assert build_openai_provider(Settings(OPENAI_API_KEY=""))._client is None
@@ -0,0 +1,97 @@
+"""StreamAdviceUseCase and the StreamAdvice RPC."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import common_pb2
+import dress_advice_pb2
+import pytest
+
+from dress_advice.api.servicer import DressAdviceServicer
+from dress_advice.application.use_cases.get_advice import (
+    DegradedAdvice,
+    StreamAdviceUseCase,
+    WeatherData,
+)
+
+WD = WeatherData(temperature=10, humidity=50, wind_speed=2, precipitation=0, time="")
+
+
+class _Stream:
+    def __init__(self, *chunks, fail_after: int | None = None, delay: float = 0):
+        self._chunks, self._fail_after, self._delay = chunks, fail_after, delay
+
+    async def stream_advice(self, *_):
+        await asyncio.sleep(self._delay)
+        for i, chunk in enumerate(self._chunks):
+            if i == self._fail_after:
+                raise RuntimeError("stream broke")
+            yield chunk
+        if self._fail_after == len(self._chunks):
+            raise RuntimeError("stream broke")
+
+
+def _cache(hit=None):
+    cache = AsyncMock()
+    cache.get.return_value = hit
+    return cache
+
+
+def _fallback(text="local advice"):
+    provider = AsyncMock()
+    provider.get_advice.return_value = text
+    return provider
+
+
+async def _collect(use_case) -> list[str]:
+    return [chunk async for chunk in use_case.run(WD, "en")]
+
+
+async def test_relays_chunks_and_caches_full_text():
+    cache = _cache()
+    use_case = StreamAdviceUseCase(_Stream("Wear ", "a coat ☔️"), _fallback(), cache)
+    assert await _collect(use_case) == ["Wear ", "a coat ☔️"]
+    cache.set.assert_awaited_once_with("advice:10.0:50:2.0:0.0:en", "Wear a coat ☔️")
+
+
+async def test_cache_hit_is_one_chunk_without_streaming():
+    stream = MagicMock()
+    use_case = StreamAdviceUseCase(stream, _fallback(), _cache("cached"))
+    assert await _collect(use_case) == ["cached"]
+    stream.stream_advice.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    "stream", [_Stream("x", fail_after=0), _Stream("late", delay=1), None], ids=str
+)
+async def test_no_first_chunk_answers_in_one_piece(stream):
+    use_case = StreamAdviceUseCase(stream, _fallback(), _cache(), first_chunk_timeout_seconds=0.05)
+    assert await _collect(use_case) == ["local advice"]
+
+
+async def test_stream_timeout_answers_from_fallback_not_provider():
+    provider, local, cache = _fallback("openai"), _fallback("rules"), _cache()
+    use_case = StreamAdviceUseCase(
+        _Stream("late", delay=1), provider, cache, first_chunk_timeout_seconds=0.05, fallback=local
+    )
+    chunks = await _collect(use_case)
+    assert chunks == ["rules"]
+    assert isinstance(chunks[0], DegradedAdvice)
+    provider.get_advice.assert_not_awaited()
+    cache.set.assert_awaited_once_with("advice:10.0:50:2.0:0.0:en", "rules", 60)
+
+
+async def test_failure_after_first_chunk_propagates():
+    use_case = StreamAdviceUseCase(_Stream("Wear ", fail_after=1), _fallback(), _cache())
+    with pytest.raises(RuntimeError):
+        await _collect(use_case)
+
+
+async def test_servicer_streams_chunks():
+    use_case = StreamAdviceUseCase(_Stream("a", "b"), _fallback(), None)
+    servicer = DressAdviceServicer(get_advice_uc=None, stream_advice_uc=use_case)
+    request = dress_advice_pb2.GetAdviceRequest(
+        weather_data=common_pb2.WeatherData(temperature=10, humidity=50), locale="ru"
+    )
+    chunks = [c.text async for c in servicer.StreamAdvice(request, MagicMock())]
+    assert chunks == ["a", "b"]
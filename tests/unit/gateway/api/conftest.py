@@ -2,17 +2,22 @@
 
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
+from dataclasses import fields
+from unittest.mock import MagicMock
 
 import pytest
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
 
 from gateway.api.v1.auth import router as auth_router
-from gateway.api.v1.auth_service import CurrentUser
+from gateway.api.v1.auth_service import AuthService, CurrentUser
 from gateway.api.v1.routes import router as api_v1_router
 from gateway.api.v2.routes import router as api_v2_router
 from gateway.config.settings import Settings
-from gateway.deps import get_current_user, get_settings
+from gateway.container import UseCases
+from gateway.deps import get_current_user, get_settings, get_use_cases
+from gateway.infrastructure.cache.response_cache import ResponseCache
+from shared.password_hashing import PasswordHasher
 
 # JWT secret >= 32 bytes to avoid PyJWT InsecureKeyLengthWarning in tests
 TEST_JWT_SECRET = "test-secret-at-least-32-bytes-long-for-hmac"  # nosec B105 - test secret
@@ -36,14 +41,29 @@ def create_test_app() -> FastAPI:
         return {"status": "ok"}
 
     # Use test settings with long-enough JWT secret to avoid InsecureKeyLengthWarning
-    app.dependency_overrides[get_settings] = lambda: Settings(jwt_secret=TEST_JWT_SECRET)
+    settings = Settings(jwt_secret=TEST_JWT_SECRET)
+    app.dependency_overrides[get_settings] = lambda: settings
+    # What gateway.main's lifespan puts on app.state: a per-app AuthService and response
+    # cache so verified tokens and cached bodies do not leak between tests, and the minimum
+    # bcrypt cost for fast registers
+    app.state.auth_service = AuthService(settings)
+    app.state.response_cache = ResponseCache()
+    app.state.password_hasher = PasswordHasher(rounds=4, max_workers=1)
     return app
 
 
 @pytest.fixture
-def app() -> FastAPI:
-    """FastAPI test app (no gRPC)."""
-    return create_test_app()
+def use_cases() -> UseCases:
+    """Every use case is a MagicMock; tests set `use_cases.<name>.run = AsyncMock(...)`."""
+    return UseCases(**{f.name: MagicMock() for f in fields(UseCases)})
+
+
+@pytest.fixture
+def app(use_cases: UseCases) -> FastAPI:
+    """FastAPI test app (no gRPC) serving the mocked use cases."""
+    app = create_test_app()
+    app.dependency_overrides[get_use_cases] = lambda: use_cases
+    return app
 
 
 @pytest.fixture
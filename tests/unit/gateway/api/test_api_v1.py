@@ -1,16 +1,15 @@
 """Unit tests for API v1: users/cities, forecast, dress-advice."""
 
 from types import SimpleNamespace
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock
 
 
 class TestListCities:
     """GET /api/v1/users/{user_id}/cities."""
 
-    @patch("gateway.api.v1.routes.ListUserCitiesUseCase")
-    def test_list_cities_returns_cities(self, mock_uc_class, client):
+    def test_list_cities_returns_cities(self, use_cases, client):
         """Returns list of cities for user."""
-        mock_uc_class.return_value.run = AsyncMock(
+        use_cases.list_cities.run = AsyncMock(
             return_value=SimpleNamespace(
                 cities=[
                     SimpleNamespace(id=1, user_id=10, name="Moscow", lat=55.75, lon=37.62),
@@ -26,10 +25,9 @@ class TestListCities:
         assert data["cities"][0]["name"] == "Moscow"
         assert data["cities"][1]["name"] == "SPb"
 
-    @patch("gateway.api.v1.routes.ListUserCitiesUseCase")
-    def test_list_cities_empty_returns_empty_list(self, mock_uc_class, client):
+    def test_list_cities_empty_returns_empty_list(self, use_cases, client):
         """Returns empty cities when user has none."""
-        mock_uc_class.return_value.run = AsyncMock(return_value=SimpleNamespace(cities=[]))
+        use_cases.list_cities.run = AsyncMock(return_value=SimpleNamespace(cities=[]))
         r = client.get("/api/v1/users/99/cities")
         assert r.status_code == 200
         assert r.json() == {"cities": []}
@@ -38,10 +36,9 @@ class TestListCities:
 class TestAddCity:
     """POST /api/v1/users/{user_id}/cities."""
 
-    @patch("gateway.api.v1.routes.AddCityUseCase")
-    def test_add_city_returns_201_and_city(self, mock_uc_class, client):
+    def test_add_city_returns_201_and_city(self, use_cases, client):
         """Add city returns created city."""
-        mock_uc_class.return_value.run = AsyncMock(
+        use_cases.add_city.run = AsyncMock(
             return_value=SimpleNamespace(id=3, user_id=10, name="Kazan", lat=55.79, lon=49.12)
         )
         r = client.post(
@@ -60,10 +57,9 @@ class TestAddCity:
 class TestForecast:
     """GET /api/v1/forecast."""
 
-    @patch("gateway.api.v1.routes.GetForecastForUserCityUseCase")
-    def test_forecast_returns_weather_data(self, mock_uc_class, client):
+    def test_forecast_returns_weather_data(self, use_cases, client):
         """Forecast returns temperature and other fields."""
-        mock_uc_class.return_value.run = AsyncMock(
+        use_cases.get_forecast.run = AsyncMock(
             return_value=SimpleNamespace(
                 data=SimpleNamespace(
                     temperature=15.0,
@@ -84,10 +80,9 @@ class TestForecast:
         assert data["data"]["temperature"] == 15.0
         assert data["data"]["humidity"] == 70.0
 
-    @patch("gateway.api.v1.routes.GetForecastForUserCityUseCase")
-    def test_forecast_with_fields_filter(self, mock_uc_class, client):
+    def test_forecast_with_fields_filter(self, use_cases, client):
         """Forecast with fields query returns only requested fields."""
-        mock_uc_class.return_value.run = AsyncMock(
+        use_cases.get_forecast.run = AsyncMock(
             return_value=SimpleNamespace(
                 data=SimpleNamespace(
                     temperature=20.0,
@@ -113,10 +108,9 @@ class TestForecast:
 class TestDressAdvice:
     """GET /api/v1/dress-advice."""
 
-    @patch("gateway.api.v1.routes.GetDressAdviceForUserCityUseCase")
-    def test_dress_advice_returns_text(self, mock_uc_class, client):
+    def test_dress_advice_returns_text(self, use_cases, client):
         """Dress advice returns advice_text."""
-        mock_uc_class.return_value.run = AsyncMock(
+        use_cases.get_dress_advice.run = AsyncMock(
             return_value=SimpleNamespace(advice_text="Wear a light jacket.")
         )
         r = client.get(
@@ -127,10 +121,9 @@ class TestDressAdvice:
         data = r.json()
         assert data["advice_text"] == "Wear a light jacket."
 
-    @patch("gateway.api.v1.routes.GetDressAdviceForUserCityUseCase")
-    def test_dress_advice_with_locale(self, mock_uc_class, client):
+    def test_dress_advice_with_locale(self, use_cases, client):
         """Dress advice accepts locale param."""
-        mock_uc_class.return_value.run = AsyncMock(
+        use_cases.get_dress_advice.run = AsyncMock(
             return_value=SimpleNamespace(advice_text="Теплая куртка.")
         )
         r = client.get(
@@ -1,9 +1,13 @@
 """Unit tests for API v2: me, cities, forecast, dress-advice (Bearer auth)."""
 
 from types import SimpleNamespace
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock
 
 import grpc
+import pytest
+
+from gateway.api.v1.auth_service import CurrentUser
+from gateway.deps import get_current_user
 
 
 class _FakeRpcError(grpc.RpcError, Exception):
@@ -19,10 +23,9 @@ class _FakeRpcError(grpc.RpcError, Exception):
 class TestMe:
     """GET /api/v2/me."""
 
-    @patch("gateway.api.v2.routes.GetUserByIdUseCase")
-    def test_me_returns_current_user(self, mock_uc_class, v2_client):
+    def test_me_returns_current_user(self, use_cases, v2_client):
         """Returns user profile for authenticated user."""
-        mock_uc_class.return_value.run = AsyncMock(
+        use_cases.get_user_by_id.run = AsyncMock(
             return_value=SimpleNamespace(id=1, username="testuser", is_admin=False, locale="en")
         )
         r = v2_client.get("/api/v2/me")
@@ -33,8 +36,7 @@ class TestMe:
         assert data["is_admin"] is False
         assert data.get("locale", "en") == "en"
 
-    @patch("gateway.api.v2.routes.GetUserByIdUseCase")
-    def test_me_without_token_returns_401(self, _mock_uc_class, app):
+    def test_me_without_token_returns_401(self, app):
         """Without Bearer token returns 401."""
         from fastapi.testclient import TestClient
 
@@ -47,10 +49,9 @@ class TestMe:
 class TestGetCity:
     """GET /api/v2/cities/{city_name}."""
 
-    @patch("gateway.api.v2.routes.GetCityUseCase")
-    def test_get_city_returns_city(self, mock_uc_class, v2_client):
+    def test_get_city_returns_city(self, use_cases, v2_client):
         """Returns city by name for current user."""
-        mock_uc_class.return_value.run = AsyncMock(
+        use_cases.get_city.run = AsyncMock(
             return_value=SimpleNamespace(id=5, user_id=1, name="Moscow", lat=55.75, lon=37.62)
         )
         r = v2_client.get("/api/v2/cities/Moscow")
@@ -60,10 +61,9 @@ class TestGetCity:
         assert data["name"] == "Moscow"
         assert data["lat"] == 55.75
 
-    @patch("gateway.api.v2.routes.GetCityUseCase")
-    def test_get_city_not_found_returns_404(self, mock_uc_class, v2_client):
+    def test_get_city_not_found_returns_404(self, use_cases, v2_client):
         """City not found returns 404."""
-        mock_uc_class.return_value.run = AsyncMock(side_effect=_FakeRpcError())
+        use_cases.get_city.run = AsyncMock(side_effect=_FakeRpcError())
         r = v2_client.get("/api/v2/cities/UnknownCity")
         assert r.status_code == 404
 
@@ -71,10 +71,9 @@ class TestGetCity:
 class TestListCitiesV2:
     """GET /api/v2/cities."""
 
-    @patch("gateway.api.v2.routes.ListUserCitiesUseCase")
-    def test_list_cities_returns_cities(self, mock_uc_class, v2_client):
+    def test_list_cities_returns_cities(self, use_cases, v2_client):
         """Returns cities for current user from JWT."""
-        mock_uc_class.return_value.run = AsyncMock(
+        use_cases.list_cities.run = AsyncMock(
             return_value=SimpleNamespace(
                 cities=[
                     SimpleNamespace(id=1, user_id=1, name="Moscow", lat=55.75, lon=37.62),
@@ -90,10 +89,9 @@ class TestListCitiesV2:
 class TestAddCityV2:
     """POST /api/v2/cities."""
 
-    @patch("gateway.api.v2.routes.AddCityUseCase")
-    def test_add_city_returns_created_city(self, mock_uc_class, v2_client):
+    def test_add_city_returns_created_city(self, use_cases, v2_client):
         """Add city for current user."""
-        mock_uc_class.return_value.run = AsyncMock(
+        use_cases.add_city.run = AsyncMock(
             return_value=SimpleNamespace(id=10, user_id=1, name="Kazan", lat=55.79, lon=49.12)
         )
         r = v2_client.post(
@@ -109,10 +107,9 @@ class TestAddCityV2:
 class TestForecastV2:
     """GET /api/v2/forecast."""
 
-    @patch("gateway.api.v2.routes.GetForecastForUserCityUseCase")
-    def test_forecast_returns_data(self, mock_uc_class, v2_client):
+    def test_forecast_returns_data(self, use_cases, v2_client):
         """Forecast for user's city returns weather data."""
-        mock_uc_class.return_value.run = AsyncMock(
+        use_cases.get_forecast.run = AsyncMock(
             return_value=SimpleNamespace(
                 data=SimpleNamespace(
                     temperature=18.0,
@@ -131,12 +128,101 @@ class TestForecastV2:
 class TestDressAdviceV2:
     """GET /api/v2/dress-advice."""
 
-    @patch("gateway.api.v2.routes.GetDressAdviceForUserCityUseCase")
-    def test_dress_advice_returns_text(self, mock_uc_class, v2_client):
+    def test_dress_advice_returns_text(self, use_cases, v2_client):
         """Dress advice for user's city."""
-        mock_uc_class.return_value.run = AsyncMock(
+        use_cases.get_dress_advice.run = AsyncMock(
             return_value=SimpleNamespace(advice_text="Bring an umbrella.")
         )
         r = v2_client.get("/api/v2/dress-advice", params={"city_name": "London"})
         assert r.status_code == 200
         assert r.json()["advice_text"] == "Bring an umbrella."
+
+
+class TestResponseCacheV2:
+    """Repeated v2 forecast/dress-advice queries are served from the response cache."""
+
+    def test_repeat_query_hits_cache_and_honours_etag(self, use_cases, v2_client):
+        run = AsyncMock(return_value=SimpleNamespace(advice_text="Take a scarf."))
+        use_cases.get_dress_advice.run = run
+        params = {"city_name": "Oslo", "date": "2026-01-10", "time": "09:00", "locale": "en"}
+
+        first = v2_client.get("/api/v2/dress-advice", params=params)
+        second = v2_client.get("/api/v2/dress-advice", params=params)
+        not_modified = v2_client.get(
+            "/api/v2/dress-advice", params=params, headers={"If-None-Match": first.headers["etag"]}
+        )
+        other_locale = v2_client.get("/api/v2/dress-advice", params={**params, "locale": "ru"})
+
+        assert second.json() == first.json() == {"advice_text": "Take a scarf."}
+        assert second.headers["etag"] == first.headers["etag"]
+        assert not_modified.status_code == 304
+        assert not_modified.content == b""
+        assert other_locale.status_code == 200
+        assert run.await_count == 2
+
+    def test_forecast_key_includes_fields(self, use_cases, v2_client):
+        data = SimpleNamespace(
+            temperature=5.0, humidity=80.0, wind_speed=4.0, precipitation=1.0, time="09:00"
+        )
+        run = AsyncMock(return_value=SimpleNamespace(data=data))
+        use_cases.get_forecast.run = run
+        params = {"city_name": "Oslo", "date": "2026-01-10", "time": "09:00"}
+
+        v2_client.get("/api/v2/forecast", params={**params, "fields": "temperature,humidity"})
+        r = v2_client.get("/api/v2/forecast", params={**params, "fields": "humidity, temperature"})
+        full = v2_client.get("/api/v2/forecast", params=params)
+
+        assert r.json() == {"data": {"temperature": 5.0, "humidity": 80.0}}
+        assert full.json()["data"]["wind_speed"] == 4.0
+        assert run.await_count == 2
+
+    def test_errors_are_not_cached(self, use_cases, v2_client):
+        run = AsyncMock(side_effect=[_FakeRpcError(), SimpleNamespace(advice_text="Sunglasses.")])
+        use_cases.get_dress_advice.run = run
+        params = {"city_name": "Rome", "date": "2026-07-01"}
+
+        with pytest.raises(_FakeRpcError):
+            v2_client.get("/api/v2/dress-advice", params=params)
+        r = v2_client.get("/api/v2/dress-advice", params=params)
+
+        assert r.json() == {"advice_text": "Sunglasses."}
+
+
+class TestImportCitiesV2:
+    """POST /api/v2/admin/cities/import."""
+
+    def test_import_cities_as_admin(self, use_cases, app, v2_client):
+        """Admin gets counts, throughput and per-row errors."""
+        app.dependency_overrides[get_current_user] = lambda: CurrentUser(
+            user_id=1, username="admin", is_admin=True
+        )
+        use_cases.import_cities.run = AsyncMock(
+            return_value=SimpleNamespace(
+                received_count=2,
+                imported_count=1,
+                errors=[SimpleNamespace(row_index=1, code="CITY_ALREADY_EXISTS", message="dup")],
+                elapsed_seconds=0.5,
+                rows_per_second=4.0,
+            )
+        )
+        r = v2_client.post(
+            "/api/v2/admin/cities/import",
+            json={
+                "rows": [
+                    {"user_id": 5, "name": "Kazan", "lat": 55.79, "lon": 49.12},
+                    {"user_id": 5, "name": "Kazan", "lat": 55.79, "lon": 49.12},
+                ]
+            },
+        )
+        assert r.status_code == 200
+        data = r.json()
+        assert data["imported_count"] == 1
+        assert data["rows_per_second"] == 4.0
+        assert data["errors"] == [{"row_index": 1, "code": "CITY_ALREADY_EXISTS", "message": "dup"}]
+
+    def test_import_cities_requires_admin(self, use_cases, v2_client):
+        """Non-admin user gets 403 and Users is not called."""
+        use_cases.import_cities.run = AsyncMock()
+        r = v2_client.post("/api/v2/admin/cities/import", json={"rows": []})
+        assert r.status_code == 403
+        use_cases.import_cities.run.assert_not_awaited()
@@ -1,17 +1,27 @@
 """Unit tests for Auth API: register, login, token."""
 
 from types import SimpleNamespace
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock
+
+import grpc
+import pytest
+
+
+class _RpcError(grpc.RpcError, Exception):
+    def __init__(self, code: grpc.StatusCode):
+        self._code = code
+
+    def code(self):
+        return self._code
 
 
 class TestRegister:
     """POST /api/v1/auth/register."""
 
-    @patch("gateway.api.v1.auth.CreateUserUseCase")
-    def test_register_returns_201_and_token(self, mock_uc_class, client):
+    def test_register_returns_201_and_token(self, use_cases, client):
         """Register success returns user_id, access_token, token_type bearer."""
         result_user = SimpleNamespace(id=42, username="alice", is_admin=False)
-        mock_uc_class.return_value.run = AsyncMock(return_value=SimpleNamespace(user=result_user))
+        use_cases.create_user.run = AsyncMock(return_value=SimpleNamespace(user=result_user))
         r = client.post(
             "/api/v1/auth/register",
             json={"username": "alice", "password": "secret123"},  # nosec B105 - test fixture
@@ -22,10 +32,9 @@ class TestRegister:
         assert data["token_type"] == "bearer"
         assert isinstance(data["access_token"], str) and len(data["access_token"]) > 0
 
-    @patch("gateway.api.v1.auth.CreateUserUseCase")
-    def test_register_duplicate_username_returns_400(self, mock_uc_class, client):
+    def test_register_duplicate_username_returns_400(self, use_cases, client):
         """Register with existing username returns 400."""
-        mock_uc_class.return_value.run = AsyncMock(side_effect=Exception("username already exists"))
+        use_cases.create_user.run = AsyncMock(side_effect=Exception("username already exists"))
         r = client.post(
             "/api/v1/auth/register",
             json={"username": "alice", "password": "secret123"},  # nosec B105 - test fixture
@@ -37,14 +46,11 @@ class TestRegister:
 class TestLogin:
     """POST /api/v1/auth/login."""
 
-    @patch("gateway.api.v1.auth.users_stub")
-    def test_login_returns_token(self, mock_users_stub, client):
+    def test_login_returns_token(self, use_cases, client):
         """Login with valid user returns access_token."""
-        mock_stub = AsyncMock()
-        mock_stub.GetUserByUsername = AsyncMock(
+        use_cases.verify_credentials.run = AsyncMock(
             return_value=SimpleNamespace(id=1, username="bob", is_admin=False)
         )
-        mock_users_stub.return_value = mock_stub
 
         r = client.post(
             "/api/v1/auth/login",
@@ -55,14 +61,11 @@ class TestLogin:
         assert data["token_type"] == "bearer"
         assert isinstance(data["access_token"], str)
 
-    @patch("gateway.api.v1.auth.users_stub")
-    def test_login_user_not_found_returns_401(self, mock_users_stub, client):
+    def test_login_user_not_found_returns_401(self, use_cases, client):
         """Login when user has no id returns 401."""
-        mock_stub = AsyncMock()
-        mock_stub.GetUserByUsername = AsyncMock(
+        use_cases.verify_credentials.run = AsyncMock(
             return_value=SimpleNamespace(id=0, username="", is_admin=False)
         )
-        mock_users_stub.return_value = mock_stub
 
         r = client.post(
             "/api/v1/auth/login",
@@ -71,12 +74,11 @@ class TestLogin:
         assert r.status_code == 401
         assert "invalid" in r.json().get("detail", "").lower()
 
-    @patch("gateway.api.v1.auth.users_stub")
-    def test_login_grpc_error_returns_401(self, mock_users_stub, client):
-        """Login when gRPC raises returns 401."""
-        mock_stub = AsyncMock()
-        mock_stub.GetUserByUsername = AsyncMock(side_effect=Exception("connection refused"))
-        mock_users_stub.return_value = mock_stub
+    def test_login_unauthenticated_returns_401(self, use_cases, client):
+        """UNAUTHENTICATED from Users is a wrong password."""
+        use_cases.verify_credentials.run = AsyncMock(
+            side_effect=_RpcError(grpc.StatusCode.UNAUTHENTICATED)
+        )
 
         r = client.post(
             "/api/v1/auth/login",
@@ -84,18 +86,54 @@ class TestLogin:
         )
         assert r.status_code == 401
 
+    def test_login_users_unavailable_returns_503(self, use_cases, client):
+        """An unreachable Users service is an outage, not bad credentials."""
+        use_cases.verify_credentials.run = AsyncMock(
+            side_effect=_RpcError(grpc.StatusCode.UNAVAILABLE)
+        )
+
+        r = client.post(
+            "/api/v1/auth/login",
+            json={"username": "bob", "password": "any"},  # nosec B105 - test fixture
+        )
+        assert r.status_code == 503
+        assert r.headers["retry-after"] == "1"
+
+    @pytest.mark.parametrize(
+        "error", [_RpcError(grpc.StatusCode.INTERNAL), RuntimeError("connection refused")]
+    )
+    def test_login_other_errors_are_not_401(self, use_cases, client, error):
+        use_cases.verify_credentials.run = AsyncMock(side_effect=error)
+
+        with pytest.raises(type(error)):
+            client.post(
+                "/api/v1/auth/login",
+                json={"username": "bob", "password": "any"},  # nosec B105 - test fixture
+            )
+
+    def test_login_overloaded_returns_429(self, use_cases, client):
+        """RESOURCE_EXHAUSTED from Users (bcrypt queue full) is a retryable 429."""
+        use_cases.verify_credentials.run = AsyncMock(
+            side_effect=_RpcError(grpc.StatusCode.RESOURCE_EXHAUSTED)
+        )
+
+        r = client.post(
+            "/api/v1/auth/login",
+            json={"username": "bob", "password": "any"},  # nosec B105 - test fixture
+        )
+        assert r.status_code == 429
+        assert r.headers["retry-after"] == "1"
+        use_cases.verify_credentials.run.assert_awaited_once_with("bob", "any")
+
 
 class TestToken:
     """POST /api/v1/auth/token (OAuth2 form)."""
 
-    @patch("gateway.api.v1.auth.users_stub")
-    def test_token_returns_access_token(self, mock_users_stub, client):
+    def test_token_returns_access_token(self, use_cases, client):
         """OAuth2 token with valid credentials returns access_token."""
-        mock_stub = AsyncMock()
-        mock_stub.GetUserByUsername = AsyncMock(
+        use_cases.verify_credentials.run = AsyncMock(
             return_value=SimpleNamespace(id=2, username="charlie", is_admin=True)
         )
-        mock_users_stub.return_value = mock_stub
 
         r = client.post(
             "/api/v1/auth/token",
@@ -106,14 +144,11 @@ class TestToken:
         assert data["token_type"] == "bearer"
         assert isinstance(data["access_token"], str)
 
-    @patch("gateway.api.v1.auth.users_stub")
-    def test_token_user_not_found_returns_401(self, mock_users_stub, client):
+    def test_token_user_not_found_returns_401(self, use_cases, client):
         """OAuth2 token when user not found returns 401."""
-        mock_stub = AsyncMock()
-        mock_stub.GetUserByUsername = AsyncMock(
+        use_cases.verify_credentials.run = AsyncMock(
             return_value=SimpleNamespace(id=0, username="", is_admin=False)
         )
-        mock_users_stub.return_value = mock_stub
 
         r = client.post(
             "/api/v1/auth/token",
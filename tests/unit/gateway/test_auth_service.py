@@ -0,0 +1,69 @@
+"""AuthService verified-token cache: hits skip jwt.decode, entries end at exp."""
+
+import time
+from unittest.mock import patch
+
+import jwt
+import pytest
+from fastapi import HTTPException
+
+from gateway.api.v1.auth_service import AuthService
+from gateway.config.settings import Settings
+
+_SECRET = "test-secret-at-least-32-bytes-long-for-hmac"  # nosec B105 - test secret
+
+
+class _Clock:
+    def __init__(self, now: float):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _service(**kwargs) -> tuple[AuthService, _Clock]:
+    clock = _Clock(time.time())
+    return AuthService(Settings(jwt_secret=_SECRET, **kwargs), clock=clock), clock
+
+
+def test_repeat_token_is_served_from_cache():
+    auth, _ = _service()
+    token = auth.create_token(7, "dana", True)
+
+    with patch("gateway.api.v1.auth_service.jwt.decode", wraps=jwt.decode) as decode:
+        first = auth.decode_token(token)
+        second = auth.decode_token(token)
+
+    assert first == second
+    assert (first.user_id, first.username, first.is_admin) == (7, "dana", True)
+    assert decode.call_count == 1
+
+
+def test_cached_entry_expires_at_token_exp():
+    auth, clock = _service(jwt_expire_minutes=1)
+    token = auth.create_token(1, "eve", False)
+    auth.decode_token(token)
+
+    clock.now += 61
+    with patch("gateway.api.v1.auth_service.jwt.decode", wraps=jwt.decode) as decode:
+        auth.decode_token(token)
+    assert decode.call_count == 1
+
+
+def test_invalid_token_is_rejected_and_not_cached():
+    auth, _ = _service()
+    token = auth.create_token(1, "eve", False)
+    forged = token[:-2] + ("AA" if not token.endswith("AA") else "BB")
+
+    for _ in range(2):
+        with pytest.raises(HTTPException) as exc:
+            auth.decode_token(forged)
+        assert exc.value.status_code == 401
+    assert len(auth._verified) == 0
+
+
+def test_cache_is_bounded():
+    auth, _ = _service(jwt_cache_size=2)
+    for user_id in range(5):
+        auth.decode_token(auth.create_token(user_id, f"u{user_id}", False))
+    assert len(auth._verified) == 2
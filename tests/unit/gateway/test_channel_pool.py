@@ -0,0 +1,83 @@
+"""Channel pools: per-call channel selection, shared pools, channel args."""
+
+import asyncio
+
+from gateway.config.settings import Settings
+from gateway.container import build_use_cases
+from gateway.infrastructure.grpc_clients.pool import (
+    ChannelPool,
+    PoolConfig,
+    PooledStub,
+    close_channels,
+    get_pool,
+)
+
+
+class _FakeStub:
+    """Records which channel served each call; calls finish when the test resolves them."""
+
+    def __init__(self, channel):
+        self.channel = channel
+        self.calls: list[asyncio.Future] = []
+
+    def Ping(self, _request):
+        call = asyncio.get_running_loop().create_future()
+        self.calls.append(call)
+        return call
+
+
+def _served_by(stub: PooledStub) -> list[int]:
+    return [len(s.calls) for s in stub._stubs]
+
+
+async def test_round_robin_rotates_channels():
+    pool = ChannelPool("localhost:59991", PoolConfig(size=3))
+    stub = PooledStub(_FakeStub, pool)
+    for _ in range(6):
+        stub.Ping(None)
+    assert _served_by(stub) == [2, 2, 2]
+    await pool.close()
+
+
+async def test_least_outstanding_avoids_busy_channel():
+    pool = ChannelPool("localhost:59991", PoolConfig(size=2, policy="least_outstanding"))
+    stub = PooledStub(_FakeStub, pool)
+    slow = stub.Ping(None)
+    for _ in range(3):
+        call = stub.Ping(None)
+        call.set_result(None)
+        await asyncio.sleep(0)  # let the done callback release the channel
+    assert _served_by(stub) == [1, 3]
+    assert pool.outstanding == [1, 0]
+    slow.cancel()
+    await asyncio.sleep(0)
+    assert pool.outstanding == [0, 0]
+    await pool.close()
+
+
+def test_round_robin_lb_uses_dns_and_distinct_connections():
+    config = PoolConfig(size=4, lb_policy="round_robin", keepalive_time_ms=30_000)
+    options = dict(config.options())
+    assert config.target("weather:50051") == "dns:///weather:50051"
+    assert config.target("ipv4:10.0.0.1:1,10.0.0.2:1") == "ipv4:10.0.0.1:1,10.0.0.2:1"
+    assert options["grpc.lb_policy_name"] == "round_robin"
+    assert options["grpc.use_local_subchannel_pool"] == 1
+    assert options["grpc.keepalive_time_ms"] == 30_000
+
+
+async def test_pool_is_shared_per_address():
+    first = get_pool("localhost:59991", PoolConfig(size=2))
+    assert get_pool("localhost:59991") is first
+    assert get_pool("localhost:59992") is not first
+    await close_channels()
+    assert get_pool("localhost:59991") is not first
+    await close_channels()
+
+
+async def test_use_cases_share_pools_sized_from_settings():
+    use_cases = build_use_cases(
+        Settings(users_grpc_addr="localhost:59993", grpc_channels_per_target=3)
+    )
+    assert use_cases.get_city._users._pool is use_cases.get_forecast._users._pool
+    assert len(use_cases.get_city._users._pool.channels) == 3
+    await close_channels()
@@ -0,0 +1,21 @@
+"""Gateway lifespan owns per-process state on app.state and tears it down on exit."""
+
+from fastapi import FastAPI
+
+from gateway import main
+from gateway.api.v1.auth_service import AuthService
+from gateway.config.settings import Settings
+
+
+async def test_lifespan_builds_app_state_and_shuts_hasher_down(monkeypatch):
+    settings = Settings(grpc_host="127.0.0.1", grpc_port=0)
+    monkeypatch.setattr(main, "_settings", settings)
+    app = FastAPI()
+
+    async with main.lifespan(app):
+        assert isinstance(app.state.auth_service, AuthService)
+        assert app.state.response_cache.enabled
+        assert await app.state.password_hasher.verify("x", "not-a-hash") is False
+        hasher = app.state.password_hasher
+
+    assert hasher._executor._shutdown
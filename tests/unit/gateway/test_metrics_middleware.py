@@ -0,0 +1,39 @@
+"""PrometheusMiddleware: requests labelled by route template, not raw path."""
+
+from fastapi import FastAPI, HTTPException
+from fastapi.testclient import TestClient
+from prometheus_client import REGISTRY
+
+from gateway.api.metrics import PrometheusMiddleware
+
+
+def _requests(route: str, status: str) -> float:
+    labels = {"method": "GET", "route": route, "status": status}
+    return REGISTRY.get_sample_value("dresscast_http_requests_total", labels) or 0.0
+
+
+def test_labels_by_route_template_and_status():
+    app = FastAPI()
+    app.add_middleware(PrometheusMiddleware)
+
+    @app.get("/items/{item_id}")
+    def item(item_id: int):
+        if item_id == 0:
+            raise HTTPException(status_code=404)
+        return {"id": item_id}
+
+    before = {
+        key: _requests(*key)
+        for key in [("/items/{item_id}", "200"), ("/items/{item_id}", "404"), ("unmatched", "404")]
+    }
+    client = TestClient(app)
+    client.get("/items/1")
+    client.get("/items/2")
+    client.get("/items/0")
+    client.get("/nowhere")
+
+    assert {key: _requests(*key) - value for key, value in before.items()} == {
+        ("/items/{item_id}", "200"): 2,
+        ("/items/{item_id}", "404"): 1,
+        ("unmatched", "404"): 1,
+    }
@@ -0,0 +1,35 @@
+"""Backend RESOURCE_EXHAUSTED surfaces to REST clients as 503 with Retry-After."""
+
+import grpc
+import pytest
+from starlette.requests import Request
+
+from gateway.main import backend_overloaded
+
+
+class _RpcError(grpc.RpcError):
+    def __init__(self, code: grpc.StatusCode):
+        self._code = code
+
+    def code(self) -> grpc.StatusCode:
+        return self._code
+
+    def details(self) -> str:
+        return "Concurrent RPC limit exceeded!"
+
+
+def _request() -> Request:
+    return Request({"type": "http", "method": "GET", "path": "/api/v2/forecast", "headers": []})
+
+
+async def test_resource_exhausted_is_503():
+    response = await backend_overloaded(_request(), _RpcError(grpc.StatusCode.RESOURCE_EXHAUSTED))
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "1"
+
+
+async def test_other_codes_are_reraised():
+    error = _RpcError(grpc.StatusCode.INTERNAL)
+    with pytest.raises(grpc.RpcError) as exc:
+        await backend_overloaded(_request(), error)
+    assert exc.value is error
@@ -0,0 +1,45 @@
+"""PasswordHasher: bcrypt in a thread pool, event loop stays responsive."""
+
+import asyncio
+import time
+
+import pytest
+
+from shared.password_hashing import PasswordHasher, verify_password
+
+
+async def test_hash_and_verify_roundtrip():
+    hasher = PasswordHasher(rounds=4)
+    password_hash = await hasher.hash("correct horse")
+
+    assert password_hash.startswith("$2b$04$")
+    assert await hasher.verify("correct horse", password_hash)
+    assert not await hasher.verify("wrong", password_hash)
+    assert not verify_password("x", "not-a-bcrypt-hash")
+    hasher.close()
+
+
+async def test_event_loop_keeps_ticking_during_hash_burst():
+    hasher = PasswordHasher(rounds=10, max_workers=2)
+    ticks = 0
+
+    async def ticker():
+        nonlocal ticks
+        while True:
+            await asyncio.sleep(0.005)
+            ticks += 1
+
+    task = asyncio.create_task(ticker())
+    started = time.perf_counter()
+    await asyncio.gather(*(hasher.hash(f"pw{i}") for i in range(8)))
+    elapsed = time.perf_counter() - started
+    task.cancel()
+    hasher.close()
+
+    # With hashing on the loop the ticker would starve for the whole burst
+    assert ticks >= elapsed / 0.005 / 4
+
+
+def test_rejects_out_of_range_rounds():
+    with pytest.raises(ValueError):
+        PasswordHasher(rounds=3)
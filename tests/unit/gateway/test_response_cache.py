@@ -0,0 +1,48 @@
+"""ResponseCache: TTL expiry, LRU eviction, stable ETags."""
+
+from gateway.infrastructure.cache.response_cache import ResponseCache
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_entries_expire_after_ttl():
+    clock = _Clock()
+    cache = ResponseCache(max_entries=10, ttl_seconds=60, clock=clock)
+    entry = cache.set(("k",), b"{}")
+
+    clock.now = 59
+    assert cache.get(("k",)) == entry
+    assert entry.max_age(clock.now) == 1
+    clock.now = 60
+    assert cache.get(("k",)) is None
+    assert len(cache) == 0
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = ResponseCache(max_entries=2, ttl_seconds=60)
+    cache.set(("a",), b"1")
+    cache.set(("b",), b"2")
+    cache.get(("a",))
+    cache.set(("c",), b"3")
+
+    assert cache.get(("b",)) is None
+    assert cache.get(("a",)) is not None
+    assert cache.get(("c",)) is not None
+
+
+def test_etag_depends_on_body_only():
+    cache = ResponseCache()
+    assert cache.set(("a",), b"x").etag == cache.set(("b",), b"x").etag
+    assert cache.set(("a",), b"x").etag != cache.set(("a",), b"y").etag
+
+
+def test_zero_ttl_disables_storage():
+    cache = ResponseCache(ttl_seconds=0)
+    cache.set(("a",), b"x")
+    assert cache.get(("a",)) is None
@@ -0,0 +1,107 @@
+"""Tracing: one trace per request across gateway -> users/weather/dress_advice over gRPC."""
+
+import common_pb2
+import dress_advice_pb2
+import dress_advice_pb2_grpc
+import pytest
+import users_pb2_grpc
+import weather_pb2
+import weather_pb2_grpc
+from grpc import aio
+from opentelemetry import trace
+
+from gateway.application.use_cases.dress_advice import (
+    GetDressAdviceForUserCityUseCase,
+    StreamDressAdviceForUserCityUseCase,
+)
+from shared.tracing import (
+    TracingServerInterceptor,
+    format_span_tree,
+    tracing_client_interceptors,
+)
+
+tracer = trace.get_tracer(__name__)
+
+
+class _Users(users_pb2_grpc.UsersServiceServicer):
+    async def GetCity(self, request, _context):
+        return common_pb2.City(id=1, user_id=request.user_id, name=request.city_name, lat=1, lon=2)
+
+
+class _Weather(weather_pb2_grpc.WeatherServiceServicer):
+    async def GetForecast(self, _request, _context):
+        with tracer.start_as_current_span("redis GET"):
+            pass
+        return weather_pb2.GetForecastResponse(data=common_pb2.WeatherData(temperature=12))
+
+
+class _DressAdvice(dress_advice_pb2_grpc.DressAdviceServiceServicer):
+    async def GetAdvice(self, _request, _context):
+        return dress_advice_pb2.GetAdviceResponse(advice_text="Light jacket")
+
+    async def StreamAdvice(self, _request, _context):
+        for text in ("Light ", "jacket"):
+            yield dress_advice_pb2.AdviceChunk(text=text)
+
+
+@pytest.fixture
+async def channel(span_exporter):
+    server = aio.server(interceptors=[TracingServerInterceptor()])
+    users_pb2_grpc.add_UsersServiceServicer_to_server(_Users(), server)
+    weather_pb2_grpc.add_WeatherServiceServicer_to_server(_Weather(), server)
+    dress_advice_pb2_grpc.add_DressAdviceServiceServicer_to_server(_DressAdvice(), server)
+    port = server.add_insecure_port("127.0.0.1:0")
+    await server.start()
+    async with aio.insecure_channel(
+        f"127.0.0.1:{port}", interceptors=tracing_client_interceptors()
+    ) as ch:
+        yield ch
+    await server.stop(None)
+
+
+async def test_dress_advice_request_is_one_trace(channel, spans):
+    use_case = GetDressAdviceForUserCityUseCase(
+        users_pb2_grpc.UsersServiceStub(channel),
+        weather_pb2_grpc.WeatherServiceStub(channel),
+        dress_advice_pb2_grpc.DressAdviceServiceStub(channel),
+    )
+
+    response = await use_case.run(user_id=7, city_name="Moscow")
+
+    assert response.advice_text == "Light jacket"
+    finished = spans.get_finished_spans()
+    assert len({s.context.trace_id for s in finished}) == 1
+    tree = [line.rsplit("  ", 1)[0] for line in format_span_tree(finished).splitlines()]
+    assert tree == [
+        "GetDressAdviceForUserCity",
+        "  dresscast.v1.UsersService/GetCity",
+        "    dresscast.v1.UsersService/GetCity",
+        "  dresscast.v1.WeatherService/GetForecast",
+        "    dresscast.v1.WeatherService/GetForecast",
+        "      redis GET",
+        "  dresscast.v1.DressAdviceService/GetAdvice",
+        "    dresscast.v1.DressAdviceService/GetAdvice",
+    ]
+    kinds = [s.kind.name for s in sorted(finished, key=lambda s: s.start_time)]
+    assert kinds[1:3] == ["CLIENT", "SERVER"]
+
+
+async def test_streamed_dress_advice_is_one_trace(channel, spans):
+    use_case = StreamDressAdviceForUserCityUseCase(
+        users_pb2_grpc.UsersServiceStub(channel),
+        weather_pb2_grpc.WeatherServiceStub(channel),
+        dress_advice_pb2_grpc.DressAdviceServiceStub(channel),
+    )
+
+    chunks = [c async for c in use_case.run(user_id=7, city_name="Moscow")]
+
+    assert "".join(chunks) == "Light jacket"
+    assert trace.get_current_span() is trace.INVALID_SPAN
+    finished = spans.get_finished_spans()
+    assert len({s.context.trace_id for s in finished}) == 1
+    tree = [line.rsplit("  ", 1)[0] for line in format_span_tree(finished).splitlines()]
+    assert tree[0] == "StreamDressAdviceForUserCity"
+    assert tree[-2:] == [
+        "  dresscast.v1.DressAdviceService/StreamAdvice",
+        "    dresscast.v1.DressAdviceService/StreamAdvice",
+    ]
@@ -0,0 +1 @@
+# Shared modules unit tests
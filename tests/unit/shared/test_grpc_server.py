@@ -0,0 +1,71 @@
+"""create_server: load shedding past the concurrency limit, gzip responses, options."""
+
+import asyncio
+
+import grpc
+import pytest
+from grpc import aio
+
+from shared.grpc_server import GrpcServerSettings, create_server, server_options
+
+
+async def _slow(request, context):
+    await asyncio.sleep(0.2)
+    return request
+
+
+async def _chunks(request, context):
+    for _ in range(3):
+        yield request * 100_000
+
+
+async def _serve(settings: GrpcServerSettings):
+    server = create_server(settings, interceptors=[])
+    handlers = {
+        "Slow": grpc.unary_unary_rpc_method_handler(_slow),
+        "Chunks": grpc.unary_stream_rpc_method_handler(_chunks),
+    }
+    server.add_generic_rpc_handlers((grpc.method_handlers_generic_handler("test.Srv", handlers),))
+    port = server.add_insecure_port("127.0.0.1:0")
+    await server.start()
+    return server, f"127.0.0.1:{port}"
+
+
+async def test_sheds_calls_beyond_limit_with_resource_exhausted():
+    server, addr = await _serve(GrpcServerSettings(grpc_server_max_concurrent_rpcs=2))
+    try:
+        async with aio.insecure_channel(addr) as channel:
+            slow = channel.unary_unary("/test.Srv/Slow")
+            results = await asyncio.gather(*(slow(b"x") for _ in range(5)), return_exceptions=True)
+    finally:
+        await server.stop(None)
+
+    shed = [r for r in results if isinstance(r, grpc.RpcError)]
+    assert results.count(b"x") == 2
+    assert len(shed) == 3
+    assert {r.code() for r in shed} == {grpc.StatusCode.RESOURCE_EXHAUSTED}
+
+
+async def test_gzip_streaming_round_trip():
+    server, addr = await _serve(GrpcServerSettings(grpc_server_compression="gzip"))
+    try:
+        async with aio.insecure_channel(addr) as channel:
+            chunks = [c async for c in channel.unary_stream("/test.Srv/Chunks")(b"ab")]
+    finally:
+        await server.stop(None)
+
+    assert chunks == [b"ab" * 100_000] * 3
+
+
+@pytest.mark.parametrize("keepalive_ms", [0, 30_000])
+def test_server_options(keepalive_ms):
+    options = dict(
+        server_options(
+            GrpcServerSettings(
+                grpc_server_max_message_bytes=1024, grpc_server_keepalive_time_ms=keepalive_ms
+            )
+        )
+    )
+    assert options["grpc.max_send_message_length"] == 1024
+    assert options["grpc.max_receive_message_length"] == 1024
+    assert options.get("grpc.keepalive_time_ms") == (keepalive_ms or None)
@@ -0,0 +1,91 @@
+"""Queue-based logging: JSON lines, per-logger sampling, non-blocking enqueue."""
+
+import io
+import json
+import logging
+
+import pytest
+
+from shared.logging_setup import JsonFormatter, LoggingSettings, SamplingFilter, setup_logging
+
+
+def _record(name: str, level: int = logging.INFO, msg: str = "hello %s", args=("world",)):
+    return logging.LogRecord(name, level, __file__, 1, msg, args, None)
+
+
+def test_json_formatter_fields_and_extras():
+    record = _record("weather.api.servicer")
+    record.city_id = 7
+
+    entry = json.loads(JsonFormatter("weather").format(record))
+
+    assert entry["level"] == "INFO"
+    assert entry["logger"] == "weather.api.servicer"
+    assert entry["msg"] == "hello world"
+    assert entry["service"] == "weather"
+    assert entry["city_id"] == 7
+    assert "exc" not in entry
+
+
+def test_sampling_filter_longest_prefix_wins_and_warnings_pass():
+    sampler = SamplingFilter({"weather": 1.0, "weather.api": 0.0}, rng=lambda: 0.5)
+
+    assert not sampler.filter(_record("weather.api.servicer"))
+    assert sampler.filter(_record("weather.application"))
+    assert sampler.filter(_record("weatherish"))
+    assert sampler.filter(_record("weather.api.servicer", logging.WARNING))
+
+
+@pytest.fixture
+def bare_root(monkeypatch):
+    """Root logger without handlers; pytest's capture handler is attached during the test call."""
+    root = logging.getLogger()
+    monkeypatch.setattr(root, "level", root.level)
+
+    def clear():
+        monkeypatch.setattr(root, "handlers", [])
+        return root
+
+    return clear
+
+
+def test_setup_logging_writes_through_listener(bare_root):
+    bare_root()
+    stream = io.StringIO()
+    settings = LoggingSettings(format="json", sample_rates={"noisy": 0.0})
+    listener = setup_logging("INFO", "gateway", settings=settings, stream=stream)
+
+    logging.getLogger("noisy.route").info("dropped")
+    logging.getLogger("gateway.api").info("kept %d", 1)
+    logging.getLogger("noisy.route").warning("kept too")
+    listener.stop()
+
+    lines = [json.loads(line) for line in stream.getvalue().splitlines()]
+    assert [entry["msg"] for entry in lines] == ["kept 1", "kept too"]
+    assert all(entry["service"] == "gateway" for entry in lines)
+
+
+def test_exception_traceback_is_a_separate_json_field(bare_root):
+    bare_root()
+    stream = io.StringIO()
+    listener = setup_logging("INFO", settings=LoggingSettings(format="json"), stream=stream)
+
+    try:
+        raise ValueError("boom")
+    except ValueError:
+        logging.getLogger("gateway.api").exception("request failed id=%s", 7)
+    listener.stop()
+
+    entry = json.loads(stream.getvalue())
+    assert entry["msg"] == "request failed id=7"
+    assert entry["exc"].startswith("Traceback")
+    assert "ValueError: boom" in entry["exc"]
+
+
+def test_setup_logging_keeps_existing_configuration(bare_root):
+    root = bare_root()
+    existing = logging.NullHandler()
+    root.addHandler(existing)
+
+    assert setup_logging("INFO") is None
+    assert root.handlers == [existing]
@@ -0,0 +1,83 @@
+"""MetricsServerInterceptor: per-method status codes and latency on a real aio server."""
+
+import grpc
+import pytest
+from grpc import aio
+from prometheus_client import REGISTRY
+
+from shared.metrics import MetricsServerInterceptor
+
+
+async def _ok(request, context):
+    return request
+
+
+async def _not_found(request, context):
+    context.set_code(grpc.StatusCode.NOT_FOUND)
+    context.set_details("no such city")
+    return b""
+
+
+async def _boom(request, context):
+    raise RuntimeError("boom")
+
+
+async def _stream(request, context):
+    yield request
+    yield request
+
+
+def _handled(method: str, code: str) -> float:
+    labels = {"grpc_service": "test.Metrics", "grpc_method": method, "grpc_code": code}
+    return REGISTRY.get_sample_value("dresscast_grpc_server_handled_total", labels) or 0.0
+
+
+@pytest.fixture
+async def channel():
+    server = aio.server(interceptors=[MetricsServerInterceptor()])
+    handlers = {
+        "Ok": grpc.unary_unary_rpc_method_handler(_ok),
+        "NotFound": grpc.unary_unary_rpc_method_handler(_not_found),
+        "Boom": grpc.unary_unary_rpc_method_handler(_boom),
+        "Stream": grpc.unary_stream_rpc_method_handler(_stream),
+    }
+    server.add_generic_rpc_handlers(
+        (grpc.method_handlers_generic_handler("test.Metrics", handlers),)
+    )
+    port = server.add_insecure_port("127.0.0.1:0")
+    await server.start()
+    async with aio.insecure_channel(f"127.0.0.1:{port}") as ch:
+        yield ch
+    await server.stop(None)
+
+
+async def test_counts_calls_by_status_code(channel):
+    before = {
+        key: _handled(*key)
+        for key in [("Ok", "OK"), ("NotFound", "NOT_FOUND"), ("Boom", "UNKNOWN")]
+    }
+
+    assert await channel.unary_unary("/test.Metrics/Ok")(b"hi") == b"hi"
+    for method in ("NotFound", "Boom"):
+        with pytest.raises(aio.AioRpcError):
+            await channel.unary_unary(f"/test.Metrics/{method}")(b"")
+
+    assert {key: _handled(*key) - value for key, value in before.items()} == {
+        ("Ok", "OK"): 1,
+        ("NotFound", "NOT_FOUND"): 1,
+        ("Boom", "UNKNOWN"): 1,
+    }
+    latency = REGISTRY.get_sample_value(
+        "dresscast_grpc_server_handling_seconds_count",
+        {"grpc_service": "test.Metrics", "grpc_method": "Ok"},
+    )
+    assert latency >= 1
+
+
+async def test_streaming_call_recorded_after_last_message(channel):
+    before = _handled("Stream", "OK")
+
+    responses = [r async for r in channel.unary_stream("/test.Metrics/Stream")(b"x")]
+
+    assert responses == [b"x", b"x"]
+    assert _handled("Stream", "OK") - before == 1
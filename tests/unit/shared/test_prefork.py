@@ -0,0 +1,54 @@
+"""run_workers: SIGTERM fans out to spawned workers; one worker dying stops the rest."""
+
+import os
+import signal
+import sys
+import threading
+import time
+from pathlib import Path
+
+from shared.prefork import run_workers
+
+_READY_DIR = "PREFORK_TEST_READY_DIR"
+
+
+def _mark_ready(index: int) -> None:
+    (Path(os.environ[_READY_DIR]) / str(index)).touch()
+
+
+def graceful_worker(index: int) -> None:
+    stop = threading.Event()
+    signal.signal(signal.SIGTERM, lambda *_: stop.set())
+    _mark_ready(index)
+    sys.exit(0 if stop.wait(30) else 2)
+
+
+def crashing_worker(index: int) -> None:
+    if index == 0:
+        sys.exit(3)
+    time.sleep(30)
+
+
+def _send_sigterm_when_ready(ready_dir: Path, workers: int) -> None:
+    deadline = time.monotonic() + 30
+    while len(list(ready_dir.iterdir())) < workers and time.monotonic() < deadline:
+        time.sleep(0.05)
+    os.kill(os.getpid(), signal.SIGTERM)
+
+
+def test_sigterm_stops_every_worker_gracefully(tmp_path, monkeypatch):
+    monkeypatch.setenv(_READY_DIR, str(tmp_path))
+    threading.Thread(target=_send_sigterm_when_ready, args=(tmp_path, 2), daemon=True).start()
+
+    code = run_workers(f"{__name__}:graceful_worker", 2, "test", grace_seconds=5)
+
+    assert code == 0
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["0", "1"]
+
+
+def test_worker_exit_stops_the_rest():
+    started = time.monotonic()
+    code = run_workers(f"{__name__}:crashing_worker", 2, "test", grace_seconds=1)
+
+    assert code == 1
+    assert time.monotonic() - started < 20
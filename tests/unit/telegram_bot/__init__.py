@@ -0,0 +1 @@
+# Telegram bot unit tests
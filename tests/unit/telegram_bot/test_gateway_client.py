@@ -0,0 +1,47 @@
+"""Telegram bot GatewayClient: per-telegram_id user cache."""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+from telegram_bot.gateway_client import GatewayClient
+
+
+def _client_with_stub(**kwargs) -> tuple[GatewayClient, AsyncMock]:
+    client = GatewayClient("localhost:0", **kwargs)
+    stub = AsyncMock()
+    stub.GetOrCreateUserByTelegramId = AsyncMock(
+        return_value=SimpleNamespace(id=7, username="tg_42")
+    )
+    client._stub = stub
+    return client, stub
+
+
+async def test_repeated_lookups_hit_cache():
+    client, stub = _client_with_stub()
+    first = await client.get_or_create_user_by_telegram("42")
+    second = await client.get_or_create_user_by_telegram("42")
+    assert first is second
+    assert stub.GetOrCreateUserByTelegramId.await_count == 1
+
+
+async def test_cache_disabled_with_zero_ttl():
+    client, stub = _client_with_stub(user_cache_ttl_seconds=0)
+    await client.get_or_create_user_by_telegram("42")
+    await client.get_or_create_user_by_telegram("42")
+    assert stub.GetOrCreateUserByTelegramId.await_count == 2
+
+
+async def test_cache_evicts_least_recently_used():
+    client, stub = _client_with_stub(user_cache_max_size=1)
+    await client.get_or_create_user_by_telegram("1")
+    await client.get_or_create_user_by_telegram("2")
+    await client.get_or_create_user_by_telegram("1")
+    assert stub.GetOrCreateUserByTelegramId.await_count == 3
+
+
+async def test_empty_user_not_cached():
+    client, stub = _client_with_stub()
+    stub.GetOrCreateUserByTelegramId.return_value = SimpleNamespace(id=0, username="")
+    await client.get_or_create_user_by_telegram("42")
+    await client.get_or_create_user_by_telegram("42")
+    assert stub.GetOrCreateUserByTelegramId.await_count == 2
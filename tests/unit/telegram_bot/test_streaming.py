@@ -0,0 +1,42 @@
+"""ThrottledMessageEditor: progressive edits within Telegram's rate limits."""
+
+from unittest.mock import AsyncMock
+
+from telegram_bot.streaming import ThrottledMessageEditor
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+async def test_first_chunk_shown_at_once_then_throttled():
+    edit, clock = AsyncMock(), _Clock()
+    editor = ThrottledMessageEditor(edit, min_interval_seconds=1.0, clock=clock)
+    await editor.append("Wear")
+    clock.now = 0.5
+    await editor.append(" a coat")
+    clock.now = 1.2
+    await editor.append(" and boots")
+    assert [c.args[0] for c in edit.await_args_list] == ["Wear", "Wear a coat and boots"]
+
+
+async def test_finish_shows_complete_text_once():
+    edit, clock = AsyncMock(), _Clock()
+    editor = ThrottledMessageEditor(edit, min_interval_seconds=1.0, clock=clock)
+    await editor.append("Wear")
+    await editor.append(" a coat")
+    assert await editor.finish() == "Wear a coat"
+    assert await editor.finish() == "Wear a coat"
+    assert [c.args[0] for c in edit.await_args_list] == ["Wear", "Wear a coat"]
+
+
+async def test_failed_intermediate_edit_does_not_abort_stream():
+    edit = AsyncMock(side_effect=[RuntimeError("429 Too Many Requests"), None])
+    editor = ThrottledMessageEditor(edit, min_interval_seconds=0)
+    await editor.append("Wear")
+    assert await editor.finish() == "Wear"
+    assert edit.await_count == 2
@@ -0,0 +1,18 @@
+"""Fixtures for Users unit tests: SQLite session factory."""
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from users.infrastructure.db.models import Base
+
+
+@pytest.fixture
+async def session_factory(tmp_path):
+    """Session factory over a fresh file-backed SQLite DB with the schema created."""
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'users.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    try:
+        yield async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    finally:
+        await engine.dispose()
@@ -0,0 +1,94 @@
+"""ImportCities: batched inserts with per-row error reporting."""
+
+import fakeredis
+
+from users.application.use_cases.create_user import CreateUserUseCase
+from users.application.use_cases.import_cities import ImportCitiesUseCase
+from users.domain.entities import CityImportRow
+from users.infrastructure.db.repositories.city_repository import CityRepositoryImpl
+from users.infrastructure.db.repositories.user_repository import UserRepositoryImpl
+from users.infrastructure.db.session import SessionRouter
+from users.infrastructure.events.redis_stream import RedisCityEventPublisher
+
+
+async def _rows(rows):
+    for row in rows:
+        yield row
+
+
+async def _make_user(session_factory, username: str) -> int:
+    repo = UserRepositoryImpl(session_factory)
+    user = await CreateUserUseCase(repo, SessionRouter(session_factory)).run(
+        username=username,
+        password_hash="",  # nosec B106 - test fixture
+    )
+    return user.id
+
+
+def _use_case(session_factory, batch_size: int, events=None) -> ImportCitiesUseCase:
+    return ImportCitiesUseCase(
+        CityRepositoryImpl(session_factory),
+        UserRepositoryImpl(session_factory),
+        SessionRouter(session_factory),
+        batch_size=batch_size,
+        events=events,
+    )
+
+
+async def test_imports_rows_across_batches(session_factory):
+    user_id = await _make_user(session_factory, "partner")
+    rows = [CityImportRow(user_id, f"City {i}", 50.0 + i / 100, 30.0) for i in range(7)]
+    result = await _use_case(session_factory, batch_size=3).run(_rows(rows))
+    assert result.received_count == 7
+    assert result.imported_count == 7
+    assert result.errors == []
+    assert result.rows_per_second > 0
+
+
+async def test_reports_per_row_errors(session_factory):
+    user_id = await _make_user(session_factory, "partner")
+    first = await _use_case(session_factory, batch_size=10).run(
+        _rows([CityImportRow(user_id, "Moscow", 55.75, 37.62)])
+    )
+    assert first.imported_count == 1
+    rows = [
+        CityImportRow(user_id, "Moscow", 55.75, 37.62),  # already exists
+        CityImportRow(user_id, "Kazan", 55.79, 49.12),
+        CityImportRow(user_id, "Kazan", 55.79, 49.12),  # duplicate within import
+        CityImportRow(user_id + 100, "Paris", 48.85, 2.35),  # unknown user
+        CityImportRow(user_id, "Nowhere", 91.0, 0.0),  # invalid latitude
+        CityImportRow(user_id, "  ", 10.0, 10.0),  # empty name
+    ]
+    result = await _use_case(session_factory, batch_size=10).run(_rows(rows))
+    assert result.received_count == 6
+    assert result.imported_count == 1
+    assert [(e.row_index, e.code) for e in result.errors] == [
+        (0, "CITY_ALREADY_EXISTS"),
+        (2, "CITY_ALREADY_EXISTS"),
+        (3, "USER_NOT_FOUND"),
+        (4, "VALIDATION_ERROR"),
+        (5, "VALIDATION_ERROR"),
+    ]
+
+
+async def test_publishes_city_added_events_for_inserted_rows(session_factory):
+    user_id = await _make_user(session_factory, "partner")
+    events = RedisCityEventPublisher("redis://unused", "cities:added")
+    events._client = fakeredis.FakeAsyncRedis(decode_responses=True)
+    await _use_case(session_factory, batch_size=10).run(
+        _rows([CityImportRow(user_id, "Moscow", 55.75, 37.62)])
+    )
+    rows = [
+        CityImportRow(user_id, "Moscow", 55.75, 37.62),  # already exists: no event
+        CityImportRow(user_id, "Kazan", 55.79, 49.12),
+        CityImportRow(user_id, "Omsk", 54.99, 73.37),
+    ]
+    await _use_case(session_factory, batch_size=2, events=events).run(_rows(rows))
+
+    entries = await events._client.xrange("cities:added")
+    assert [(float(f["lat"]), float(f["lon"])) for _, f in entries] == [
+        (55.79, 49.12),
+        (54.99, 73.37),
+    ]
+    assert all(int(f["city_id"]) > 0 and int(f["user_id"]) == user_id for _, f in entries)
+    await events._client.aclose()
@@ -0,0 +1,108 @@
+"""Hot Users queries must be served by indexes, not sequential scans of `cities`."""
+
+import pytest
+from sqlalchemy import event, inspect, text
+
+from users.application.use_cases.create_user import CreateUserUseCase
+from users.domain.entities import CityImportRow
+from users.infrastructure.db.migrations import migrate
+from users.infrastructure.db.repositories.city_repository import CityRepositoryImpl
+from users.infrastructure.db.repositories.user_repository import UserRepositoryImpl
+from users.infrastructure.db.session import SessionRouter, get_session
+
+
+@pytest.fixture
+async def city_repo(session_factory):
+    create_user = CreateUserUseCase(
+        UserRepositoryImpl(session_factory), SessionRouter(session_factory)
+    )
+    user = await create_user.run(
+        username="planner",
+        password_hash="",  # nosec B106 - test fixture
+    )
+    repo = CityRepositoryImpl(session_factory)
+    rows = [CityImportRow(user.id, f"City {i}", 40 + i / 10, 20 + i / 10) for i in range(50)]
+    async with get_session(session_factory) as session:
+        await repo.add_many(session, rows)
+    return repo, user.id
+
+
+async def _query_plan(session_factory, statement: str, params) -> list[str]:
+    async with session_factory() as session:
+        conn = await session.connection()
+        raw = await conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", params)
+        return [row[-1] for row in raw.all()]
+
+
+async def _plans_for(session_factory, call) -> list[list[str]]:
+    """Run `call` and return the SQLite query plan of every SELECT it issued."""
+    engine = session_factory.kw["bind"].sync_engine
+    captured = []
+
+    def capture(_conn, _cursor, statement, parameters, _context, _executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            captured.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", capture)
+    try:
+        await call()
+    finally:
+        event.remove(engine, "before_cursor_execute", capture)
+    assert captured
+    return [await _query_plan(session_factory, s, p) for s, p in captured]
+
+
+def _assert_no_seq_scan(plans: list[list[str]]) -> None:
+    for plan in plans:
+        assert "SCAN cities" not in plan, plan
+
+
+async def test_list_all_coordinates_uses_covering_index(session_factory, city_repo):
+    repo, _ = city_repo
+
+    async def call():
+        async with get_session(session_factory) as session:
+            await repo.list_all_coordinates(session)
+
+    plans = await _plans_for(session_factory, call)
+    _assert_no_seq_scan(plans)
+    assert any("COVERING INDEX ix_cities_lat_lon_user_id" in step for step in plans[0])
+
+
+async def test_keyset_page_uses_primary_key(session_factory, city_repo):
+    repo, _ = city_repo
+
+    async def call():
+        async with get_session(session_factory) as session:
+            page = await repo.list_coordinates_after(session, after_id=10, limit=5)
+            assert [row[0] for row in page] == [11, 12, 13, 14, 15]
+
+    _assert_no_seq_scan(await _plans_for(session_factory, call))
+
+
+async def test_user_city_lookups_use_unique_index(session_factory, city_repo):
+    repo, user_id = city_repo
+
+    async def call():
+        async with get_session(session_factory) as session:
+            await repo.list_by_user_id(session, user_id)
+            await repo.get_by_user_and_name(session, user_id, "City 3")
+
+    _assert_no_seq_scan(await _plans_for(session_factory, call))
+
+
+async def test_migrate_adds_missing_indexes_once(session_factory):
+    engine = session_factory.kw["bind"]
+    async with engine.begin() as conn:
+        await conn.execute(text("DROP INDEX ix_cities_lat_lon_user_id"))
+
+    assert await migrate(engine) == [1]
+    assert await migrate(engine) == []
+
+    async with engine.connect() as conn:
+        names = await conn.run_sync(
+            lambda sync_conn: {i["name"] for i in inspect(sync_conn).get_indexes("cities")}
+        )
+    assert "ix_cities_lat_lon_user_id" in names
+    # PostgreSQL-only index is skipped on SQLite
+    assert "ix_cities_id_coords" not in names
@@ -0,0 +1,43 @@
+"""SessionRouter: replica reads with read-your-writes stickiness."""
+
+from users.infrastructure.db.session import SessionRouter
+
+
+def _factories():
+    return object(), object(), object()
+
+
+def test_without_replicas_everything_goes_to_primary():
+    primary, _, _ = _factories()
+    router = SessionRouter(primary)
+    router.mark_written(1)
+    assert router.reader() is primary
+    assert router.reader(1) is primary
+    assert router.writer() is primary
+
+
+def test_reads_round_robin_over_replicas():
+    primary, first, second = _factories()
+    router = SessionRouter(primary, [first, second])
+    assert [router.reader(7) for _ in range(4)] == [first, second, first, second]
+    assert router.writer() is primary
+
+
+def test_recent_writer_reads_from_primary(monkeypatch):
+    primary, replica, _ = _factories()
+    now = [100.0]
+    monkeypatch.setattr("users.infrastructure.db.session.time.monotonic", lambda: now[0])
+    router = SessionRouter(primary, [replica], sticky_seconds=5.0)
+    router.mark_written(1)
+    assert router.reader(1) is primary
+    assert router.reader(2) is replica
+    assert router.reader() is replica
+    now[0] += 5.1
+    assert router.reader(1) is replica
+
+
+def test_zero_sticky_window_disables_pinning():
+    primary, replica, _ = _factories()
+    router = SessionRouter(primary, [replica], sticky_seconds=0)
+    router.mark_written(1)
+    assert router.reader(1) is replica
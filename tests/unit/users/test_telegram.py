@@ -0,0 +1,62 @@
+"""GetOrCreateUserByTelegramId: single-statement upsert."""
+
+import asyncio
+
+import pytest
+
+from users.application.use_cases.create_user import CreateUserUseCase
+from users.application.use_cases.telegram import GetOrCreateUserByTelegramIdUseCase
+from users.domain.exceptions import UserAlreadyExistsError
+from users.infrastructure.db.repositories.user_repository import UserRepositoryImpl
+from users.infrastructure.db.session import SessionRouter
+
+
+async def test_creates_user_on_first_call(session_factory):
+    uc = GetOrCreateUserByTelegramIdUseCase(
+        UserRepositoryImpl(session_factory), SessionRouter(session_factory)
+    )
+    user = await uc.run("1001", locale="ru")
+    assert user.id > 0
+    assert user.username == "tg_1001"
+    assert user.telegram_id == "1001"
+    assert user.locale == "ru"
+    assert user.is_admin is False
+
+
+async def test_returns_existing_user_on_repeat(session_factory):
+    uc = GetOrCreateUserByTelegramIdUseCase(
+        UserRepositoryImpl(session_factory), SessionRouter(session_factory)
+    )
+    first = await uc.run("1002", username="alice")
+    second = await uc.run("1002", username="ignored", locale="ru")
+    assert second.id == first.id
+    assert second.username == "alice"
+    assert second.locale == "en"
+
+
+async def test_concurrent_calls_resolve_to_one_user(session_factory):
+    uc = GetOrCreateUserByTelegramIdUseCase(
+        UserRepositoryImpl(session_factory), SessionRouter(session_factory)
+    )
+    users = await asyncio.gather(*(uc.run("1003") for _ in range(5)))
+    assert len({u.id for u in users}) == 1
+
+
+async def test_username_taken_by_other_account_raises(session_factory):
+    repo = UserRepositoryImpl(session_factory)
+    await CreateUserUseCase(repo, SessionRouter(session_factory)).run(
+        username="bob",
+        password_hash="x",  # nosec B106 - test fixture
+    )
+    uc = GetOrCreateUserByTelegramIdUseCase(repo, SessionRouter(session_factory))
+    with pytest.raises(UserAlreadyExistsError):
+        await uc.run("1004", username="bob")
+
+
+async def test_new_user_reads_stay_on_primary(session_factory):
+    replica = object()
+    sessions = SessionRouter(session_factory, [replica], sticky_seconds=5.0)
+    uc = GetOrCreateUserByTelegramIdUseCase(UserRepositoryImpl(session_factory), sessions)
+    user = await uc.run("1005")
+    assert sessions.reader(user.id) is session_factory
+    assert sessions.reader(user.id + 1) is replica
@@ -0,0 +1,63 @@
+"""VerifyCredentials: bcrypt check in the hasher pool, overload maps to a domain error."""
+
+import asyncio
+
+import pytest
+
+from gateway.config.settings import Settings as GatewaySettings
+from shared.password_hashing import PasswordHasher, hash_password
+from users.application.use_cases.create_user import CreateUserUseCase
+from users.application.use_cases.verify_credentials import VerifyCredentialsUseCase
+from users.config.settings import Settings as UsersSettings
+from users.domain.exceptions import InvalidCredentialsError, ServiceOverloadedError
+from users.infrastructure.db.repositories.user_repository import UserRepositoryImpl
+from users.infrastructure.db.session import SessionRouter
+
+
+async def _create(session_factory, username: str, password: str):
+    repo = UserRepositoryImpl(session_factory)
+    return await CreateUserUseCase(repo, SessionRouter(session_factory)).run(
+        username=username, password_hash=hash_password(password, rounds=4)
+    )
+
+
+def _use_case(session_factory, hasher, dummy_hash=None):
+    return VerifyCredentialsUseCase(
+        UserRepositoryImpl(session_factory), session_factory, hasher, dummy_hash
+    )
+
+
+async def test_valid_password_returns_user(session_factory):
+    created = await _create(session_factory, "alice", "s3cret")
+    user = await _use_case(session_factory, PasswordHasher(rounds=4)).run("alice", "s3cret")
+    assert user.id == created.id
+
+
+async def test_wrong_password_and_unknown_user_are_rejected(session_factory):
+    await _create(session_factory, "bob", "right")
+    hasher = PasswordHasher(rounds=4)
+    uc = _use_case(session_factory, hasher, dummy_hash=hash_password("x", rounds=4))
+
+    with pytest.raises(InvalidCredentialsError):
+        await uc.run("bob", "wrong")
+    with pytest.raises(InvalidCredentialsError):
+        await uc.run("nobody", "right")
+
+
+async def test_full_queue_raises_service_overloaded(session_factory):
+    await _create(session_factory, "carol", "pw")
+    hasher = PasswordHasher(rounds=12, max_workers=1, max_pending=1)
+    busy = asyncio.create_task(hasher.hash("occupies the only slot"))
+    await asyncio.sleep(0)
+
+    with pytest.raises(ServiceOverloadedError):
+        await _use_case(session_factory, hasher).run("carol", "pw")
+    await busy
+    assert (await _use_case(session_factory, hasher).run("carol", "pw")).username == "carol"
+
+
+def test_gateway_and_users_share_one_bcrypt_cost(monkeypatch):
+    # The dummy hash for unknown users is made with the Users setting, real hashes with the
+    # gateway's; one env var keeps both paths equally slow
+    monkeypatch.setenv("BCRYPT_ROUNDS", "5")
+    assert GatewaySettings().bcrypt_rounds == UsersSettings().bcrypt_rounds == 5
@@ -0,0 +1,31 @@
+"""RedisForecastCache: hit/miss/error counters."""
+
+import fakeredis
+from prometheus_client import REGISTRY
+
+from weather.application.use_cases.get_forecast import WeatherData
+from weather.infrastructure.cache.redis_cache import RedisForecastCache
+
+
+def _lookups(result: str) -> float:
+    labels = {"cache": "weather_forecast", "result": result}
+    return REGISTRY.get_sample_value("dresscast_cache_requests_total", labels) or 0.0
+
+
+async def test_counts_hits_misses_and_errors():
+    cache = RedisForecastCache("redis://unused")
+    cache._client = fakeredis.FakeAsyncRedis(decode_responses=True)
+    before = {result: _lookups(result) for result in ("hit", "miss", "error")}
+
+    await cache.set("w:1", WeatherData(12.0, 60.0, 3.0, 0.0, "2026-01-01T12:00"))
+    assert (await cache.get("w:1")).temperature == 12.0
+    assert await cache.get("w:2") is None
+    await cache._client.set("w:3", "not json")
+    assert await cache.get("w:3") is None
+
+    assert {result: _lookups(result) - value for result, value in before.items()} == {
+        "hit": 1,
+        "miss": 1,
+        "error": 1,
+    }
+    await cache._client.aclose()
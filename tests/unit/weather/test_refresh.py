@@ -0,0 +1,53 @@
+"""RefreshForecastsUseCase pre-warms the keys GetCurrentWeather/GetForecast read."""
+
+from datetime import date
+from unittest.mock import AsyncMock
+
+from weather.application.use_cases.get_forecast import (
+    GetForecastUseCase,
+    RefreshForecastsUseCase,
+    WeatherData,
+)
+
+
+class _DictCache:
+    def __init__(self):
+        self.data = {}
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def set(self, key, data, *_):
+        self.data[key] = data
+
+
+async def test_refresh_warms_current_and_default_forecast():
+    provider = AsyncMock()
+    provider.get_current_weather.return_value = WeatherData(12.0, 70.0, 3.0, 0.0, "")
+    cache = _DictCache()
+
+    assert await RefreshForecastsUseCase(provider, cache).run([(55.75, 37.62)]) == 1
+    today = date.today().isoformat()
+    assert set(cache.data) == {
+        "current:55.7500:37.6200",
+        "forecast:55.7500:37.6200::",
+        f"forecast:55.7500:37.6200:{today}:",
+    }
+
+    await GetForecastUseCase(provider, cache).run(55.75, 37.62)
+    provider.get_forecast.assert_not_awaited()
+
+
+async def test_refresh_warms_todays_forecast_as_the_gateway_requests_it():
+    provider = AsyncMock()
+    provider.get_current_weather.return_value = WeatherData(
+        12.0, 70.0, 3.0, 0.0, "2026-10-19T10:00"
+    )
+    cache = _DictCache()
+    await RefreshForecastsUseCase(provider, cache).run([(55.75, 37.62)])
+
+    today = date.today().isoformat()
+    data = await GetForecastUseCase(provider, cache).run(55.75, 37.62, today)
+    provider.get_forecast.assert_not_awaited()
+    assert data.temperature == 12.0
+    assert data.time == today
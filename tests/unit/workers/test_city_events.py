@@ -0,0 +1,66 @@
+"""CityAddedConsumer: stream entries -> deduped RefreshForecasts, ack after success."""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import fakeredis
+import pytest
+
+from workers.scheduler.city_events import CityAddedConsumer
+
+STREAM = "dresscast:cities:added"
+
+
+@pytest.fixture
+async def client():
+    r = fakeredis.FakeAsyncRedis(decode_responses=True)
+    yield r
+    await r.aclose()
+
+
+async def _consumer(client, weather) -> CityAddedConsumer:
+    clients = SimpleNamespace(get_weather_stub=AsyncMock(return_value=weather))
+    consumer = CityAddedConsumer(client, clients, STREAM, "scheduler", "worker-1", block_ms=10)
+    await consumer.ensure_group()
+    return consumer
+
+
+async def _add(client, lat: float, lon: float) -> None:
+    await client.xadd(STREAM, {"city_id": "1", "user_id": "1", "lat": repr(lat), "lon": repr(lon)})
+
+
+async def test_refreshes_unique_coordinates_and_acks(client):
+    weather = AsyncMock()
+    weather.RefreshForecasts.return_value = SimpleNamespace(refreshed_count=2)
+    consumer = await _consumer(client, weather)
+    await _add(client, 55.75, 37.62)
+    await _add(client, 55.75, 37.62)
+    await _add(client, 59.93, 30.31)
+
+    assert await consumer.poll_once() == 2
+    sent = weather.RefreshForecasts.await_args.args[0].coords
+    assert [(c.lat, c.lon) for c in sent] == [(55.75, 37.62), (59.93, 30.31)]
+    assert (await client.xpending(STREAM, "scheduler"))["pending"] == 0
+    assert await consumer.poll_once() == 0
+
+
+async def test_failed_refresh_is_retried_from_pending(client):
+    weather = AsyncMock()
+    weather.RefreshForecasts.side_effect = [
+        RuntimeError("weather down"),
+        SimpleNamespace(refreshed_count=1),
+    ]
+    consumer = await _consumer(client, weather)
+    await _add(client, 55.75, 37.62)
+
+    with pytest.raises(RuntimeError):
+        await consumer.poll_once()
+    assert (await client.xpending(STREAM, "scheduler"))["pending"] == 1
+
+    assert await consumer.poll_once() == 1
+    assert (await client.xpending(STREAM, "scheduler"))["pending"] == 0
+
+
+async def test_ensure_group_is_idempotent(client):
+    consumer = await _consumer(client, AsyncMock())
+    await consumer.ensure_group()
@@ -0,0 +1,56 @@
+"""RefreshForecastsJob: paged ListAllCoordinates and coordinate dedupe."""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+from prometheus_client import REGISTRY
+
+from workers.scheduler.job import RefreshForecastsJob
+
+
+def _refreshed(result: str) -> float:
+    labels = {"source": "scheduled", "result": result}
+    return REGISTRY.get_sample_value("dresscast_scheduler_coordinates_total", labels) or 0.0
+
+
+def _coord(city_id: int, lat: float, lon: float):
+    return SimpleNamespace(city_id=city_id, user_id=1, lat=lat, lon=lon)
+
+
+def _clients(users, weather):
+    return SimpleNamespace(
+        get_users_stub=AsyncMock(return_value=users),
+        get_weather_stub=AsyncMock(return_value=weather),
+    )
+
+
+async def test_pages_by_city_id_and_dedupes_coordinates():
+    users = AsyncMock()
+    users.ListAllCoordinates = AsyncMock(
+        side_effect=[
+            SimpleNamespace(
+                coords=[_coord(1, 55.75, 37.62), _coord(2, 59.93, 30.31)], next_after_id=2
+            ),
+            SimpleNamespace(coords=[_coord(3, 55.75, 37.62)], next_after_id=0),
+        ]
+    )
+    weather = AsyncMock()
+    weather.RefreshForecasts.return_value = SimpleNamespace(refreshed_count=1)
+    sent_before, refreshed_before = _refreshed("sent"), _refreshed("refreshed")
+    await RefreshForecastsJob(_clients(users, weather), page_size=2).run()
+
+    requests = [c.args[0] for c in users.ListAllCoordinates.await_args_list]
+    assert [(r.after_id, r.limit) for r in requests] == [(0, 2), (2, 2)]
+    sent = weather.RefreshForecasts.await_args.args[0].coords
+    assert [(c.lat, c.lon) for c in sent] == [(55.75, 37.62), (59.93, 30.31)]
+    assert _refreshed("sent") - sent_before == 2
+    assert _refreshed("refreshed") - refreshed_before == 1
+    assert REGISTRY.get_sample_value("dresscast_scheduler_tick_coordinates") == 2
+
+
+async def test_no_coordinates_skips_refresh():
+    users = AsyncMock()
+    users.ListAllCoordinates = AsyncMock(return_value=SimpleNamespace(coords=[], next_after_id=0))
+    weather = AsyncMock()
+    await RefreshForecastsJob(_clients(users, weather)).run()
+    weather.RefreshForecasts.assert_not_awaited()
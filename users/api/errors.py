@@ -15,6 +15,8 @@ def domain_error_to_grpc(exc: DomainError) -> tuple[grpc.StatusCode, str]:
         return grpc.StatusCode.ALREADY_EXISTS, msg
     if code == "INVALID_CREDENTIALS":
         return grpc.StatusCode.UNAUTHENTICATED, msg
+    if code == "SERVICE_OVERLOADED":
+        return grpc.StatusCode.RESOURCE_EXHAUSTED, msg
     if code == "VALIDATION_ERROR":
         return grpc.StatusCode.INVALID_ARGUMENT, msg
     return grpc.StatusCode.UNKNOWN, msg
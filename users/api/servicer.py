@@ -16,6 +16,7 @@ import users_pb2
 import users_pb2_grpc
 
 from users.api.errors import domain_error_to_grpc
+from users.domain.entities import CityImportRow
 from users.domain.exceptions import DomainError
 
 logger = logging.getLogger(__name__)
@@ -32,6 +33,9 @@ class UsersServicer(users_pb2_grpc.UsersServiceServicer):
         get_city,
         get_or_create_user_by_telegram_id,
         list_all_coordinates,
+        import_cities,
+        list_coordinates_page,
+        verify_credentials=None,
     ):
         self._create_user = create_user
         self._get_user_by_username = get_user_by_username
@@ -41,6 +45,9 @@ class UsersServicer(users_pb2_grpc.UsersServiceServicer):
         self._get_city = get_city
         self._get_or_create_user_by_telegram_id = get_or_create_user_by_telegram_id
         self._list_all_coordinates = list_all_coordinates
+        self._import_cities = import_cities
+        self._list_coordinates_page = list_coordinates_page
+        self._verify_credentials = verify_credentials
 
     @staticmethod
     def _user_to_proto(user):
@@ -107,6 +114,29 @@ class UsersServicer(users_pb2_grpc.UsersServiceServicer):
             context.set_details(str(e))
             return common_pb2.User()
 
+    async def VerifyCredentials(self, request, context):
+        logger.info("VerifyCredentials username=%s", request.username)
+        try:
+            user = await self._verify_credentials.run(
+                username=request.username, password=request.password
+            )
+            return self._user_to_proto(user)
+        except DomainError as e:
+            code, msg = domain_error_to_grpc(e)
+            logger.warning(
+                "VerifyCredentials DomainError username=%s code=%s",
+                request.username,
+                getattr(e, "code", e),
+            )
+            context.set_code(code)
+            context.set_details(msg)
+            return common_pb2.User()
+        except Exception as e:
+            logger.exception("VerifyCredentials failed username=%s: %s", request.username, e)
+            context.set_code(grpc.StatusCode.INTERNAL)
+            context.set_details(str(e))
+            return common_pb2.User()
+
     async def GetUserById(self, request, context):
         logger.info("GetUserById user_id=%s", request.user_id)
         try:
@@ -235,9 +265,20 @@ class UsersServicer(users_pb2_grpc.UsersServiceServicer):
             context.set_details(str(e))
             return common_pb2.User()
 
-    async def ListAllCoordinates(self, _request, context):
-        logger.info("ListAllCoordinates")
+    async def ListAllCoordinates(self, request, context):
+        logger.info("ListAllCoordinates after_id=%s limit=%s", request.after_id, request.limit)
         try:
+            if request.limit > 0:
+                page = await self._list_coordinates_page.run(
+                    after_id=request.after_id, limit=request.limit
+                )
+                return users_pb2.ListAllCoordinatesResponse(
+                    coords=[
+                        users_pb2.CoordWithUserId(city_id=cid, user_id=uid, lat=lat, lon=lon)
+                        for cid, uid, lat, lon in page
+                    ],
+                    next_after_id=page[-1][0] if len(page) == request.limit else 0,
+                )
             coords = await self._list_all_coordinates.run()
             return users_pb2.ListAllCoordinatesResponse(
                 coords=[
@@ -256,3 +297,39 @@ class UsersServicer(users_pb2_grpc.UsersServiceServicer):
             context.set_code(grpc.StatusCode.INTERNAL)
             context.set_details(str(e))
             return users_pb2.ListAllCoordinatesResponse()
+
+    async def ImportCities(self, request_iterator, context):
+        logger.info("ImportCities started")
+        try:
+            result = await self._import_cities.run(
+                CityImportRow(user_id=r.user_id, name=r.name, lat=r.lat, lon=r.lon)
+                async for r in request_iterator
+            )
+            logger.info(
+                "ImportCities done received=%s imported=%s errors=%s rows_per_second=%.0f",
+                result.received_count,
+                result.imported_count,
+                len(result.errors),
+                result.rows_per_second,
+            )
+            return users_pb2.ImportCitiesResponse(
+                received_count=result.received_count,
+                imported_count=result.imported_count,
+                errors=[
+                    users_pb2.ImportCityError(row_index=e.row_index, code=e.code, message=e.message)
+                    for e in result.errors
+                ],
+                elapsed_seconds=result.elapsed_seconds,
+                rows_per_second=result.rows_per_second,
+            )
+        except DomainError as e:
+            code, msg = domain_error_to_grpc(e)
+            logger.warning("ImportCities DomainError code=%s", getattr(e, "code", e))
+            context.set_code(code)
+            context.set_details(msg)
+            return users_pb2.ImportCitiesResponse()
+        except Exception as e:
+            logger.exception("ImportCities failed: %s", e)
+            context.set_code(grpc.StatusCode.INTERNAL)
+            context.set_details(str(e))
+            return users_pb2.ImportCitiesResponse()
@@ -1,24 +1,26 @@
-"""Cities use cases: ListCities, AddCity, GetCity, ListAllCoordinates."""
+"""Cities use cases: ListCities, AddCity, GetCity, ListAllCoordinates, ListCoordinatesPage."""
 
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from typing import Protocol
 
 from users.domain.entities import City
 from users.domain.exceptions import CityNotFoundError
 from users.infrastructure.db.repositories.city_repository import CityRepositoryImpl
-from users.infrastructure.db.session import get_session
+from users.infrastructure.db.session import SessionRouter, get_session
+
+
+class CityEventPublisher(Protocol):
+    async def city_added(self, city: City) -> None: ...
+
+    async def cities_added(self, cities: list[City]) -> None: ...
 
 
 class ListCitiesUseCase:
-    def __init__(
-        self,
-        city_repository: CityRepositoryImpl,
-        session_factory: async_sessionmaker[AsyncSession],
-    ):
+    def __init__(self, city_repository: CityRepositoryImpl, sessions: SessionRouter):
         self._city_repo = city_repository
-        self._session_factory = session_factory
+        self._sessions = sessions
 
     async def run(self, user_id: int) -> list[City]:
-        async with get_session(self._session_factory) as session:
+        async with get_session(self._sessions.reader(user_id)) as session:
             return await self._city_repo.list_by_user_id(session, user_id)
 
 
@@ -26,27 +28,29 @@ class AddCityUseCase:
     def __init__(
         self,
         city_repository: CityRepositoryImpl,
-        session_factory: async_sessionmaker[AsyncSession],
+        sessions: SessionRouter,
+        events: CityEventPublisher | None = None,
     ):
         self._city_repo = city_repository
-        self._session_factory = session_factory
+        self._sessions = sessions
+        self._events = events
 
     async def run(self, user_id: int, name: str, lat: float, lon: float) -> City:
-        async with get_session(self._session_factory) as session:
-            return await self._city_repo.add(session, user_id, name, lat, lon)
+        async with get_session(self._sessions.writer()) as session:
+            city = await self._city_repo.add(session, user_id, name, lat, lon)
+        self._sessions.mark_written(user_id)
+        if self._events:
+            await self._events.city_added(city)
+        return city
 
 
 class GetCityUseCase:
-    def __init__(
-        self,
-        city_repository: CityRepositoryImpl,
-        session_factory: async_sessionmaker[AsyncSession],
-    ):
+    def __init__(self, city_repository: CityRepositoryImpl, sessions: SessionRouter):
         self._city_repo = city_repository
-        self._session_factory = session_factory
+        self._sessions = sessions
 
     async def run(self, user_id: int, city_name: str) -> City:
-        async with get_session(self._session_factory) as session:
+        async with get_session(self._sessions.reader(user_id)) as session:
             city = await self._city_repo.get_by_user_and_name(session, user_id, city_name)
             if city is None:
                 raise CityNotFoundError(f"City {city_name} not found")
@@ -54,14 +58,20 @@ class GetCityUseCase:
 
 
 class ListAllCoordinatesUseCase:
-    def __init__(
-        self,
-        city_repository: CityRepositoryImpl,
-        session_factory: async_sessionmaker[AsyncSession],
-    ):
+    def __init__(self, city_repository: CityRepositoryImpl, sessions: SessionRouter):
         self._city_repo = city_repository
-        self._session_factory = session_factory
+        self._sessions = sessions
 
     async def run(self) -> list[tuple[int, float, float]]:
-        async with get_session(self._session_factory) as session:
+        async with get_session(self._sessions.reader()) as session:
             return await self._city_repo.list_all_coordinates(session)
+
+
+class ListCoordinatesPageUseCase:
+    def __init__(self, city_repository: CityRepositoryImpl, sessions: SessionRouter):
+        self._city_repo = city_repository
+        self._sessions = sessions
+
+    async def run(self, after_id: int, limit: int) -> list[tuple[int, int, float, float]]:
+        async with get_session(self._sessions.reader()) as session:
+            return await self._city_repo.list_coordinates_after(session, after_id, limit)
@@ -1,20 +1,14 @@
 """CreateUser use case."""
 
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
-
 from users.domain.entities import User
 from users.infrastructure.db.repositories.user_repository import UserRepositoryImpl
-from users.infrastructure.db.session import get_session
+from users.infrastructure.db.session import SessionRouter, get_session
 
 
 class CreateUserUseCase:
-    def __init__(
-        self,
-        user_repository: UserRepositoryImpl,
-        session_factory: async_sessionmaker[AsyncSession],
-    ):
+    def __init__(self, user_repository: UserRepositoryImpl, sessions: SessionRouter):
         self._user_repo = user_repository
-        self._session_factory = session_factory
+        self._sessions = sessions
 
     async def run(
         self,
@@ -24,7 +18,10 @@ class CreateUserUseCase:
         is_admin: bool = False,
         locale: str = "en",
     ) -> User:
-        async with get_session(self._session_factory) as session:
-            return await self._user_repo.create(
+        async with get_session(self._sessions.writer()) as session:
+            user = await self._user_repo.create(
                 session, username, password_hash, telegram_id, is_admin, locale
             )
+        # GetUserById (e.g. /me right after register) must not miss on a lagging replica
+        self._sessions.mark_written(user.id)
+        return user
@@ -1,24 +1,18 @@
 """GetUserById use case."""
 
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
-
 from users.domain.entities import User
 from users.domain.exceptions import UserNotFoundError
 from users.infrastructure.db.repositories.user_repository import UserRepositoryImpl
-from users.infrastructure.db.session import get_session
+from users.infrastructure.db.session import SessionRouter, get_session
 
 
 class GetUserByIdUseCase:
-    def __init__(
-        self,
-        user_repository: UserRepositoryImpl,
-        session_factory: async_sessionmaker[AsyncSession],
-    ):
+    def __init__(self, user_repository: UserRepositoryImpl, sessions: SessionRouter):
         self._user_repo = user_repository
-        self._session_factory = session_factory
+        self._sessions = sessions
 
     async def run(self, user_id: int) -> User:
-        async with get_session(self._session_factory) as session:
+        async with get_session(self._sessions.reader(user_id)) as session:
             user = await self._user_repo.get_by_id(session, user_id)
             if user is None:
                 raise UserNotFoundError(f"User id {user_id} not found")
@@ -1,24 +1,21 @@
 """GetUserByUsername use case."""
 
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
-
 from users.domain.entities import User
 from users.domain.exceptions import UserNotFoundError
 from users.infrastructure.db.repositories.user_repository import UserRepositoryImpl
-from users.infrastructure.db.session import get_session
+from users.infrastructure.db.session import SessionRouter, get_session
 
 
 class GetUserByUsernameUseCase:
-    def __init__(
-        self,
-        user_repository: UserRepositoryImpl,
-        session_factory: async_sessionmaker[AsyncSession],
-    ):
+    """Always reads the writer: it is on the login path right after register, where a
+    lagging replica would report a just-created user as missing."""
+
+    def __init__(self, user_repository: UserRepositoryImpl, sessions: SessionRouter):
         self._user_repo = user_repository
-        self._session_factory = session_factory
+        self._sessions = sessions
 
     async def run(self, username: str) -> User:
-        async with get_session(self._session_factory) as session:
+        async with get_session(self._sessions.writer()) as session:
             user = await self._user_repo.get_by_username(session, username)
             if user is None:
                 raise UserNotFoundError(f"User {username} not found")
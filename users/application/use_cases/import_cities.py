@@ -0,0 +1,105 @@
+"""ImportCities use case: bulk insert of (user, city, lat, lon) rows in batches."""
+
+import time
+from collections.abc import AsyncIterable
+
+from shared.error_codes import CITY_ALREADY_EXISTS, USER_NOT_FOUND, VALIDATION_ERROR
+from users.application.use_cases.cities import CityEventPublisher
+from users.domain.entities import CityImportError, CityImportResult, CityImportRow
+from users.infrastructure.db.repositories.city_repository import CityRepositoryImpl
+from users.infrastructure.db.repositories.user_repository import UserRepositoryImpl
+from users.infrastructure.db.session import SessionRouter, get_session
+
+_MAX_NAME_LENGTH = 255
+
+
+def _validate(row: CityImportRow) -> str | None:
+    if not row.name.strip():
+        return "City name is empty"
+    if len(row.name) > _MAX_NAME_LENGTH:
+        return f"City name longer than {_MAX_NAME_LENGTH} characters"
+    if not -90.0 <= row.lat <= 90.0:
+        return f"Latitude {row.lat} out of range"
+    if not -180.0 <= row.lon <= 180.0:
+        return f"Longitude {row.lon} out of range"
+    return None
+
+
+class ImportCitiesUseCase:
+    """Each batch of `batch_size` valid rows is one INSERT and one transaction.
+
+    Rows that fail are reported by their 0-based position in the stream; they never
+    abort the batch they belong to. Cities inserted by a committed batch are published as
+    city-added events, like AddCity, so the scheduler pre-warms them right away.
+    """
+
+    def __init__(
+        self,
+        city_repository: CityRepositoryImpl,
+        user_repository: UserRepositoryImpl,
+        sessions: SessionRouter,
+        batch_size: int = 1000,
+        events: CityEventPublisher | None = None,
+    ):
+        self._city_repo = city_repository
+        self._user_repo = user_repository
+        self._sessions = sessions
+        self._batch_size = max(1, batch_size)
+        self._events = events
+
+    async def run(self, rows: AsyncIterable[CityImportRow]) -> CityImportResult:
+        started = time.perf_counter()
+        result = CityImportResult()
+        batch: list[tuple[int, CityImportRow]] = []
+        async for row in rows:
+            index = result.received_count
+            result.received_count += 1
+            error = _validate(row)
+            if error:
+                result.errors.append(CityImportError(index, VALIDATION_ERROR, error))
+                continue
+            batch.append((index, row))
+            if len(batch) >= self._batch_size:
+                await self._import_batch(batch, result)
+                batch = []
+        if batch:
+            await self._import_batch(batch, result)
+        result.errors.sort(key=lambda e: e.row_index)
+        result.elapsed_seconds = time.perf_counter() - started
+        return result
+
+    async def _import_batch(
+        self, batch: list[tuple[int, CityImportRow]], result: CityImportResult
+    ) -> None:
+        pending: list[tuple[int, CityImportRow]] = []
+        seen: set[tuple[int, str]] = set()
+        async with get_session(self._sessions.writer()) as session:
+            known_users = await self._user_repo.existing_ids(
+                session, {row.user_id for _, row in batch}
+            )
+            for index, row in batch:
+                key = (row.user_id, row.name)
+                if row.user_id not in known_users:
+                    result.errors.append(
+                        CityImportError(index, USER_NOT_FOUND, f"User id {row.user_id} not found")
+                    )
+                elif key in seen:
+                    result.errors.append(
+                        CityImportError(index, CITY_ALREADY_EXISTS, f"Duplicate row for {row.name}")
+                    )
+                else:
+                    seen.add(key)
+                    pending.append((index, row))
+            inserted = await self._city_repo.add_many(session, [row for _, row in pending])
+        for index, row in pending:
+            if (row.user_id, row.name) in inserted:
+                result.imported_count += 1
+                self._sessions.mark_written(row.user_id)
+            else:
+                result.errors.append(
+                    CityImportError(
+                        index, CITY_ALREADY_EXISTS, f"City {row.name} already exists for user"
+                    )
+                )
+        if self._events and inserted:
+            await self._events.cities_added(list(inserted.values()))
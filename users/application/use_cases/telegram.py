@@ -1,31 +1,23 @@
 """GetOrCreateUserByTelegramId use case."""
 
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
-
 from users.domain.entities import User
 from users.infrastructure.db.repositories.user_repository import UserRepositoryImpl
-from users.infrastructure.db.session import get_session
+from users.infrastructure.db.session import SessionRouter, get_session
 
 
 class GetOrCreateUserByTelegramIdUseCase:
-    def __init__(
-        self,
-        user_repository: UserRepositoryImpl,
-        session_factory: async_sessionmaker[AsyncSession],
-    ):
+    def __init__(self, user_repository: UserRepositoryImpl, sessions: SessionRouter):
         self._user_repo = user_repository
-        self._session_factory = session_factory
+        self._sessions = sessions
 
     async def run(self, telegram_id: str, username: str | None = None, locale: str = "en") -> User:
-        async with get_session(self._session_factory) as session:
-            user = await self._user_repo.get_by_telegram_id(session, telegram_id)
-            if user is not None:
-                return user
-            name = username or f"tg_{telegram_id}"
-            return await self._user_repo.create(
+        async with get_session(self._sessions.writer()) as session:
+            user = await self._user_repo.get_or_create_by_telegram_id(
                 session,
-                username=name,
-                password_hash="",
                 telegram_id=telegram_id,
-                locale=locale,  # nosec B106 - Telegram users have no password
+                username=username or f"tg_{telegram_id}",
+                locale=locale,
             )
+        # The bot's next GetUserById / ListCities for a new user must not hit a lagging replica
+        self._sessions.mark_written(user.id)
+        return user
@@ -0,0 +1,46 @@
+"""VerifyCredentials use case: username + password -> User, bcrypt off the event loop."""
+
+from typing import Protocol
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from shared.password_hashing import HashingOverloadedError
+from users.domain.entities import User
+from users.domain.exceptions import InvalidCredentialsError, ServiceOverloadedError
+from users.infrastructure.db.repositories.user_repository import UserRepositoryImpl
+from users.infrastructure.db.session import get_session
+
+
+class PasswordVerifier(Protocol):
+    async def verify(self, password: str, password_hash: str) -> bool: ...
+
+
+class VerifyCredentialsUseCase:
+    """Unknown users are checked against `dummy_hash` (when given) so that response time
+    does not reveal which usernames exist."""
+
+    def __init__(
+        self,
+        user_repository: UserRepositoryImpl,
+        session_factory: async_sessionmaker[AsyncSession],
+        verifier: PasswordVerifier,
+        dummy_hash: str | None = None,
+    ):
+        self._user_repo = user_repository
+        self._session_factory = session_factory
+        self._verifier = verifier
+        self._dummy_hash = dummy_hash
+
+    async def run(self, username: str, password: str) -> User:
+        async with get_session(self._session_factory) as session:
+            user = await self._user_repo.get_by_username(session, username)
+        try:
+            if user is None or not user.password_hash:
+                if self._dummy_hash:
+                    await self._verifier.verify(password, self._dummy_hash)
+                raise InvalidCredentialsError()
+            if not await self._verifier.verify(password, user.password_hash):
+                raise InvalidCredentialsError()
+        except HashingOverloadedError as e:
+            raise ServiceOverloadedError() from e
+        return user
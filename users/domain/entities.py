@@ -1,6 +1,6 @@
 """Domain entities (optional separate from ORM)."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 
 @dataclass
@@ -20,3 +20,32 @@ class City:
     name: str
     lat: float
     lon: float
+
+
+@dataclass
+class CityImportRow:
+    user_id: int
+    name: str
+    lat: float
+    lon: float
+
+
+@dataclass
+class CityImportError:
+    row_index: int
+    code: str
+    message: str
+
+
+@dataclass
+class CityImportResult:
+    received_count: int = 0
+    imported_count: int = 0
+    errors: list[CityImportError] = field(default_factory=list)
+    elapsed_seconds: float = 0.0
+
+    @property
+    def rows_per_second(self) -> float:
+        if self.elapsed_seconds <= 0:
+            return 0.0
+        return self.received_count / self.elapsed_seconds
@@ -4,6 +4,7 @@ from shared.error_codes import (
     CITY_ALREADY_EXISTS,
     CITY_NOT_FOUND,
     INVALID_CREDENTIALS,
+    SERVICE_OVERLOADED,
     USER_ALREADY_EXISTS,
     USER_NOT_FOUND,
 )
@@ -39,3 +40,8 @@ class CityAlreadyExistsError(DomainError):
 class InvalidCredentialsError(DomainError):
     def __init__(self, message: str = "Invalid credentials"):
         super().__init__(INVALID_CREDENTIALS, message)
+
+
+class ServiceOverloadedError(DomainError):
+    def __init__(self, message: str = "Too many requests, retry later"):
+        super().__init__(SERVICE_OVERLOADED, message)
@@ -0,0 +1,86 @@
+"""Schema migrations for the users DB.
+
+`Base.metadata.create_all` only creates missing tables; it never changes tables that
+already exist. Changes to existing tables (new indexes, columns) are listed here as
+ordered, idempotent steps. Applied versions are recorded in `schema_migrations`, so each
+step runs once per database.
+"""
+
+import logging
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime, timezone
+
+from sqlalchemy import Column, DateTime, Integer, MetaData, String, Table, select, text
+from sqlalchemy.engine import Connection
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from users.infrastructure.db.models import CityModel
+
+logger = logging.getLogger(__name__)
+
+# Arbitrary key for pg_advisory_xact_lock so concurrent replicas migrate one at a time
+_PG_LOCK_KEY = 5_300_053
+
+schema_migrations = Table(
+    "schema_migrations",
+    MetaData(),
+    Column("version", Integer, primary_key=True),
+    Column("description", String(255), nullable=False),
+    Column("applied_at", DateTime(timezone=True), nullable=False),
+)
+
+
+@dataclass(frozen=True)
+class Migration:
+    version: int
+    description: str
+    upgrade: Callable[[Connection], None]
+
+
+def _create_model_indexes(table, *names: str) -> Callable[[Connection], None]:
+    def upgrade(conn: Connection) -> None:
+        for index in table.indexes:
+            if index.name in names:
+                index.create(conn, checkfirst=True)
+
+    return upgrade
+
+
+MIGRATIONS: list[Migration] = [
+    Migration(
+        1,
+        "cities: covering (lat, lon, user_id) index and id-ordered coordinates index",
+        _create_model_indexes(
+            CityModel.__table__, "ix_cities_lat_lon_user_id", "ix_cities_id_coords"
+        ),
+    ),
+]
+
+
+def apply_migrations(conn: Connection) -> list[int]:
+    """Apply pending migrations in version order; return the versions applied."""
+    if conn.dialect.name == "postgresql":
+        conn.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": _PG_LOCK_KEY})
+    schema_migrations.create(conn, checkfirst=True)
+    done = set(conn.execute(select(schema_migrations.c.version)).scalars())
+    applied = []
+    for migration in sorted(MIGRATIONS, key=lambda m: m.version):
+        if migration.version in done:
+            continue
+        logger.info("Applying migration %s: %s", migration.version, migration.description)
+        migration.upgrade(conn)
+        conn.execute(
+            schema_migrations.insert().values(
+                version=migration.version,
+                description=migration.description,
+                applied_at=datetime.now(timezone.utc),
+            )
+        )
+        applied.append(migration.version)
+    return applied
+
+
+async def migrate(engine: AsyncEngine) -> list[int]:
+    async with engine.begin() as conn:
+        return await conn.run_sync(apply_migrations)
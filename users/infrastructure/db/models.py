@@ -1,6 +1,6 @@
 """SQLAlchemy ORM models."""
 
-from sqlalchemy import Boolean, Float, ForeignKey, Integer, String, UniqueConstraint
+from sqlalchemy import Boolean, Float, ForeignKey, Index, Integer, String, UniqueConstraint
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 
 
@@ -30,6 +30,16 @@ class CityModel(Base):
     lat: Mapped[float] = mapped_column(Float, nullable=False)
     lon: Mapped[float] = mapped_column(Float, nullable=False)
 
-    __table_args__ = (UniqueConstraint("user_id", "name", name="uq_user_city"),)
+    __table_args__ = (
+        UniqueConstraint("user_id", "name", name="uq_user_city"),
+        # Covers ListAllCoordinates (user_id, lat, lon) as an index-only scan; also serves
+        # coordinate dedupe since equal (lat, lon) pairs are adjacent.
+        Index("ix_cities_lat_lon_user_id", "lat", "lon", "user_id"),
+        # Keyset pagination by id as an index-only scan. SQLite already stores rows in
+        # rowid (= id) order, so the index is PostgreSQL-only.
+        Index("ix_cities_id_coords", "id", postgresql_include=["user_id", "lat", "lon"]).ddl_if(
+            dialect="postgresql"
+        ),
+    )
 
     user: Mapped["UserModel"] = relationship("UserModel", back_populates="cities")
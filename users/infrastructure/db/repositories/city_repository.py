@@ -3,9 +3,10 @@
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
-from users.domain.entities import City
+from users.domain.entities import City, CityImportRow
 from users.domain.exceptions import CityAlreadyExistsError
 from users.infrastructure.db.models import CityModel
+from users.infrastructure.db.upsert import upsert_insert
 
 
 class CityRepositoryImpl:
@@ -28,6 +29,47 @@ class CityRepositoryImpl:
             id=model.id, user_id=model.user_id, name=model.name, lat=model.lat, lon=model.lon
         )
 
+    async def add_many(
+        self, session: AsyncSession, rows: list[CityImportRow]
+    ) -> dict[tuple[int, str], City]:
+        """Insert rows in one multi-row statement, skipping (user_id, name) pairs that exist.
+
+        Returns the cities actually inserted, keyed by (user_id, name).
+        """
+        if not rows:
+            return {}
+        insert = upsert_insert(session)
+        if insert is None:
+            models = []
+            for row in rows:
+                if await self.get_by_user_and_name(session, row.user_id, row.name) is None:
+                    models.append(
+                        CityModel(user_id=row.user_id, name=row.name, lat=row.lat, lon=row.lon)
+                    )
+            session.add_all(models)
+            await session.flush()
+            return {
+                (m.user_id, m.name): City(
+                    id=m.id, user_id=m.user_id, name=m.name, lat=m.lat, lon=m.lon
+                )
+                for m in models
+            }
+        stmt = (
+            insert(CityModel)
+            .values(
+                [{"user_id": r.user_id, "name": r.name, "lat": r.lat, "lon": r.lon} for r in rows]
+            )
+            .on_conflict_do_nothing(index_elements=[CityModel.user_id, CityModel.name])
+            .returning(
+                CityModel.id, CityModel.user_id, CityModel.name, CityModel.lat, CityModel.lon
+            )
+        )
+        result = await session.execute(stmt)
+        return {
+            (user_id, name): City(id=city_id, user_id=user_id, name=name, lat=lat, lon=lon)
+            for city_id, user_id, name, lat, lon in result.all()
+        }
+
     async def list_by_user_id(self, session: AsyncSession, user_id: int) -> list[City]:
         result = await session.execute(select(CityModel).where(CityModel.user_id == user_id))
         return [
@@ -51,3 +93,15 @@ class CityRepositoryImpl:
     async def list_all_coordinates(self, session: AsyncSession) -> list[tuple[int, float, float]]:
         result = await session.execute(select(CityModel.user_id, CityModel.lat, CityModel.lon))
         return list(result.all())
+
+    async def list_coordinates_after(
+        self, session: AsyncSession, after_id: int, limit: int
+    ) -> list[tuple[int, int, float, float]]:
+        """Keyset page of (city_id, user_id, lat, lon) with city_id > after_id, in id order."""
+        result = await session.execute(
+            select(CityModel.id, CityModel.user_id, CityModel.lat, CityModel.lon)
+            .where(CityModel.id > after_id)
+            .order_by(CityModel.id)
+            .limit(limit)
+        )
+        return list(result.all())
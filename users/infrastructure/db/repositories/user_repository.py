@@ -1,11 +1,13 @@
 """User repository implementation."""
 
 from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from users.domain.entities import User
 from users.domain.exceptions import UserAlreadyExistsError
 from users.infrastructure.db.models import UserModel
+from users.infrastructure.db.upsert import upsert_insert
 
 
 class UserRepositoryImpl:
@@ -71,6 +73,12 @@ class UserRepositoryImpl:
             locale=model.locale,
         )
 
+    async def existing_ids(self, session: AsyncSession, user_ids: set[int]) -> set[int]:
+        if not user_ids:
+            return set()
+        result = await session.execute(select(UserModel.id).where(UserModel.id.in_(user_ids)))
+        return set(result.scalars().all())
+
     async def get_by_telegram_id(self, session: AsyncSession, telegram_id: str) -> User | None:
         result = await session.execute(
             select(UserModel).where(UserModel.telegram_id == telegram_id)
@@ -86,3 +94,56 @@ class UserRepositoryImpl:
             is_admin=model.is_admin,
             locale=model.locale,
         )
+
+    async def get_or_create_by_telegram_id(
+        self,
+        session: AsyncSession,
+        telegram_id: str,
+        username: str,
+        locale: str = "en",
+    ) -> User:
+        """Upsert keyed by telegram_id: one round trip, no race between lookup and insert."""
+        insert = upsert_insert(session)
+        if insert is None:
+            user = await self.get_by_telegram_id(session, telegram_id)
+            if user is not None:
+                return user
+            return await self.create(
+                session,
+                username=username,
+                password_hash="",  # nosec B106 - Telegram users have no password
+                telegram_id=telegram_id,
+                locale=locale,
+            )
+        stmt = insert(UserModel).values(
+            username=username,
+            password_hash="",  # nosec B106 - Telegram users have no password
+            telegram_id=telegram_id,
+            is_admin=False,
+            locale=locale,
+        )
+        # No-op update on conflict so RETURNING yields the existing row as well
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[UserModel.telegram_id],
+            set_={"telegram_id": stmt.excluded.telegram_id},
+        ).returning(
+            UserModel.id,
+            UserModel.username,
+            UserModel.password_hash,
+            UserModel.telegram_id,
+            UserModel.is_admin,
+            UserModel.locale,
+        )
+        try:
+            row = (await session.execute(stmt)).one()
+        except IntegrityError as e:
+            # telegram_id is new but the username is taken by another account
+            raise UserAlreadyExistsError(f"Username {username} already exists") from e
+        return User(
+            id=row.id,
+            username=row.username,
+            password_hash=row.password_hash,
+            telegram_id=row.telegram_id,
+            is_admin=row.is_admin,
+            locale=row.locale,
+        )
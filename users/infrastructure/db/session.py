@@ -1,21 +1,89 @@
-"""Database session factory."""
+"""Database session factory and primary/replica routing."""
 
+import itertools
+import time
+from collections.abc import Hashable
 from contextlib import asynccontextmanager
 
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
 from users.config.settings import Settings
+from users.infrastructure.db.migrations import migrate
 from users.infrastructure.db.models import Base
 
 
-def get_session_factory(settings: Settings) -> async_sessionmaker[AsyncSession]:
+def _session_factory(database_url: str) -> async_sessionmaker[AsyncSession]:
     engine = create_async_engine(
-        settings.database_url,
+        database_url,
         echo=False,
     )
     return async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
 
 
+def get_session_factory(settings: Settings) -> async_sessionmaker[AsyncSession]:
+    return _session_factory(settings.database_url)
+
+
+class SessionRouter:
+    """Chooses the session factory for a use case: primary for writes, replicas for reads.
+
+    Reads are spread round-robin over the replicas. A key (user id) written through
+    `mark_written` reads from the primary for `sticky_seconds` afterwards, so a user sees
+    their own writes despite replication lag. Stickiness is per process.
+    """
+
+    _PRUNE_THRESHOLD = 10_000
+
+    def __init__(
+        self,
+        primary: async_sessionmaker[AsyncSession],
+        replicas: list[async_sessionmaker[AsyncSession]] | None = None,
+        sticky_seconds: float = 5.0,
+    ):
+        self._primary = primary
+        self._replicas = list(replicas or [])
+        self._replica_cycle = itertools.cycle(self._replicas)
+        self._sticky_seconds = sticky_seconds
+        self._sticky_until: dict[Hashable, float] = {}
+
+    @property
+    def primary(self) -> async_sessionmaker[AsyncSession]:
+        return self._primary
+
+    def writer(self) -> async_sessionmaker[AsyncSession]:
+        return self._primary
+
+    def reader(self, key: Hashable | None = None) -> async_sessionmaker[AsyncSession]:
+        if not self._replicas:
+            return self._primary
+        if key is not None:
+            until = self._sticky_until.get(key)
+            if until is not None:
+                if until > time.monotonic():
+                    return self._primary
+                del self._sticky_until[key]
+        return next(self._replica_cycle)
+
+    def mark_written(self, key: Hashable) -> None:
+        """Pin reads for `key` to the primary; call after the write has committed."""
+        if not self._replicas or self._sticky_seconds <= 0:
+            return
+        now = time.monotonic()
+        if len(self._sticky_until) >= self._PRUNE_THRESHOLD:
+            self._sticky_until = {k: t for k, t in self._sticky_until.items() if t > now}
+        self._sticky_until[key] = now + self._sticky_seconds
+
+
+def get_session_router(
+    settings: Settings, primary: async_sessionmaker[AsyncSession] | None = None
+) -> SessionRouter:
+    return SessionRouter(
+        primary or get_session_factory(settings),
+        [_session_factory(url) for url in settings.read_replica_urls],
+        sticky_seconds=settings.read_your_writes_seconds,
+    )
+
+
 @asynccontextmanager
 async def get_session(session_factory: async_sessionmaker[AsyncSession]):
     async with session_factory() as session:
@@ -31,4 +99,5 @@ async def init_db(settings: Settings) -> None:
     engine = create_async_engine(settings.database_url)
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+    await migrate(engine)
     await engine.dispose()
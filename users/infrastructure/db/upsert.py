@@ -0,0 +1,17 @@
+"""Dialect-specific INSERT constructs for ON CONFLICT upserts."""
+
+from collections.abc import Callable
+
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+
+# Dialects that support INSERT ... ON CONFLICT ... RETURNING
+_UPSERT_INSERTS: dict[str, Callable] = {
+    "postgresql": postgresql.insert,
+    "sqlite": sqlite.insert,
+}
+
+
+def upsert_insert(session: AsyncSession) -> Callable | None:
+    """Return the dialect's `insert` supporting on_conflict_*, or None if unsupported."""
+    return _UPSERT_INSERTS.get(session.get_bind().dialect.name)
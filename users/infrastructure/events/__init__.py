@@ -0,0 +1 @@
+# City change events
@@ -0,0 +1,55 @@
+"""Redis stream publisher for city-added events (CityEventPublisher)."""
+
+import logging
+
+import redis.asyncio as redis
+
+from users.domain.entities import City
+
+logger = logging.getLogger(__name__)
+
+
+def _fields(city: City) -> dict[str, str]:
+    return {
+        "city_id": str(city.id),
+        "user_id": str(city.user_id),
+        "lat": repr(city.lat),
+        "lon": repr(city.lon),
+    }
+
+
+class RedisCityEventPublisher:
+    """XADD one entry per added city (AddCity or ImportCities); consumers pre-warm weather for its coordinates.
+
+    Best-effort: a Redis failure is logged and never fails AddCity or an import, since the scheduler's
+    periodic full refresh still picks the city up.
+    """
+
+    def __init__(self, redis_url: str, stream: str, maxlen: int = 100_000):
+        self._url = redis_url
+        self._stream = stream
+        self._maxlen = maxlen
+        self._client: redis.Redis | None = None
+
+    async def _get_client(self) -> redis.Redis:
+        if self._client is None:
+            self._client = redis.from_url(self._url, decode_responses=True)
+        return self._client
+
+    async def city_added(self, city: City) -> None:
+        await self.cities_added([city])
+
+    async def cities_added(self, cities: list[City]) -> None:
+        """One XADD per city, sent in a single pipeline (bulk import batches)."""
+        if not cities:
+            return
+        try:
+            client = await self._get_client()
+            async with client.pipeline(transaction=False) as pipe:
+                for city in cities:
+                    pipe.xadd(self._stream, _fields(city), maxlen=self._maxlen, approximate=True)
+                await pipe.execute()
+        except Exception as e:
+            logger.warning(
+                "City event publish failed city_ids=%s: %s", [c.id for c in cities][:10], e
+            )
@@ -2,6 +2,7 @@
 
 import asyncio
 import logging
+import secrets
 import sys
 from pathlib import Path
 
@@ -11,41 +12,43 @@ if str(ROOT) not in sys.path:
 if str(ROOT / "proto_gen") not in sys.path:
     sys.path.insert(0, str(ROOT / "proto_gen"))
 
-import bcrypt
 import users_pb2_grpc
-from grpc import aio
 
+from shared.grpc_server import create_server, serve_until_signal
+from shared.logging_setup import setup_logging
+from shared.metrics import start_metrics_server
+from shared.password_hashing import PasswordHasher, hash_password
+from shared.tracing import setup_tracing
 from users.api.servicer import UsersServicer
 from users.application.use_cases.cities import (
     AddCityUseCase,
     GetCityUseCase,
     ListAllCoordinatesUseCase,
     ListCitiesUseCase,
+    ListCoordinatesPageUseCase,
 )
 from users.application.use_cases.create_user import CreateUserUseCase
 from users.application.use_cases.get_user_by_id import GetUserByIdUseCase
 from users.application.use_cases.get_user_by_username import GetUserByUsernameUseCase
+from users.application.use_cases.import_cities import ImportCitiesUseCase
 from users.application.use_cases.telegram import GetOrCreateUserByTelegramIdUseCase
+from users.application.use_cases.verify_credentials import VerifyCredentialsUseCase
 from users.config.settings import Settings
 from users.infrastructure.db.repositories.city_repository import CityRepositoryImpl
 from users.infrastructure.db.repositories.user_repository import UserRepositoryImpl
-from users.infrastructure.db.session import get_session_factory, init_db
+from users.infrastructure.db.session import get_session_factory, get_session_router, init_db
+from users.infrastructure.events.redis_stream import RedisCityEventPublisher
 
 logger = logging.getLogger(__name__)
 
 
-def _hash_password(password: str) -> str:
-    raw = password.encode("utf-8")[:72]
-    return bcrypt.hashpw(raw, bcrypt.gensalt()).decode("utf-8")
-
-
 async def _create_admin_if_configured(settings: Settings, create_user: CreateUserUseCase) -> None:
     if not settings.create_admin_username:
         return
     try:
         await create_user.run(
             username=settings.create_admin_username,
-            password_hash=_hash_password("admin"),
+            password_hash=hash_password("admin", settings.bcrypt_rounds),
             is_admin=True,
         )
         logger.info("Admin user '%s' created.", settings.create_admin_username)
@@ -58,23 +61,44 @@ async def _create_admin_if_configured(settings: Settings, create_user: CreateUse
 
 def main() -> None:
     settings = Settings()
-    logging.basicConfig(
-        level=getattr(logging, settings.log_level.upper(), logging.INFO),
-        format="%(asctime)s %(levelname)s [%(name)s] %(message)s",
-    )
+    setup_logging(settings.log_level, "users")
+    setup_tracing("users")
     session_factory = get_session_factory(settings)
+    sessions = get_session_router(settings, primary=session_factory)
 
     user_repo = UserRepositoryImpl(session_factory)
     city_repo = CityRepositoryImpl(session_factory)
 
-    create_user_uc = CreateUserUseCase(user_repo, session_factory)
-    get_user_by_username_uc = GetUserByUsernameUseCase(user_repo, session_factory)
-    get_user_by_id_uc = GetUserByIdUseCase(user_repo, session_factory)
-    list_cities_uc = ListCitiesUseCase(city_repo, session_factory)
-    add_city_uc = AddCityUseCase(city_repo, session_factory)
-    get_city_uc = GetCityUseCase(city_repo, session_factory)
-    get_or_create_telegram_uc = GetOrCreateUserByTelegramIdUseCase(user_repo, session_factory)
-    list_all_coords_uc = ListAllCoordinatesUseCase(city_repo, session_factory)
+    create_user_uc = CreateUserUseCase(user_repo, sessions)
+    get_user_by_username_uc = GetUserByUsernameUseCase(user_repo, sessions)
+    get_user_by_id_uc = GetUserByIdUseCase(user_repo, sessions)
+    hasher = PasswordHasher(
+        settings.bcrypt_rounds,
+        settings.password_verify_workers,
+        max_pending=settings.password_verify_max_pending,
+    )
+    verify_credentials_uc = VerifyCredentialsUseCase(
+        user_repo,
+        session_factory,
+        hasher,
+        dummy_hash=hash_password(secrets.token_urlsafe(16), settings.bcrypt_rounds),
+    )
+    list_cities_uc = ListCitiesUseCase(city_repo, sessions)
+    city_events = None
+    if settings.city_events_redis_url:
+        city_events = RedisCityEventPublisher(
+            settings.city_events_redis_url,
+            settings.city_events_stream,
+            settings.city_events_maxlen,
+        )
+    add_city_uc = AddCityUseCase(city_repo, sessions, city_events)
+    get_city_uc = GetCityUseCase(city_repo, sessions)
+    get_or_create_telegram_uc = GetOrCreateUserByTelegramIdUseCase(user_repo, sessions)
+    list_all_coords_uc = ListAllCoordinatesUseCase(city_repo, sessions)
+    list_coords_page_uc = ListCoordinatesPageUseCase(city_repo, sessions)
+    import_cities_uc = ImportCitiesUseCase(
+        city_repo, user_repo, sessions, batch_size=settings.import_batch_size, events=city_events
+    )
 
     servicer = UsersServicer(
         create_user=create_user_uc,
@@ -85,17 +109,21 @@ def main() -> None:
         get_city=get_city_uc,
         get_or_create_user_by_telegram_id=get_or_create_telegram_uc,
         list_all_coordinates=list_all_coords_uc,
+        import_cities=import_cities_uc,
+        list_coordinates_page=list_coords_page_uc,
+        verify_credentials=verify_credentials_uc,
     )
+    start_metrics_server(settings.metrics_port, "Users")
 
     async def serve() -> None:
         await init_db(settings)
         await _create_admin_if_configured(settings, create_user_uc)
-        server = aio.server()
+        server = create_server(settings)
         users_pb2_grpc.add_UsersServiceServicer_to_server(servicer, server)
         server.add_insecure_port(f"{settings.grpc_host}:{settings.grpc_port}")
         await server.start()
         logger.info("Users gRPC server listening on %s:%s", settings.grpc_host, settings.grpc_port)
-        await server.wait_for_termination()
+        await serve_until_signal(server, settings.grpc_server_shutdown_grace_seconds)
 
     asyncio.run(serve())
 
@@ -1,6 +1,7 @@
 """GetCurrentWeather and GetForecast use cases (cache-aside + WeatherProvider)."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
+from datetime import date as date_type
 from typing import Protocol
 
 
@@ -25,13 +26,21 @@ class ForecastCache(Protocol):
     async def set(self, key: str, data: WeatherData, ttl_seconds: int = 3600) -> None: ...
 
 
+def current_key(lat: float, lon: float) -> str:
+    return f"current:{lat:.4f}:{lon:.4f}"
+
+
+def forecast_key(lat: float, lon: float, date: str = "", time: str = "") -> str:
+    return f"forecast:{lat:.4f}:{lon:.4f}:{date}:{time}"
+
+
 class GetCurrentWeatherUseCase:
     def __init__(self, provider: WeatherProvider, cache: ForecastCache | None = None):
         self._provider = provider
         self._cache = cache
 
     async def run(self, lat: float, lon: float) -> WeatherData:
-        key = f"current:{lat:.4f}:{lon:.4f}"
+        key = current_key(lat, lon)
         if self._cache:
             cached = await self._cache.get(key)
             if cached is not None:
@@ -48,7 +57,7 @@ class GetForecastUseCase:
         self._cache = cache
 
     async def run(self, lat: float, lon: float, date: str = "", time: str = "") -> WeatherData:
-        key = f"forecast:{lat:.4f}:{lon:.4f}:{date}:{time}"
+        key = forecast_key(lat, lon, date, time)
         if self._cache:
             cached = await self._cache.get(key)
             if cached is not None:
@@ -60,14 +69,26 @@ class GetForecastUseCase:
 
 
 class RefreshForecastsUseCase:
-    def __init__(self, provider: WeatherProvider):
+    """Fetch current weather for coords and pre-warm the current and default forecast keys.
+
+    The gateway asks for an empty date as today's ISO date, so today's key is warmed too,
+    with the date-stamped `time` the provider would return for it.
+    """
+
+    def __init__(self, provider: WeatherProvider, cache: ForecastCache | None = None):
         self._provider = provider
+        self._cache = cache
 
     async def run(self, coords: list[tuple[float, float]]) -> int:
         count = 0
         for lat, lon in coords:
             try:
-                await self._provider.get_current_weather(lat, lon)
+                data = await self._provider.get_current_weather(lat, lon)
+                if self._cache:
+                    await self._cache.set(current_key(lat, lon), data)
+                    await self._cache.set(forecast_key(lat, lon), data)
+                    today = date_type.today().isoformat()
+                    await self._cache.set(forecast_key(lat, lon, today), replace(data, time=today))
                 count += 1
             except Exception:  # nosec B110 - skip failed coords, count successes
                 pass
@@ -1,12 +1,21 @@
 """Weather service settings (pydantic-settings)."""
 
-from pydantic_settings import BaseSettings, SettingsConfigDict
+from pydantic import Field
+from pydantic_settings import SettingsConfigDict
 
+from shared.grpc_server import GrpcServerSettings
 
-class Settings(BaseSettings):
+
+class Settings(GrpcServerSettings):
     model_config = SettingsConfigDict(env_prefix="WEATHER_", env_file=".env", extra="ignore")
 
     redis_url: str = "redis://localhost:6379/0"
     grpc_host: str = "0.0.0.0"  # nosec B104 - default for dev; override via env in prod
     grpc_port: int = 50051
     log_level: str = "INFO"
+    # Open-Meteo forecast endpoint (override to point at a mirror or a local stand-in)
+    open_meteo_url: str = "https://api.open-meteo.com/v1/forecast"
+    # Pre-fork: worker processes sharing grpc_port via SO_REUSEPORT (1 = single process)
+    workers: int = Field(default=1, ge=1)
+    # Prometheus /metrics port; 0 = disabled
+    metrics_port: int = 0
@@ -4,10 +4,42 @@ import json
 import logging
 
 import redis.asyncio as redis
+from opentelemetry import trace
+from opentelemetry.trace import SpanKind
 
+from shared.metrics import CACHE_REQUESTS
 from weather.application.use_cases.get_forecast import WeatherData
 
 logger = logging.getLogger(__name__)
+tracer = trace.get_tracer(__name__)
+
+_DB = {"db.system": "redis", "dresscast.cache": "weather_forecast"}
+_HITS = CACHE_REQUESTS.labels(cache="weather_forecast", result="hit")
+_MISSES = CACHE_REQUESTS.labels(cache="weather_forecast", result="miss")
+_ERRORS = CACHE_REQUESTS.labels(cache="weather_forecast", result="error")
+
+
+def _encode(data: WeatherData) -> str:
+    return json.dumps(
+        {
+            "temperature": data.temperature,
+            "humidity": data.humidity,
+            "wind_speed": data.wind_speed,
+            "precipitation": data.precipitation,
+            "time": data.time,
+        }
+    )
+
+
+def _decode(raw: str) -> WeatherData:
+    j = json.loads(raw)
+    return WeatherData(
+        temperature=j["temperature"],
+        humidity=j["humidity"],
+        wind_speed=j["wind_speed"],
+        precipitation=j["precipitation"],
+        time=j.get("time", ""),
+    )
 
 
 class RedisForecastCache:
@@ -24,32 +56,27 @@ class RedisForecastCache:
     async def get(self, key: str) -> WeatherData | None:
         try:
             client = await self._get_client()
-            raw = await client.get(key)
+            with tracer.start_as_current_span("redis GET", kind=SpanKind.CLIENT, attributes=_DB):
+                raw = await client.get(key)
             if raw is None:
+                _MISSES.inc()
                 return None
-            j = json.loads(raw)
-            return WeatherData(
-                temperature=j["temperature"],
-                humidity=j["humidity"],
-                wind_speed=j["wind_speed"],
-                precipitation=j["precipitation"],
-                time=j.get("time", ""),
-            )
+            data = _decode(raw)
         except Exception:
+            _ERRORS.inc()
             return None
+        _HITS.inc()
+        return data
 
     async def set(self, key: str, data: WeatherData, ttl_seconds: int | None = None) -> None:
         try:
             client = await self._get_client()
-            payload = json.dumps(
-                {
-                    "temperature": data.temperature,
-                    "humidity": data.humidity,
-                    "wind_speed": data.wind_speed,
-                    "precipitation": data.precipitation,
-                    "time": data.time,
-                }
-            )
-            await client.set(key, payload, ex=ttl_seconds or self._ttl)
+            payload = _encode(data)
+            with tracer.start_as_current_span("redis SET", kind=SpanKind.CLIENT, attributes=_DB):
+                await client.set(key, payload, ex=ttl_seconds or self._ttl)
         except Exception as e:
             logger.warning("Redis forecast cache set failed key=%s: %s", key, e)
+
+    async def aclose(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
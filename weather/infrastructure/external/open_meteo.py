@@ -3,29 +3,50 @@
 import logging
 
 import httpx
+from opentelemetry import trace
+from opentelemetry.trace import SpanKind
 
+from shared.metrics import UpstreamTimer
 from weather.application.use_cases.get_forecast import WeatherData, WeatherProvider
 
 logger = logging.getLogger(__name__)
+tracer = trace.get_tracer(__name__)
 
 
 class OpenMeteoProvider(WeatherProvider):
     BASE = "https://api.open-meteo.com/v1/forecast"
 
+    def __init__(self, base_url: str = BASE):
+        self._base_url = base_url
+        # One pooled client per process (created on first use, inside the serving loop)
+        self._client: httpx.AsyncClient | None = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        if self._client is None:
+            self._client = httpx.AsyncClient()
+        return self._client
+
+    async def aclose(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
     async def get_current_weather(self, lat: float, lon: float) -> WeatherData:
         logger.debug("Open-Meteo get_current_weather lat=%s lon=%s", lat, lon)
-        async with httpx.AsyncClient() as client:
+        client = self._get_client()
+        async with UpstreamTimer("open_meteo", "forecast"):
             try:
-                r = await client.get(
-                    self.BASE,
-                    params={
-                        "latitude": lat,
-                        "longitude": lon,
-                        "current": "temperature_2m,relative_humidity_2m,wind_speed_10m,precipitation",
-                    },
-                    timeout=10.0,
-                )
-                r.raise_for_status()
+                with tracer.start_as_current_span("open_meteo forecast", kind=SpanKind.CLIENT):
+                    r = await client.get(
+                        self._base_url,
+                        params={
+                            "latitude": lat,
+                            "longitude": lon,
+                            "current": "temperature_2m,relative_humidity_2m,wind_speed_10m,precipitation",
+                        },
+                        timeout=10.0,
+                    )
+                    r.raise_for_status()
             except httpx.HTTPStatusError as e:
                 logger.warning(
                     "Open-Meteo HTTP error lat=%s lon=%s status=%s",
@@ -12,8 +12,12 @@ if str(ROOT / "proto_gen") not in sys.path:
     sys.path.insert(0, str(ROOT / "proto_gen"))
 
 import weather_pb2_grpc
-from grpc import aio
 
+from shared.grpc_server import create_server, serve_until_signal
+from shared.logging_setup import setup_logging
+from shared.metrics import start_metrics_server
+from shared.prefork import run_workers
+from shared.tracing import setup_tracing
 from weather.api.servicer import WeatherServicer
 from weather.application.use_cases.get_forecast import (
     GetCurrentWeatherUseCase,
@@ -27,13 +31,11 @@ from weather.infrastructure.external.open_meteo import OpenMeteoProvider
 logger = logging.getLogger(__name__)
 
 
-def main() -> None:
-    settings = Settings()
-    logging.basicConfig(
-        level=getattr(logging, settings.log_level.upper(), logging.INFO),
-        format="%(asctime)s %(levelname)s [%(name)s] %(message)s",
-    )
-    provider = OpenMeteoProvider()
+def _serve(settings: Settings, worker: int = 0) -> None:
+    """Build the service and serve until SIGTERM/SIGINT (alone or as pre-fork worker `worker`)."""
+    setup_logging(settings.log_level, "weather")
+    setup_tracing("weather")
+    provider = OpenMeteoProvider(settings.open_meteo_url)
     try:
         cache = RedisForecastCache(settings.redis_url)
     except Exception:
@@ -41,21 +43,50 @@ def main() -> None:
         logger.warning("Redis unavailable, running without cache")
     get_current_uc = GetCurrentWeatherUseCase(provider, cache)
     get_forecast_uc = GetForecastUseCase(provider, cache)
-    refresh_uc = RefreshForecastsUseCase(provider)
+    refresh_uc = RefreshForecastsUseCase(provider, cache)
     servicer = WeatherServicer(get_current_uc, get_forecast_uc, refresh_uc)
+    # Pre-fork workers each export their own registry on metrics_port + worker
+    start_metrics_server(settings.metrics_port and settings.metrics_port + worker, "Weather")
 
     async def serve() -> None:
-        server = aio.server()
+        server = create_server(settings, reuse_port=settings.workers > 1)
         weather_pb2_grpc.add_WeatherServiceServicer_to_server(servicer, server)
         server.add_insecure_port(f"{settings.grpc_host}:{settings.grpc_port}")
         await server.start()
         logger.info(
-            "Weather gRPC server listening on %s:%s", settings.grpc_host, settings.grpc_port
+            "Weather gRPC server listening on %s:%s worker=%s",
+            settings.grpc_host,
+            settings.grpc_port,
+            worker,
         )
-        await server.wait_for_termination()
+        try:
+            await serve_until_signal(server, settings.grpc_server_shutdown_grace_seconds)
+        finally:
+            await provider.aclose()
+            if cache is not None:
+                await cache.aclose()
 
     asyncio.run(serve())
 
 
+def run_worker(index: int) -> None:
+    _serve(Settings(), index)
+
+
+def main() -> None:
+    settings = Settings()
+    if settings.workers > 1:
+        setup_logging(settings.log_level, "weather")
+        sys.exit(
+            run_workers(
+                "weather.main:run_worker",
+                settings.workers,
+                "weather",
+                settings.grpc_server_shutdown_grace_seconds,
+            )
+        )
+    _serve(settings)
+
+
 if __name__ == "__main__":
     main()
@@ -0,0 +1,105 @@
+"""CityAddedConsumer: Redis stream of new cities -> RefreshForecasts within seconds."""
+
+import asyncio
+import logging
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+if str(ROOT / "proto_gen") not in sys.path:
+    sys.path.insert(0, str(ROOT / "proto_gen"))
+
+import common_pb2
+import redis.asyncio as redis
+import weather_pb2
+
+from workers.scheduler.clients import RefreshClients
+from workers.scheduler.metrics import COORDINATES_REFRESHED
+
+logger = logging.getLogger(__name__)
+
+
+class CityAddedConsumer:
+    """Reads the Users city-added stream through a consumer group and pre-warms weather.
+
+    Entries are acked only after RefreshForecasts succeeds; anything left pending (failed
+    refresh, crash) is re-read from the consumer's own backlog on the next poll.
+    """
+
+    def __init__(
+        self,
+        client: redis.Redis,
+        clients: RefreshClients,
+        stream: str,
+        group: str,
+        consumer: str,
+        batch_size: int = 100,
+        block_ms: int = 5000,
+        retry_delay_seconds: float = 2.0,
+    ):
+        self._redis = client
+        self._clients = clients
+        self._stream = stream
+        self._group = group
+        self._consumer = consumer
+        self._batch_size = batch_size
+        self._block_ms = block_ms
+        self._retry_delay = retry_delay_seconds
+
+    async def ensure_group(self) -> None:
+        # "$": cities added before the group existed are covered by the periodic full refresh
+        try:
+            await self._redis.xgroup_create(self._stream, self._group, id="$", mkstream=True)
+        except redis.ResponseError as e:
+            if "BUSYGROUP" not in str(e):
+                raise
+
+    async def poll_once(self) -> int:
+        """Refresh one batch of new coordinates; returns the number of coordinates sent."""
+        entries = await self._read("0")
+        if not entries:
+            entries = await self._read(">", block=self._block_ms)
+        if not entries:
+            return 0
+        ids = []
+        unique: dict[tuple[float, float], None] = {}
+        for entry_id, fields in entries:
+            ids.append(entry_id)
+            try:
+                unique.setdefault((float(fields["lat"]), float(fields["lon"])))
+            except (KeyError, TypeError, ValueError):
+                logger.warning("Skipping malformed city event id=%s fields=%s", entry_id, fields)
+        if unique:
+            coords = [common_pb2.Coordinate(lat=lat, lon=lon) for lat, lon in unique]
+            weather = await self._clients.get_weather_stub()
+            resp = await weather.RefreshForecasts(
+                weather_pb2.RefreshForecastsRequest(coords=coords)
+            )
+            COORDINATES_REFRESHED.labels(source="city_event", result="sent").inc(len(coords))
+            COORDINATES_REFRESHED.labels(source="city_event", result="refreshed").inc(
+                resp.refreshed_count
+            )
+        await self._redis.xack(self._stream, self._group, *ids)
+        logger.info("Pre-warmed weather for new cities events=%s coords=%s", len(ids), len(unique))
+        return len(unique)
+
+    async def _read(self, last_id: str, block: int | None = None) -> list:
+        resp = await self._redis.xreadgroup(
+            self._group,
+            self._consumer,
+            {self._stream: last_id},
+            count=self._batch_size,
+            block=block,
+        )
+        return resp[0][1] if resp else []
+
+    async def run(self) -> None:
+        await self.ensure_group()
+        while True:
+            try:
+                await self.poll_once()
+            except Exception as e:
+                logger.exception("City events poll failed: %s", e)
+                await asyncio.sleep(self._retry_delay)
@@ -14,6 +14,8 @@ import users_pb2_grpc
 import weather_pb2_grpc
 from grpc import aio
 
+from shared.tracing import client_interceptors
+
 logger = logging.getLogger(__name__)
 
 
@@ -27,11 +29,15 @@ class RefreshClients:
     async def get_users_stub(self) -> users_pb2_grpc.UsersServiceStub:
         if self._users_channel is None:
             logger.debug("Scheduler Users channel created addr=%s", self._users_addr)
-            self._users_channel = aio.insecure_channel(self._users_addr)
+            self._users_channel = aio.insecure_channel(
+                self._users_addr, interceptors=client_interceptors() or None
+            )
         return users_pb2_grpc.UsersServiceStub(self._users_channel)
 
     async def get_weather_stub(self) -> weather_pb2_grpc.WeatherServiceStub:
         if self._weather_channel is None:
             logger.debug("Scheduler Weather channel created addr=%s", self._weather_addr)
-            self._weather_channel = aio.insecure_channel(self._weather_addr)
+            self._weather_channel = aio.insecure_channel(
+                self._weather_addr, interceptors=client_interceptors() or None
+            )
         return weather_pb2_grpc.WeatherServiceStub(self._weather_channel)
@@ -12,4 +12,16 @@ class SchedulerConfig(BaseSettings):
     startup_delay_seconds: float = 15.0
     max_retries: int = 3
     retry_backoff_seconds: float = 2.0
+    # Cities per ListAllCoordinates page (keyset by city id); 0 = one unpaged call
+    coordinates_page_size: int = 1000
+    # Users city-added stream; new cities are pre-warmed within seconds. Empty = disabled
+    city_events_redis_url: str = ""
+    city_events_stream: str = "dresscast:cities:added"
+    city_events_group: str = "scheduler"
+    # Consumer name within the group; defaults to the hostname
+    city_events_consumer: str = ""
+    city_events_batch_size: int = 100
+    city_events_block_ms: int = 5000
     log_level: str = "INFO"
+    # Prometheus /metrics port; 0 = disabled
+    metrics_port: int = 0
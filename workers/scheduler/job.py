@@ -14,17 +14,38 @@ import users_pb2
 import weather_pb2
 
 from workers.scheduler.clients import RefreshClients
+from workers.scheduler.metrics import COORDINATES_REFRESHED, TICK_COORDINATES
 
 
 class RefreshForecastsJob:
-    def __init__(self, clients: RefreshClients):
+    def __init__(self, clients: RefreshClients, page_size: int = 0):
         self._clients = clients
+        self._page_size = page_size
 
     async def run(self) -> None:
         users = await self._clients.get_users_stub()
         weather = await self._clients.get_weather_stub()
-        resp = await users.ListAllCoordinates(users_pb2.ListAllCoordinatesRequest())
-        if not resp.coords:
+        unique = await self._list_coordinates(users)
+        TICK_COORDINATES.set(len(unique))
+        if not unique:
             return
-        coords = [common_pb2.Coordinate(lat=c.lat, lon=c.lon) for c in resp.coords]
-        await weather.RefreshForecasts(weather_pb2.RefreshForecastsRequest(coords=coords))
+        coords = [common_pb2.Coordinate(lat=lat, lon=lon) for lat, lon in unique]
+        resp = await weather.RefreshForecasts(weather_pb2.RefreshForecastsRequest(coords=coords))
+        COORDINATES_REFRESHED.labels(source="scheduled", result="sent").inc(len(coords))
+        COORDINATES_REFRESHED.labels(source="scheduled", result="refreshed").inc(
+            resp.refreshed_count
+        )
+
+    async def _list_coordinates(self, users) -> list[tuple[float, float]]:
+        """Unique (lat, lon) pairs of all cities; paged by city id when page_size > 0."""
+        unique: dict[tuple[float, float], None] = {}
+        after_id = 0
+        while True:
+            resp = await users.ListAllCoordinates(
+                users_pb2.ListAllCoordinatesRequest(after_id=after_id, limit=self._page_size)
+            )
+            for c in resp.coords:
+                unique.setdefault((c.lat, c.lon))
+            if self._page_size <= 0 or not resp.next_after_id:
+                return list(unique)
+            after_id = resp.next_after_id
@@ -2,8 +2,10 @@
 
 import asyncio
 import logging
+import time
 
 from workers.scheduler.job import RefreshForecastsJob
+from workers.scheduler.metrics import TICK_DURATION
 from workers.scheduler.retry import RetryPolicy
 
 logger = logging.getLogger(__name__)
@@ -27,8 +29,12 @@ class ForecastRefreshScheduler:
             logger.info("Scheduler waiting %.0fs for backends to start", self._startup_delay)
             await asyncio.sleep(self._startup_delay)
         while True:
+            started = time.perf_counter()
+            outcome = "ok"
             try:
                 await self._retry.execute_with_retry(self._job.run)
             except Exception as e:
+                outcome = "failed"
                 logger.exception("Scheduler run failed: %s", e)
+            TICK_DURATION.labels(outcome=outcome).observe(time.perf_counter() - started)
             await asyncio.sleep(self._interval)
@@ -1,7 +1,7 @@
 """Scheduler worker entry point (composition root)."""
 
 import asyncio
-import logging
+import socket
 import sys
 from pathlib import Path
 
@@ -11,6 +11,12 @@ if str(ROOT) not in sys.path:
 if str(ROOT / "proto_gen") not in sys.path:
     sys.path.insert(0, str(ROOT / "proto_gen"))
 
+import redis.asyncio as redis
+
+from shared.logging_setup import setup_logging
+from shared.metrics import start_metrics_server
+from shared.tracing import setup_tracing
+from workers.scheduler.city_events import CityAddedConsumer
 from workers.scheduler.clients import RefreshClients
 from workers.scheduler.config import SchedulerConfig
 from workers.scheduler.job import RefreshForecastsJob
@@ -20,17 +26,33 @@ from workers.scheduler.retry import RetryPolicy
 
 def main() -> None:
     config = SchedulerConfig()
-    logging.basicConfig(
-        level=getattr(logging, config.log_level.upper(), logging.INFO),
-        format="%(asctime)s %(levelname)s [%(name)s] %(message)s",
-    )
+    setup_logging(config.log_level, "scheduler")
+    setup_tracing("scheduler")
     clients = RefreshClients(config.users_grpc_addr, config.weather_grpc_addr)
-    job = RefreshForecastsJob(clients)
+    job = RefreshForecastsJob(clients, page_size=config.coordinates_page_size)
     retry_policy = RetryPolicy(config.max_retries, config.retry_backoff_seconds)
     scheduler = ForecastRefreshScheduler(
         job, retry_policy, config.interval_seconds, config.startup_delay_seconds
     )
-    asyncio.run(scheduler.run())
+    start_metrics_server(config.metrics_port, "Scheduler")
+    if not config.city_events_redis_url:
+        asyncio.run(scheduler.run())
+        return
+    consumer = CityAddedConsumer(
+        redis.from_url(config.city_events_redis_url, decode_responses=True),
+        clients,
+        config.city_events_stream,
+        config.city_events_group,
+        config.city_events_consumer or socket.gethostname(),
+        batch_size=config.city_events_batch_size,
+        block_ms=config.city_events_block_ms,
+        retry_delay_seconds=config.retry_backoff_seconds,
+    )
+
+    async def run_all() -> None:
+        await asyncio.gather(scheduler.run(), consumer.run())
+
+    asyncio.run(run_all())
 
 
 if __name__ == "__main__":
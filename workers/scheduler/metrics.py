@@ -0,0 +1,19 @@
+"""Prometheus metrics for the scheduler worker."""
+
+from prometheus_client import Counter, Gauge, Histogram
+
+TICK_DURATION = Histogram(
+    "dresscast_scheduler_tick_seconds",
+    "Duration of one full refresh tick, retries included, by outcome (ok, failed)",
+    ["outcome"],
+    buckets=(0.1, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0, 600.0),
+)
+TICK_COORDINATES = Gauge(
+    "dresscast_scheduler_tick_coordinates",
+    "Unique coordinates sent to RefreshForecasts by the last tick",
+)
+COORDINATES_REFRESHED = Counter(
+    "dresscast_scheduler_coordinates_total",
+    "Coordinates sent to RefreshForecasts and forecasts reported refreshed, by source",
+    ["source", "result"],
+)